@@ -1,8 +1,10 @@
+import asyncio
 import logging
+import os
 import sys
+import time
 from contextlib import asynccontextmanager
 from fastapi import Depends, FastAPI
-from transformers import logging as hf_logging
 from routers.embeddings import router as embeddings_router
 from routers.scoring import router as scoring_router
 from routers.health import router as health_router
@@ -11,7 +13,13 @@ from routers.matching import router as matching_router
 from routers.metrics import router as metrics_router
 from routers.shared.auth import verify_internal_service_key
 from dotenv import load_dotenv
+from metrics.encoder_metrics import record_startup
+from metrics.event_loop_metrics import monitor_event_loop_lag
 from metrics.prometheus_metrics import model_loaded as model_loaded_prometheus_metric
+from models.embeddings import embedding_model
+from models.migration import migration_model
+from models.warmup import reset_readiness, run_warmup
+from utils.embedding_utils import closed_vocabulary
 
 load_dotenv(".env.dev")  # load before anything else imports config
 
@@ -22,7 +30,9 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     handlers=[logging.StreamHandler(sys.stderr)],
 )
-hf_logging.set_verbosity_error()
+# transformers is imported lazily (models/embeddings.py) — set its verbosity
+# through the env var it reads on import instead of importing it here.
+os.environ.setdefault("TRANSFORMERS_VERBOSITY", "error")
 logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
@@ -42,20 +52,54 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("[FASTAPI] Starting up - loading embedding model")
-    try:
-        logger.info("[FASTAPI] Model loaded and warm - ready to serve")
-        model_loaded_prometheus_metric.set(1)
-    except Exception:
-        logger.exception("[FASTAPI] Model failed to load")
-        model_loaded_prometheus_metric.set(0)
-        raise
+
+    # Model load and warm-up run off the event loop, so /health/live and the
+    # routes that never touch the model (salary, matching, metrics) answer
+    # right away; /health/ready flips to 200 only once both have finished.
+    warmup_task = asyncio.create_task(_warm_up())
+    # Proves the loop stays responsive while handlers run on the worker
+    # pools (routers/shared/worker_pools.py).
+    lag_task = asyncio.create_task(monitor_event_loop_lag())
 
     yield
 
     logger.info("[FASTAPI] Shutting down")
+    warmup_task.cancel()
+    lag_task.cancel()
+    reset_readiness()
     model_loaded_prometheus_metric.set(0)  # accurate on graceful shutdown too
 
 
+async def _warm_up() -> None:
+    try:
+        # No-op if serve.py's parent already loaded the weights pre-fork.
+        await asyncio.to_thread(embedding_model.load)
+        # During a model migration every embedding route encodes twice.
+        target = migration_model()
+        if target is not None:
+            await asyncio.to_thread(target.load)
+        started = time.perf_counter()
+        # Closed-vocabulary rows (seniority, frequency) are embedded once here.
+        await asyncio.to_thread(closed_vocabulary.build)
+        await asyncio.to_thread(run_warmup, embedding_model)
+        warmup_seconds = time.perf_counter() - started
+    except Exception:
+        logger.exception("[FASTAPI] Model load / warm-up failed - staying not ready")
+        model_loaded_prometheus_metric.set(0)
+        return
+
+    # Under serve.py the load phases are the parent's, inherited at fork.
+    phases = {**embedding_model.load_phases, "warmup": warmup_seconds}
+    record_startup(phases)
+    logger.info(
+        "[FASTAPI] Startup breakdown: "
+        + ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in phases.items())
+        + f" (total {sum(phases.values()):.2f}s)"
+    )
+    logger.info("[FASTAPI] Model loaded and warm - ready to serve")
+    model_loaded_prometheus_metric.set(1)
+
+
 # ── App instance ───────────────────────────────────────────────────────────────
 # FastAPI() is like express() in Node.
 # lifespan= wires up our startup/shutdown handler above.
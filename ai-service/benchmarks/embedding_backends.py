@@ -0,0 +1,98 @@
+"""
+Embedding backend parity + throughput check.
+
+Loads the model once per backend, encodes the embedding fixture texts
+(fixtures/embedding_fixtures.py), and reports:
+
+    - cosine drift of each backend's rows against the torch reference
+      (mean / min cosine, max absolute element difference)
+    - load time and encode throughput (texts/sec) over repeated passes
+
+Run before flipping EMBEDDING_BACKEND in any environment:
+
+    python -m benchmarks.embedding_backends
+    python -m benchmarks.embedding_backends --backends torch onnx-int8 --repeat 50
+
+The ONNX backends need `pip install "sentence-transformers[onnx]"`.
+Rows of --min-cosine or lower make the script exit non-zero, so it can gate CI.
+"""
+
+import argparse
+import sys
+import time
+
+import torch
+import torch.nn.functional as F
+
+from fixtures.embedding_fixtures import PARITY_TEXTS
+from models.backends import BACKENDS, load_sentence_transformer, resolve_backend
+
+
+def _encode(model, texts: list[str]) -> torch.Tensor:
+    return model.encode(
+        texts,
+        batch_size=32,
+        convert_to_tensor=True,
+        show_progress_bar=False,
+        normalize_embeddings=True,
+    ).cpu()
+
+
+def _benchmark(model_name: str, backend: str, texts: list[str], repeat: int) -> dict:
+    t0 = time.perf_counter()
+    model = load_sentence_transformer(model_name, resolve_backend(backend))
+    load_s = time.perf_counter() - t0
+
+    _encode(model, texts)  # warm-up: graph init, allocator, tokenizer caches
+
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        rows = _encode(model, texts)
+    elapsed = time.perf_counter() - t0
+
+    return {
+        "backend": backend,
+        "rows": rows,
+        "load_s": load_s,
+        "texts_per_s": len(texts) * repeat / elapsed,
+    }
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.embedding_backends")
+    parser.add_argument("--model", default="all-mpnet-base-v2")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS))
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--min-cosine", type=float, default=0.99)
+    args = parser.parse_args(argv)
+
+    backends = ["torch", *[b for b in args.backends if b != "torch"]]
+    results = [_benchmark(args.model, b, PARITY_TEXTS, args.repeat) for b in backends]
+    reference = results[0]
+
+    print(f"\nmodel={args.model}  texts={len(PARITY_TEXTS)}  repeat={args.repeat}\n")
+    print(
+        f"{'backend':<10} {'load s':>8} {'texts/s':>10} {'speedup':>8} "
+        f"{'mean cos':>9} {'min cos':>9} {'max |Δ|':>9}"
+    )
+
+    failed = False
+    for r in results:
+        cos = F.cosine_similarity(r["rows"], reference["rows"], dim=1)
+        max_abs = (r["rows"] - reference["rows"]).abs().max().item()
+        speedup = r["texts_per_s"] / reference["texts_per_s"]
+        failed |= cos.min().item() < args.min_cosine
+
+        print(
+            f"{r['backend']:<10} {r['load_s']:>8.2f} {r['texts_per_s']:>10.1f} "
+            f"{speedup:>7.2f}x {cos.mean().item():>9.5f} {cos.min().item():>9.5f} "
+            f"{max_abs:>9.5f}"
+        )
+
+    if failed:
+        print(f"\nFAIL: at least one backend drifted below cosine {args.min_cosine}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
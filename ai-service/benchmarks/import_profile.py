@@ -0,0 +1,110 @@
+"""
+Cold-start import profile per entry point.
+
+For every target, starts fresh interpreters with `python -X importtime`,
+runs the target's statement and reports:
+
+    - wall ms   — median time to run the statement in a cold interpreter
+    - modules   — how many modules it imported
+    - heavy     — which of torch / transformers / sentence_transformers it
+                  pulled in (salary, matching and the CLI should pull none)
+    - the top modules by cumulative import time, from -X importtime
+
+Targets:
+    app       import app                                 (uvicorn / serve.py)
+    salary    import handlers.salary_handler             (/compute/predict_salary)
+    matching  import handlers.matching_handler           (/compute/score_matches)
+    cli       import main                                (v1 CLI commands)
+    model     import app + embedding_model.load()        (where the cost went)
+
+    python -m benchmarks.import_profile
+    python -m benchmarks.import_profile --targets app salary --runs 5 --top 15
+
+Every run is a new process, so nothing is warm except the OS page cache.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SERVICE_DIR = Path(__file__).resolve().parent.parent
+
+TARGETS: dict[str, str] = {
+    "app": "import app",
+    "salary": "import handlers.salary_handler",
+    "matching": "import handlers.matching_handler",
+    "cli": "import main",
+    "model": "import app; from models.embeddings import embedding_model; embedding_model.load()",
+}
+HEAVY = ("torch", "transformers", "sentence_transformers")
+
+# Child side: time the statement, then report which heavy packages it loaded.
+_PROBE = """
+import sys, time
+t0 = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - t0
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(f"{{elapsed:.6f}} {{len(sys.modules)}} {{','.join(heavy) or '-'}}")
+"""
+
+
+def _run(statement: str) -> tuple[float, int, str, dict[str, int]]:
+    """One cold run → (wall seconds, module count, heavy modules, cumulative µs per module)."""
+    env = {**os.environ, "HF_HUB_OFFLINE": os.environ.get("HF_HUB_OFFLINE", "1")}
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            _PROBE.format(statement=statement, heavy=HEAVY),
+        ],
+        cwd=SERVICE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed, modules, heavy = proc.stdout.strip().splitlines()[-1].split()
+
+    cumulative: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+
+    return float(elapsed), int(modules), heavy, cumulative
+
+
+def _profile(name: str, runs: int, top: int) -> None:
+    results = [_run(TARGETS[name]) for _ in range(runs)]
+    wall_ms = statistics.median(r[0] for r in results) * 1000
+    _, modules, heavy, cumulative = results[-1]
+
+    print(f"\n{name:<9} {wall_ms:>9.0f} ms   {modules:>5} modules   heavy: {heavy}")
+    print(f"  {TARGETS[name]}")
+    for module, us in sorted(cumulative.items(), key=lambda kv: -kv[1])[:top]:
+        print(f"  {us / 1000:>9.1f} ms  {module}")
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.import_profile")
+    parser.add_argument(
+        "--targets", nargs="+", choices=list(TARGETS), default=list(TARGETS)
+    )
+    parser.add_argument("--runs", type=int, default=3, help="cold runs per target")
+    parser.add_argument("--top", type=int, default=10, help="modules listed per target")
+    args = parser.parse_args(argv)
+
+    for name in args.targets:
+        _profile(name, args.runs, args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
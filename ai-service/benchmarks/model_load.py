@@ -0,0 +1,97 @@
+"""
+Model load benchmark: memory-mapped vs stock safetensors loading.
+
+For each loader, starts fresh interpreters that load the model through
+models/backends.py (EMBEDDING_MMAP_WEIGHTS=true / false), encode one batch,
+and report:
+
+    - import / weights / tokenizer   — the load phases load() records
+    - first encode                   — includes faulting mapped pages in
+    - RSS / anonymous MB             — after the first encode. Mapped
+                                       weights show up in RSS as file-backed
+                                       pages, not as anonymous memory, so
+                                       pre-forked workers share them
+
+    python -m benchmarks.model_load
+    python -m benchmarks.model_load --model /path/to/snapshot --runs 5
+
+Only the OS page cache is warm between runs. To measure a truly cold disk,
+drop caches first (echo 3 > /proc/sys/vm/drop_caches, as root).
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SERVICE_DIR = Path(__file__).resolve().parent.parent
+LOADERS = {"mmap": "true", "stock": "false"}
+
+# Child side: load, encode once, report phases and memory as JSON.
+_PROBE = """
+import json, time
+from pathlib import Path
+from models.backends import load_sentence_transformer
+
+phases = {{}}
+model = load_sentence_transformer({model!r}, "torch", phases)
+t0 = time.perf_counter()
+model.encode(["warm the weights"] * 8)
+phases["first encode"] = time.perf_counter() - t0
+
+memory = {{}}
+for line in Path("/proc/self/smaps_rollup").read_text().splitlines()[1:]:
+    key, value = line.split(":", 1)
+    memory[key] = int(value.split()[0]) / 1024
+print(json.dumps({{**phases, "rss": memory["Rss"], "anon": memory["Anonymous"]}}))
+"""
+
+
+def _run(model: str, mmap: str) -> dict[str, float]:
+    env = {
+        **os.environ,
+        "EMBEDDING_MMAP_WEIGHTS": mmap,
+        "HF_HUB_OFFLINE": os.environ.get("HF_HUB_OFFLINE", "1"),
+    }
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(model=model)],
+        cwd=SERVICE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.model_load")
+    parser.add_argument("--model", default="all-mpnet-base-v2")
+    parser.add_argument("--runs", type=int, default=3, help="cold runs per loader")
+    args = parser.parse_args(argv)
+
+    columns = ["import", "weights", "tokenizer", "first encode"]
+    print(
+        f"{'loader':<7}"
+        + "".join(f"{c:>14}" for c in columns)
+        + f"{'RSS MB':>10}{'anon MB':>10}"
+    )
+    for loader, mmap in LOADERS.items():
+        results = [_run(args.model, mmap) for _ in range(args.runs)]
+
+        def median(key: str) -> float:
+            return statistics.median(r[key] for r in results)
+
+        print(
+            f"{loader:<7}"
+            + "".join(f"{median(c) * 1000:>11.0f} ms" for c in columns)
+            + f"{median('rss'):>10.0f}{median('anon'):>10.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
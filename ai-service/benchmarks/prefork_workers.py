@@ -0,0 +1,193 @@
+"""
+Pre-fork vs spawn worker memory + throughput benchmark.
+
+For every worker count 1..N, starts the service (serve.py for "prefork",
+`uvicorn app:app --workers N` for "uvicorn"), drives it with concurrent
+embedding requests for a fixed duration, then reads /proc for every process
+in the tree and reports:
+
+    - req/s across all workers
+    - RSS per worker     — counts shared pages in full, so it looks the same
+                           in both modes; not the number to size hosts by
+    - PSS per worker     — shared pages split across the processes mapping
+                           them; this is what copy-on-write sharing shrinks
+    - USS per worker     — pages only that worker holds (its private cost)
+    - total PSS          — parent + workers, i.e. what the host really pays
+
+Memory is sampled after the load phase, so pages workers dirtied while
+serving (allocator arenas, refcount writes) are already counted.
+
+    python -m benchmarks.prefork_workers --max-workers 4
+    python -m benchmarks.prefork_workers --modes prefork --duration 60
+
+Linux only (reads /proc). Every request embeds a unique string, so the
+text cache and on-disk store never answer for the model.
+"""
+
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import httpx
+
+SERVICE_DIR = Path(__file__).resolve().parent.parent
+SECRET = "prefork-benchmark"
+ENDPOINT = "/compute/generate_skill_embeddings"
+
+
+def _command(mode: str, workers: int) -> list[str]:
+    if mode == "prefork":
+        return [sys.executable, "serve.py", "--workers", str(workers)]
+    return [sys.executable, "-m", "uvicorn", "app:app", "--workers", str(workers)]
+
+
+def _start(mode: str, workers: int, port: int) -> subprocess.Popen:
+    cmd = _command(mode, workers) + ["--host", "127.0.0.1", "--port", str(port)]
+    env = {**os.environ, "AI_SERVICE_SHARED_SECRET": SECRET}
+    env.pop("EMBEDDING_STORE_DIR", None)
+    return subprocess.Popen(
+        cmd,
+        cwd=SERVICE_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def _wait_healthy(base_url: str, proc: subprocess.Popen, timeout_s: float) -> None:
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"server exited with {proc.returncode} during startup")
+        try:
+            if httpx.get(f"{base_url}/health/ready", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"server not healthy after {timeout_s:.0f}s")
+
+
+def _load(base_url: str, clients: int, duration_s: float) -> float:
+    """Run `clients` closed-loop clients for duration_s; return successful req/s."""
+    done = [0] * clients
+    stop_at = time.monotonic() + duration_s
+
+    def _client(slot: int) -> None:
+        headers = {"X-Internal-Service-Key": SECRET}
+        with httpx.Client(base_url=base_url, headers=headers, timeout=60) as client:
+            i = 0
+            while time.monotonic() < stop_at:
+                body = {"_id": f"{slot}-{i}", "name": f"benchmark skill {slot} {i}"}
+                if client.post(ENDPOINT, json=body).status_code == 200:
+                    done[slot] += 1
+                i += 1
+
+    threads = [threading.Thread(target=_client, args=(s,)) for s in range(clients)]
+    t0 = time.monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return sum(done) / (time.monotonic() - t0)
+
+
+def _descendants(pid: int) -> list[int]:
+    found = []
+    for task in Path(f"/proc/{pid}/task").iterdir():
+        children = (task / "children").read_text().split()
+        for child in map(int, children):
+            found.append(child)
+            found.extend(_descendants(child))
+    return found
+
+
+def _memory_kb(pid: int) -> dict[str, int]:
+    fields = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:]:
+        name, value = line.split(":", 1)
+        fields[name] = int(value.split()[0])
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "uss": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def _measure(mode: str, workers: int, args: argparse.Namespace) -> dict:
+    base_url = f"http://127.0.0.1:{args.port}"
+    proc = _start(mode, workers, args.port)
+    try:
+        _wait_healthy(base_url, proc, args.startup_timeout)
+        _load(base_url, workers, 2)  # warm-up: first-request allocations
+        rps = _load(base_url, workers * args.clients_per_worker, args.duration)
+
+        tree = [proc.pid, *_descendants(proc.pid)]
+        memory = {pid: _memory_kb(pid) for pid in tree}
+        # Workers are the processes that loaded torch's big arenas; helpers
+        # (uvicorn's supervisor, multiprocessing trackers) stay small.
+        worker_pids = sorted(tree, key=lambda p: memory[p]["uss"])[-workers:]
+
+        def per_worker(key: str) -> float:
+            return sum(memory[p][key] for p in worker_pids) / workers / 1024
+
+        return {
+            "mode": mode,
+            "workers": workers,
+            "rps": rps,
+            "rss": per_worker("rss"),
+            "pss": per_worker("pss"),
+            "uss": per_worker("uss"),
+            "total_pss": sum(m["pss"] for m in memory.values()) / 1024,
+        }
+    finally:
+        os.killpg(proc.pid, signal.SIGTERM)
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            os.killpg(proc.pid, signal.SIGKILL)
+            proc.wait()
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.prefork_workers")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=["prefork", "uvicorn"],
+        default=["prefork", "uvicorn"],
+    )
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds per run")
+    parser.add_argument("--clients-per-worker", type=int, default=4)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--startup-timeout", type=float, default=300.0)
+    args = parser.parse_args(argv)
+
+    results = [
+        _measure(mode, workers, args)
+        for mode in args.modes
+        for workers in range(1, args.max_workers + 1)
+    ]
+
+    print(f"\nendpoint={ENDPOINT}  duration={args.duration:.0f}s per run\n")
+    print(
+        f"{'mode':<8} {'workers':>7} {'req/s':>8} {'RSS/w MB':>9} "
+        f"{'PSS/w MB':>9} {'USS/w MB':>9} {'total PSS MB':>13}"
+    )
+    for r in results:
+        print(
+            f"{r['mode']:<8} {r['workers']:>7} {r['rps']:>8.1f} {r['rss']:>9.0f} "
+            f"{r['pss']:>9.0f} {r['uss']:>9.0f} {r['total_pss']:>13.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
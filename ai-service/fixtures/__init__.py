@@ -0,0 +1 @@
+"""Shared pytest fixtures (registered via pytest_plugins in tests/conftest.py)."""
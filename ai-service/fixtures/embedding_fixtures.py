@@ -1,6 +1,23 @@
 import pytest
 import torch
 
+# Plain-data texts behind the fixtures below — also the input set for
+# benchmarks/embedding_backends.py (backend parity + throughput).
+SKILL_NAMES = [
+    "JavaScript",
+    "TypeScript",
+    "React",
+    "Node.js",
+    "PostgreSQL",
+    "Docker",
+    "AWS",
+    "PyTorch",
+]
+JOB_TITLE = "Full Stack Engineer"
+LOCATION_NAME = "San Francisco, CA"
+
+PARITY_TEXTS = [*SKILL_NAMES, JOB_TITLE, LOCATION_NAME]
+
 
 @pytest.fixture
 def make_embedding():
@@ -16,19 +33,9 @@ def make_embedding():
 @pytest.fixture
 def skill_docs_with_embeddings(make_embedding):
     """Pre-fetched skill docs — all have embeddings (cache hit path)."""
-    skills = [
-        "JavaScript",
-        "TypeScript",
-        "React",
-        "Node.js",
-        "PostgreSQL",
-        "Docker",
-        "AWS",
-        "PyTorch",
-    ]
     return [
         {"_id": f"skill_{i}", "name": name, "embedding": make_embedding(i).tolist()}
-        for i, name in enumerate(skills)
+        for i, name in enumerate(SKILL_NAMES)
     ]
 
 
@@ -46,20 +53,20 @@ def skill_docs_null_embeddings():
 def job_title_doc_with_embedding(make_embedding):
     return {
         "_id": "jt_001",
-        "title": "Full Stack Engineer",
+        "title": JOB_TITLE,
         "embedding": make_embedding(10).tolist(),
     }
 
 
 @pytest.fixture
 def job_title_doc_null_embedding():
-    return {"_id": "jt_001", "title": "Full Stack Engineer", "embedding": None}
+    return {"_id": "jt_001", "title": JOB_TITLE, "embedding": None}
 
 
 @pytest.fixture
 def location_doc_with_embedding(make_embedding):
     return {
         "_id": "loc_001",
-        "name": "San Francisco, CA",
+        "name": LOCATION_NAME,
         "embedding": make_embedding(20).tolist(),
     }
@@ -10,14 +10,17 @@ Free-tier notes (verify current numbers in Google AI Studio — they change ofte
 No credit card required, but Google may use free-tier prompts for training —
 don't send anything a user wouldn't want retained (resume PII is a gray area;
 consider stripping name/contact info before it reaches the prompt).
+
+google-genai is imported on the first call, not at module level — it adds
+~0.5 s to every import of app.py, and most processes never call Gemini.
 """
 
+from __future__ import annotations
+
 import os
 import logging
 import time
-from typing import AsyncIterator
-from google import genai
-from google.genai import errors as genai_errors
+from typing import TYPE_CHECKING, AsyncIterator
 from metrics.gemini_metrics import (
     record_generate_duration,
     record_generate_request,
@@ -25,6 +28,9 @@ from metrics.gemini_metrics import (
     record_model_fallback,
 )
 
+if TYPE_CHECKING:
+    from google import genai
+
 logger = logging.getLogger(__name__)
 
 GEMINI_MODEL = os.environ.get("GEMINI_MODEL", "gemini-2.5-flash")
@@ -39,6 +45,8 @@ def _get_client() -> genai.Client:
         api_key = os.environ.get("GEMINI_API_KEY")
         if not api_key:
             raise RuntimeError("GEMINI_API_KEY is not set")
+        from google import genai
+
         _client = genai.Client(api_key=api_key)
     return _client
 
@@ -66,6 +74,7 @@ def generate(
     usage_metadata), request outcome, and 429 fallback events to Prometheus.
     """
     client = _get_client()
+    from google.genai import errors as genai_errors
 
     config = {
         "temperature": temperature,
@@ -136,6 +145,7 @@ async def generate_stream(
     errors propagate to the caller, which decides how to recover.
     """
     client = _get_client()
+    from google.genai import errors as genai_errors
 
     config = {
         "temperature": temperature,
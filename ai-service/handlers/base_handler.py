@@ -2,6 +2,9 @@ import logging
 import functools
 from typing import Callable
 
+from infrastructure.jobs.parallelization.executor import PipelineSaturated
+from models.deadline import DeadlineExceeded
+
 logger = logging.getLogger(__name__)
 
 REGISTRY: dict[str, Callable] = {}
@@ -29,6 +32,11 @@ def safe_call(fn: Callable, *args, label: str = "", **kwargs) -> dict:
     """
     try:
         return fn(*args, **kwargs)
+    except (DeadlineExceeded, PipelineSaturated) as e:
+        # Expected under overload — the caller has given up, or the shared
+        # pipeline executor had no room for its sections.
+        logger.warning(f"[{label or fn.__name__}] {e}")
+        return {"error": str(e)}
     except Exception as e:
         tag = label or fn.__name__
         logger.error(f"[{tag}] {e}", exc_info=True)
@@ -1,6 +1,12 @@
 from handlers.base_handler import register, safe_call
+from infrastructure.embeddings.doc_pool import DocPool
+from models.migration import active_model, dual_encode
+from models.priority import Priority, encode_priority
 from services.job_service import JobService
-from serializers.job_serializers import serialize_job_embeddings
+from serializers.job_serializers import (
+    serialize_job_embeddings,
+    serialize_job_embeddings_batch,
+)
 
 
 @register("generate_job_posting_embeddings")
@@ -9,11 +15,39 @@ def generate_job_posting_embeddings(
     skill_docs: list[dict],
     job_title_doc: dict | None,
     location_doc: dict | None,
+    previous_fingerprints: dict | None = None,
 ) -> dict:
     def _run():
         emb = JobService.extract_embeddings(
-            job_body, skill_docs, job_title_doc, location_doc
+            job_body, skill_docs, job_title_doc, location_doc, previous_fingerprints
+        )
+        return serialize_job_embeddings(
+            job_body.get("_id"), emb, active_model().model_version
+        )
+
+    return safe_call(dual_encode, _run, label="generate_job_posting_embeddings")
+
+
+@register("generate_job_posting_embeddings_batch")
+def generate_job_posting_embeddings_batch(
+    job_bodies: list[dict],
+    skill_docs: list[dict],
+    job_title_docs: list[dict],
+    location_docs: list[dict],
+    previous_fingerprints: dict | None = None,
+) -> dict:
+    def _run():
+        if not isinstance(job_bodies, list) or not all(
+            isinstance(d, dict) for d in job_bodies
+        ):
+            raise ValueError("jobs must be a list of objects")
+        pool = DocPool(skill_docs, job_title_docs, location_docs)
+        with encode_priority(Priority.BULK):
+            outcomes = JobService.extract_embeddings_batch(
+                job_bodies, pool, previous_fingerprints
+            )
+        return serialize_job_embeddings_batch(
+            job_bodies, outcomes, active_model().model_version
         )
-        return serialize_job_embeddings(job_body.get("_id"), emb)
 
-    return safe_call(_run, label="generate_job_posting_embeddings")
+    return safe_call(dual_encode, _run, label="generate_job_posting_embeddings_batch")
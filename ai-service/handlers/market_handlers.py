@@ -1,5 +1,12 @@
 from handlers.base_handler import register, safe_call
 from infrastructure.embeddings.embed_text import embed_text
+from models.migration import active_model, dual_encode
+from models.priority import Priority
+from utils.tensor_utils import MODEL_VERSION_KEY, NORMALIZED_FLAG
+
+# Market entity embeddings are regenerated in bulk by Node jobs — nobody is
+# waiting on a single one, so they ride the bulk lane and yield the model to
+# interactive resume / job calls.
 
 
 @register("generate_skill_embeddings")
@@ -8,9 +15,14 @@ def generate_skill_embeddings(payload: dict) -> dict:
         name = payload.get("name")
         if not name:
             raise ValueError("payload.name is required for skill embedding generation")
-        return {"skill_id": payload.get("_id"), "embedding": embed_text(name)}
+        return {
+            "skill_id": payload.get("_id"),
+            "embedding": embed_text(name, priority=Priority.BULK),
+            NORMALIZED_FLAG: True,
+            MODEL_VERSION_KEY: active_model().model_version,
+        }
 
-    return safe_call(_run, label="generate_skill_embeddings")
+    return safe_call(dual_encode, _run, label="generate_skill_embeddings")
 
 
 @register("generate_job_title_embeddings")
@@ -21,9 +33,14 @@ def generate_job_title_embeddings(payload: dict) -> dict:
             raise ValueError(
                 "payload.normalizedTitle or payload.title is required for job title embedding generation"
             )
-        return {"title_id": payload.get("_id"), "embedding": embed_text(text)}
+        return {
+            "title_id": payload.get("_id"),
+            "embedding": embed_text(text, priority=Priority.BULK),
+            NORMALIZED_FLAG: True,
+            MODEL_VERSION_KEY: active_model().model_version,
+        }
 
-    return safe_call(_run, label="generate_job_title_embeddings")
+    return safe_call(dual_encode, _run, label="generate_job_title_embeddings")
 
 
 @register("generate_location_embeddings")
@@ -34,6 +51,11 @@ def generate_location_embeddings(payload: dict) -> dict:
             raise ValueError(
                 "payload.name is required for location embedding generation"
             )
-        return {"location_id": payload.get("_id"), "embedding": embed_text(name)}
-
-    return safe_call(_run, label="generate_location_embeddings")
+        return {
+            "location_id": payload.get("_id"),
+            "embedding": embed_text(name, priority=Priority.BULK),
+            NORMALIZED_FLAG: True,
+            MODEL_VERSION_KEY: active_model().model_version,
+        }
+
+    return safe_call(dual_encode, _run, label="generate_location_embeddings")
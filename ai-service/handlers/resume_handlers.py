@@ -1,9 +1,13 @@
 from handlers.base_handler import register, safe_call
+from infrastructure.embeddings.doc_pool import DocPool
+from models.migration import active_model, dual_encode
+from models.priority import Priority, encode_priority
 from services.resume_service import ResumeService
 from services.scoring_service import ScoringService
 from services.analytics_service import AnalyticsService
 from serializers.resume_serializers import (
     serialize_resume_embeddings,
+    serialize_resume_embeddings_batch,
     serialize_resume_score,
 )
 from utils.date_utils import calculate_total_experience
@@ -16,6 +20,7 @@ def generate_resume_embeddings(
     job_title_doc: dict | None,
     location_doc: dict | None,
     work_experience_title_docs: list[dict],
+    previous_fingerprints: dict | None = None,
 ) -> dict:
     def _run():
         emb = ResumeService.extract_embeddings(
@@ -24,10 +29,38 @@ def generate_resume_embeddings(
             job_title_doc,
             location_doc,
             work_experience_title_docs,
+            previous_fingerprints,
+        )
+        return serialize_resume_embeddings(
+            resume_body.get("_id"), emb, active_model().model_version
+        )
+
+    return safe_call(dual_encode, _run, label="generate_resume_embeddings")
+
+
+@register("generate_resume_embeddings_batch")
+def generate_resume_embeddings_batch(
+    resume_bodies: list[dict],
+    skill_docs: list[dict],
+    job_title_docs: list[dict],
+    location_docs: list[dict],
+    previous_fingerprints: dict | None = None,
+) -> dict:
+    def _run():
+        if not isinstance(resume_bodies, list) or not all(
+            isinstance(d, dict) for d in resume_bodies
+        ):
+            raise ValueError("resumes must be a list of objects")
+        pool = DocPool(skill_docs, job_title_docs, location_docs)
+        with encode_priority(Priority.BULK):
+            outcomes = ResumeService.extract_embeddings_batch(
+                resume_bodies, pool, previous_fingerprints
+            )
+        return serialize_resume_embeddings_batch(
+            resume_bodies, outcomes, active_model().model_version
         )
-        return serialize_resume_embeddings(resume_body.get("_id"), emb)
 
-    return safe_call(_run, label="generate_resume_embeddings")
+    return safe_call(dual_encode, _run, label="generate_resume_embeddings_batch")
 
 
 @register("score_resume")
@@ -8,6 +8,8 @@ from enum import StrEnum
 class CacheOutcome(StrEnum):
     HIT = "hit"  # embedding loaded from pre-fetched doc, no model call
     MISS = "miss"  # entity absent from pre-fetched docs, model called
-    NULL_BACKFILL = "null_backfill"  # doc exists but embedding was null, model called,
-    # caller should write the new vector back to DB
+    NULL_BACKFILL = "null_backfill"  # doc exists but embedding was null (or from
+    # another model version), model called, caller should write the new vector back
     SKIPPED = "skipped"  # section absent from document, nothing to compute
+    REUSED = "reused"  # inputs match the caller's previous fingerprint, not
+    # recomputed — the caller keeps the vector it already has
@@ -0,0 +1,101 @@
+"""
+Shared pre-fetched docs for a batch of documents.
+
+Responsibility: let a batch request carry each skill, job title and
+location doc once, however many of its documents use it, and hand every
+document the docs the single-document endpoints would have received.
+
+WHAT THIS MODULE DOES:
+    - Indexes the pool once: skills by canonical name (models/canonical.py),
+      job titles by title / normalizedTitle / name, locations by name —
+      titles and locations case- and whitespace-insensitively
+    - Selects one document's skill_docs, job_title_doc, location_doc and
+      work_experience_title_docs from the index
+
+WHAT THIS MODULE DOES NOT DO:
+    - No vector matching or version checks — utils/embedding_utils.py
+      decides which selected docs are usable, exactly as for one document
+    - No DB access — Node builds and deduplicates the pool
+    - No document validation — a malformed field selects no docs and is
+      left for that document's own pipeline to reject
+"""
+
+from typing import Optional
+
+from models.canonical import canonicalize
+
+
+def _key(text) -> str:
+    return " ".join(str(text).split()).casefold()
+
+
+def _name(value) -> Optional[str]:
+    """A document field that is either a string or a { name } ref."""
+    if isinstance(value, dict):
+        value = value.get("name")
+    return value if isinstance(value, str) and value else None
+
+
+class DocPool:
+    """
+    Node's shared, deduplicated market docs for one batch request.
+
+    Args:
+        skill_docs:     { _id, name, embedding | null, ... } per skill.
+        job_title_docs: { _id, title | name, embedding | null, ... } per title,
+                        for document job titles and work-experience titles.
+        location_docs:  { _id, name, embedding | null, ... } per location.
+    """
+
+    def __init__(
+        self,
+        skill_docs: list[dict],
+        job_title_docs: list[dict],
+        location_docs: list[dict],
+    ):
+        self._skills: dict[str, list[dict]] = {}
+        for doc in skill_docs:
+            if doc.get("name"):
+                self._skills.setdefault(canonicalize(doc["name"]), []).append(doc)
+
+        self._titles: dict[str, dict] = {}
+        for doc in job_title_docs:
+            for field in ("title", "normalizedTitle", "name"):
+                if doc.get(field):
+                    self._titles.setdefault(_key(doc[field]), doc)
+
+        self._locations: dict[str, dict] = {
+            _key(doc["name"]): doc for doc in location_docs if doc.get("name")
+        }
+
+    def skill_docs_for(self, skills: list[dict]) -> list[dict]:
+        """Every pool doc sharing a canonical name with one of skills."""
+        if not isinstance(skills, list):
+            return []
+        wanted = dict.fromkeys(
+            canonicalize(s["name"])
+            for s in skills
+            if isinstance(s, dict) and isinstance(s.get("name"), str)
+        )
+        return [doc for name in wanted for doc in self._skills.get(name, [])]
+
+    def job_title_doc_for(self, title) -> Optional[dict]:
+        name = _name(title)
+        return self._titles.get(_key(name)) if name else None
+
+    def location_doc_for(self, location) -> Optional[dict]:
+        name = _name(location)
+        return self._locations.get(_key(name)) if name else None
+
+    def job_title_docs_for(self, work_experiences: list[dict]) -> list[dict]:
+        """The title docs of work-experience entries, one per distinct title."""
+        docs: dict[int, dict] = {}
+        if not isinstance(work_experiences, list):
+            return []
+        for exp in work_experiences:
+            if not isinstance(exp, dict):
+                continue
+            doc = self.job_title_doc_for(exp.get("jobTitle"))
+            if doc is not None:
+                docs.setdefault(id(doc), doc)
+        return list(docs.values())
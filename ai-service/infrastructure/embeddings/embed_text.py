@@ -1,8 +1,10 @@
-from models.embeddings import embedding_model
+from models.migration import active_model
+from models.priority import Priority, encode_priority
 
 
-def embed_text(text: str) -> list[float]:
-    embedding = embedding_model.encode(text)
+def embed_text(text: str, priority: Priority = Priority.INTERACTIVE) -> list[float]:
+    with encode_priority(priority):
+        embedding = active_model().encode(text)
     if embedding is None:
         raise ValueError(f"Failed to generate embedding for text: {text!r}")
     return embedding.detach().cpu().tolist()
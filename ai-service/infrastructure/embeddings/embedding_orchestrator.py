@@ -8,8 +8,13 @@ executes via run_pipeline, emits metrics, and returns the typed result.
 WHAT THIS MODULE DOES:
     - Imports pipelines/ to trigger self-registration
     - Looks up the correct pipeline from the registry
-    - Wires build → run_pipeline → unpack
+    - Wires build → run_pipeline (plan every section) → run_planned (one
+      shared encoder call, then per-section assembly) → unpack
+    - Adds each section's input fingerprint, and the sections reused
+      because the caller's previous fingerprint matched, to the result
     - Emits PipelineRun metrics after each execution
+    - Runs many documents of one type as a batch that shares one encoder
+      call, isolating per-document failures (extract_embeddings_batch)
 
 WHAT THIS MODULE DOES NOT DO:
     - No task definitions  (task_registry.py)
@@ -19,12 +24,19 @@ WHAT THIS MODULE DOES NOT DO:
 """
 
 import logging
+import os
 import time
-from typing import Literal, cast
+from typing import Literal, Union, cast
 
 from metrics.embedding_metrics import PipelineRun
 from infrastructure.jobs.parallelization.parallel_utils import run_pipeline
 from infrastructure.embeddings.pipelines import pipeline_registry
+from infrastructure.embeddings.tasks.task_registry import (
+    fingerprint_fields,
+    run_planned,
+    run_planned_batch,
+)
+from models.deadline import DeadlineExceeded
 from observability.emitters.embedding_emitters import emit_pipeline_run
 import infrastructure.embeddings.pipelines  # noqa: F401 — triggers registration
 
@@ -32,6 +44,11 @@ logger = logging.getLogger(__name__)
 
 EntityType = Literal["resume", "job"]
 
+# Documents one extract_embeddings_batch call may hold.
+EMBEDDING_BATCH_MAX_DOCUMENTS = int(
+    os.environ.get("EMBEDDING_BATCH_MAX_DOCUMENTS", "500")
+)
+
 
 def extract_embeddings_parallel(
     entity_type: str,
@@ -52,15 +69,20 @@ def extract_embeddings_parallel(
         job_title_doc:              Optional[dict]
         location_doc:               Optional[dict]
         work_experience_title_docs: list[dict]
+        previous_fingerprints:      Optional[dict[str, str]]
 
     Job kwargs:
-        job:           dict
-        skill_docs:    list[dict]
-        job_title_doc: Optional[dict]
-        location_doc:  Optional[dict]
+        job:                   dict
+        skill_docs:            list[dict]
+        job_title_doc:         Optional[dict]
+        location_doc:          Optional[dict]
+        previous_fingerprints: Optional[dict[str, str]]
 
     Returns:
-        Typed embeddings dict — shape defined by the pipeline's unpack_fn.
+        Typed embeddings dict — shape defined by the pipeline's unpack_fn —
+        plus section_fingerprints ({section_key: str | None}) and
+        reused_sections (keys whose previous fingerprint matched; their
+        values are empty and the caller keeps what it has).
 
     Raises:
         KeyError: if entity_type has no registered pipeline.
@@ -76,8 +98,11 @@ def extract_embeddings_parallel(
 
     try:
         tasks = build_fn(**kwargs, run=run)
-        raw = run_pipeline(tasks, entity_type=normalized_entity, entity_id=entity_id)
-        result = unpack_fn(raw)
+        planned = run_pipeline(
+            tasks, entity_type=normalized_entity, entity_id=entity_id
+        )
+        raw = run_planned(planned, run)
+        result = {**unpack_fn(raw), **fingerprint_fields(planned)}
 
         run.finish((time.perf_counter() - start) * 1000)
         emit_pipeline_run(run, entity=normalized_entity, status="success")
@@ -87,3 +112,81 @@ def extract_embeddings_parallel(
         run.finish((time.perf_counter() - start) * 1000)
         emit_pipeline_run(run, entity=normalized_entity, status="failed")
         raise
+
+
+def extract_embeddings_batch(
+    entity_type: str,
+    documents: list[tuple[str, dict]],
+) -> list[Union[dict, Exception]]:
+    """
+    extract_embeddings_parallel for many documents of one type at once.
+
+    Every document is planned on its own. Then the misses of every section
+    of every document go through ONE encoder call, and each document is
+    assembled from its own rows.
+
+    Args:
+        entity_type: As for extract_embeddings_parallel.
+        documents:   (entity_id, build kwargs) per document.
+
+    Returns:
+        Per document, in order: its typed embeddings dict, or the exception
+        that failed it. One document failing never fails the others.
+
+    Raises:
+        ValueError: more than EMBEDDING_BATCH_MAX_DOCUMENTS documents.
+        DeadlineExceeded: the request ended — the whole batch is abandoned.
+    """
+    if len(documents) > EMBEDDING_BATCH_MAX_DOCUMENTS:
+        raise ValueError(
+            f"batch of {len(documents)} documents exceeds the limit of "
+            f"{EMBEDDING_BATCH_MAX_DOCUMENTS}"
+        )
+
+    normalized_entity = pipeline_registry.normalize_entity_type(entity_type)
+    typed_entity = cast(EntityType, normalized_entity)
+    build_fn, unpack_fn = pipeline_registry.get(entity_type)
+
+    results: list[Union[dict, Exception]] = []
+    pending: list[tuple[int, dict, PipelineRun, float]] = []
+
+    def _failed(run: PipelineRun, start: float, error: Exception) -> Exception:
+        run.finish((time.perf_counter() - start) * 1000)
+        emit_pipeline_run(run, entity=normalized_entity, status="failed")
+        return error
+
+    for index, (entity_id, kwargs) in enumerate(documents):
+        run = PipelineRun(entity_type=typed_entity, entity_id=entity_id)
+        start = time.perf_counter()
+        try:
+            tasks = build_fn(**kwargs, run=run)
+            planned = run_pipeline(
+                tasks, entity_type=normalized_entity, entity_id=entity_id
+            )
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"Batch {normalized_entity}={entity_id} failed: {e}")
+            results.append(_failed(run, start, e))
+            continue
+        results.append({})  # placeholder until the shared encode
+        pending.append((index, planned, run, start))
+
+    try:
+        raws = run_planned_batch([(planned, run) for _, planned, run, _ in pending])
+    except Exception as e:
+        for _, _, run, start in pending:
+            _failed(run, start, e)
+        raise
+
+    for (index, planned, run, start), raw in zip(pending, raws):
+        try:
+            results[index] = {**unpack_fn(raw), **fingerprint_fields(planned)}
+        except Exception as e:
+            logger.error(f"Batch {normalized_entity}={run.entity_id} failed: {e}")
+            results[index] = _failed(run, start, e)
+            continue
+        run.finish((time.perf_counter() - start) * 1000)
+        emit_pipeline_run(run, entity=normalized_entity, status="success")
+
+    return results
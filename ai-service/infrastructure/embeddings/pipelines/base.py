@@ -30,7 +30,9 @@ class EmbeddingPipeline:
 
     task_factory:   callable(**doc_kwargs, run) → {section_key: callable}
                     Receives the document data and a shared PipelineRun,
-                    returns the task map for run_pipeline.
+                    returns the task map for run_pipeline. Each task plans
+                    its section (task_registry.plan_task); the orchestrator
+                    finishes them together with run_planned.
 
     result_keys:    maps canonical output keys to raw section keys, plus
                     flags for skills/single unpacking.
@@ -9,11 +9,11 @@ from metrics.embedding_metrics import PipelineRun
 from infrastructure.embeddings.pipelines import pipeline_registry
 from infrastructure.embeddings.pipelines.base import EmbeddingPipeline, make_pipeline
 from infrastructure.embeddings.tasks.tasks import (
-    run_experience_level,
-    run_job_title,
-    run_location,
-    run_requirements,
-    run_skills,
+    plan_experience_level,
+    plan_job_title,
+    plan_location,
+    plan_requirements,
+    plan_skills,
 )
 
 
@@ -23,13 +23,18 @@ def _task_factory(
     job_title_doc: Optional[dict],
     location_doc: Optional[dict],
     run: PipelineRun,
+    previous_fingerprints: Optional[dict[str, str]] = None,
 ) -> dict:
+    # A section whose input is unchanged since these fingerprints is reused.
+    reuse = {"previous_fingerprints": previous_fingerprints}
     return {
-        "skills": lambda: run_skills(job, run, skill_docs=skill_docs),
-        "requirements": lambda: run_requirements(job, run),
-        "jobTitle": lambda: run_job_title(job, run, job_title_doc=job_title_doc),
-        "location": lambda: run_location(job, run, location_doc=location_doc),
-        "experienceLevel": lambda: run_experience_level(job, run),
+        "skills": lambda: plan_skills(job, run, skill_docs=skill_docs, **reuse),
+        "requirements": lambda: plan_requirements(job, run, **reuse),
+        "jobTitle": lambda: plan_job_title(
+            job, run, job_title_doc=job_title_doc, **reuse
+        ),
+        "location": lambda: plan_location(job, run, location_doc=location_doc, **reuse),
+        "experienceLevel": lambda: plan_experience_level(job, run, **reuse),
     }
 
 
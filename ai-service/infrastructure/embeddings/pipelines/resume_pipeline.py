@@ -9,11 +9,11 @@ from metrics.embedding_metrics import PipelineRun
 from infrastructure.embeddings.pipelines import pipeline_registry
 from infrastructure.embeddings.pipelines.base import EmbeddingPipeline, make_pipeline
 from infrastructure.embeddings.tasks.tasks import (
-    run_certifications,
-    run_job_title,
-    run_location,
-    run_skills,
-    run_work_experience,
+    plan_certifications,
+    plan_job_title,
+    plan_location,
+    plan_skills,
+    plan_work_experience,
 )
 
 
@@ -24,15 +24,25 @@ def _task_factory(
     location_doc: Optional[dict],
     work_experience_title_docs: list[dict],
     run: PipelineRun,
+    previous_fingerprints: Optional[dict[str, str]] = None,
 ) -> dict:
+    # A section whose input is unchanged since these fingerprints is reused.
+    reuse = {"previous_fingerprints": previous_fingerprints}
     return {
-        "skills": lambda: run_skills(resume, run, skill_docs=skill_docs),
-        "workExperience": lambda: run_work_experience(
-            resume, run, work_experience_title_docs=work_experience_title_docs
+        "skills": lambda: plan_skills(resume, run, skill_docs=skill_docs, **reuse),
+        "workExperience": lambda: plan_work_experience(
+            resume,
+            run,
+            work_experience_title_docs=work_experience_title_docs,
+            **reuse,
+        ),
+        "certifications": lambda: plan_certifications(resume, run, **reuse),
+        "jobTitle": lambda: plan_job_title(
+            resume, run, job_title_doc=job_title_doc, **reuse
+        ),
+        "location": lambda: plan_location(
+            resume, run, location_doc=location_doc, **reuse
         ),
-        "certifications": lambda: run_certifications(resume, run),
-        "jobTitle": lambda: run_job_title(resume, run, job_title_doc=job_title_doc),
-        "location": lambda: run_location(resume, run, location_doc=location_doc),
     }
 
 
@@ -0,0 +1,101 @@
+"""
+Result cache for whole embedding sections.
+
+Responsibility: remember the finished result of a section — pooled vector
+and backfill metadata — by its content fingerprint, so identical sections
+(the same requirements template or skill set copied across job postings)
+skip planning, encoding and pooling entirely.
+
+The text cache (models/embedding_cache.py) already saves the forward
+pass for repeated texts. A repeated section still paid for doc matching,
+the cache lookups and the tensor stacking and mean pooling on every copy.
+
+WHAT THIS MODULE DOES:
+    - Keys results by task_registry.section_fingerprint — section key,
+      section content as sent, the pre-fetched docs the section could use,
+      model version and projection
+    - Evicts least-recently-used entries past SECTION_CACHE_MAX_ENTRIES
+    - Stores each result with its CacheOutcome, so a cached section reports
+      the outcome its result describes (a null_backfill stays one)
+
+WHAT THIS MODULE DOES NOT DO:
+    - No metrics — task_registry records hits and misses per section
+    - No persistence — the cache dies with the process
+
+A cached result's backfill metadata is from the run that computed it.
+Node writing the same vector back to the same doc twice is harmless, and a
+new model version is a new key.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional
+
+from infrastructure.embeddings.cache_outcome import CacheOutcome
+
+SECTION_CACHE_ENABLED = (
+    os.environ.get("SECTION_CACHE_ENABLED", "true").lower() == "true"
+)
+SECTION_CACHE_MAX_ENTRIES = int(os.environ.get("SECTION_CACHE_MAX_ENTRIES", "4096"))
+
+
+class CachedSection(NamedTuple):
+    result: Any
+    outcome: CacheOutcome
+
+
+class SectionCache:
+    """
+    Bounded, thread-safe LRU of finished section results.
+
+    Args:
+        max_entries: Results kept; 0 disables the cache.
+    """
+
+    def __init__(self, max_entries: int = SECTION_CACHE_MAX_ENTRIES):
+        self.max_entries = max(0, max_entries)
+        self._entries: OrderedDict[str, CachedSection] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, fingerprint: str) -> Optional[CachedSection]:
+        """The cached result, promoted to MRU — or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is not None:
+                self._entries.move_to_end(fingerprint)
+            return entry
+
+    def put(self, fingerprint: str, result: Any, outcome: CacheOutcome) -> None:
+        if not self.max_entries:
+            return
+        # Own copies, so a cached vector doesn't pin the batch tensor it was
+        # sliced from.
+        entry = CachedSection(_detached(result), outcome)
+        with self._lock:
+            self._entries[fingerprint] = entry
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _detached(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return tuple(_detached(v) for v in value)
+    if isinstance(value, list):
+        return [_detached(v) for v in value]
+    if hasattr(value, "detach"):  # torch.Tensor — torch is imported lazily
+        return value.detach().clone()
+    return value
+
+
+section_cache = SectionCache(SECTION_CACHE_MAX_ENTRIES if SECTION_CACHE_ENABLED else 0)
@@ -1,10 +1,20 @@
-from infrastructure.embeddings.tasks.task_registry import run_task, get, TaskConfig
+from infrastructure.embeddings.tasks.task_registry import (
+    run_task,
+    plan_task,
+    run_planned,
+    run_planned_batch,
+    section_fingerprint,
+    fingerprint_fields,
+    get,
+    TaskConfig,
+    PlannedSection,
+)
 from infrastructure.embeddings.tasks.tasks import (
-    run_skills,
-    run_work_experience,
-    run_certifications,
-    run_job_title,
-    run_location,
-    run_requirements,
-    run_experience_level,
+    plan_skills,
+    plan_work_experience,
+    plan_certifications,
+    plan_job_title,
+    plan_location,
+    plan_requirements,
+    plan_experience_level,
 )
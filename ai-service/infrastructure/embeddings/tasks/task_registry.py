@@ -4,10 +4,28 @@ Embedding task registry.
 Responsibility: declare what each embedding section does as config,
 and provide a single generic runner that executes any registered task.
 
+Sections run in two phases so a pipeline run costs one encoder call, not
+one per section:
+    1. plan_task()  — the section serves what it can from pre-fetched docs
+                      and declares the texts it still needs (an EncodePlan)
+    2. run_planned() — every planned section's texts go through ONE encoder
+                      call, then each section assembles its result from its
+                      own rows (finish_task)
+
+A section whose input fingerprint matches the caller's previous one is
+REUSED: planned as nothing to do, never encoded, and reported so the
+caller keeps the vector it already stored (incremental re-embedding).
+Otherwise a section whose fingerprint is in the section result cache
+(section_cache.py) skips straight to its cached result.
+
 WHAT THIS MODULE DOES:
     - Defines TaskConfig — a dataclass describing one embedding section
     - Registers all known tasks by section key
-    - Exposes run_task() — the single execution path for all tasks
+    - Exposes plan_task() / run_planned() — the execution path for pipelines,
+      and run_planned_batch() — one encoder call across many documents
+    - Exposes run_task() — both phases for a single section
+    - Fingerprints each section's input (section_fingerprint) and reports
+      per-section fingerprints and reuse for a planned document
 
 WHAT THIS MODULE DOES NOT DO:
     - No orchestration (orchestrator.py)
@@ -15,30 +33,55 @@ WHAT THIS MODULE DOES NOT DO:
     - No DB access
 """
 
+from __future__ import annotations
+
+import hashlib
+import json
+import time
 from dataclasses import dataclass, field
-from typing import Callable, Optional, Any
+from typing import TYPE_CHECKING, Callable, Optional, Any, cast
 
 from metrics.embedding_metrics import PipelineRun, measure_section
 from metrics.prometheus_metrics import (
     embedding_cache_hits_total,
     embedding_cache_misses_total,
     embedding_null_backfills_total,
+    embedding_section_cache_hits_total,
+    embedding_section_cache_misses_total,
+    embedding_sections_reused_total,
 )
 from infrastructure.embeddings.cache_outcome import CacheOutcome
+from infrastructure.embeddings.section_cache import CachedSection, section_cache
+from models.migration import active_model
+from models.projection import projection_for
+from utils.tensor_utils import MODEL_VERSION_KEY
 from utils.embedding_utils import (
-    extract_skills_embeddings,
-    extract_work_experience_embeddings,
-    extract_certification_embeddings,
-    extract_job_title_embedding,
-    extract_location_embedding,
-    extract_requirement_embeddings,
-    extract_experience_level_embedding,
+    EncodePlan,
+    encode_plans,
+    plan_skills_embeddings,
+    plan_work_experience_embeddings,
+    plan_certification_embeddings,
+    plan_job_title_embedding,
+    plan_location_embedding,
+    plan_requirement_embeddings,
+    plan_experience_level_embedding,
 )
 
 import logging
 
+if TYPE_CHECKING:
+    import torch
+
 logger = logging.getLogger(__name__)
 
+# Part of every fingerprint. Bump it when a section's planning changes what
+# it embeds — every stored fingerprint then stops matching, once.
+_FINGERPRINT_VERSION = 2
+
+# The doc fields a section's result can depend on: which doc a text matches
+# (name / title), its id for backfill, and the vector it may be served.
+_FINGERPRINT_DOC_FIELDS = ("_id", "name", "title", MODEL_VERSION_KEY, "embedding")
+
 # ── Task config ───────────────────────────────────────────────────────────────
 
 
@@ -48,18 +91,19 @@ class TaskConfig:
     Declarative description of one embedding section.
 
     doc_key:        Key to read from the document dict.
-    extract_fn:     Extraction util to call. Receives (value, *extra_args).
+    plan_fn:        Planning util to call (utils/embedding_utils plan_*).
+                    Receives (value, *extra_args), returns an EncodePlan.
     return_shape:   "plain"  → returns Optional[Tensor]
                     "skills" → returns (Tensor, list[str], list[Tensor])
                     "single" → returns (Tensor, Optional[str])
     outcome_fn:     Given (result, extra_args), returns the CacheOutcome.
                     Defaults to: hit if result, miss otherwise.
-    extra_keys:     Names of kwargs passed to run_task() that are forwarded
-                    to extract_fn after the doc value.
+    extra_keys:     Names of kwargs passed to plan_task() that are forwarded
+                    to plan_fn after the doc value.
     """
 
     doc_key: str
-    extract_fn: Callable
+    plan_fn: Callable
     return_shape: str = "plain"
     outcome_fn: Optional[Callable] = None
     extra_keys: list[str] = field(default_factory=list)
@@ -100,44 +144,44 @@ def _plain_outcome(result, _extra) -> CacheOutcome:
 _TASKS: dict[str, TaskConfig] = {
     "skills": TaskConfig(
         doc_key="skills",
-        extract_fn=extract_skills_embeddings,
+        plan_fn=plan_skills_embeddings,
         return_shape="skills",
         outcome_fn=_skills_outcome,
         extra_keys=["skill_docs"],
     ),
     "workExperience": TaskConfig(
         doc_key="workExperience",
-        extract_fn=extract_work_experience_embeddings,
+        plan_fn=plan_work_experience_embeddings,
         return_shape="plain",
         extra_keys=["work_experience_title_docs"],
     ),
     "certifications": TaskConfig(
         doc_key="certifications",
-        extract_fn=extract_certification_embeddings,
+        plan_fn=plan_certification_embeddings,
         return_shape="plain",
     ),
     "jobTitle": TaskConfig(
         doc_key="jobTitle",
-        extract_fn=extract_job_title_embedding,
+        plan_fn=plan_job_title_embedding,
         return_shape="single",
         outcome_fn=_single_outcome,
         extra_keys=["job_title_doc"],
     ),
     "location": TaskConfig(
         doc_key="location",
-        extract_fn=extract_location_embedding,
+        plan_fn=plan_location_embedding,
         return_shape="single",
         outcome_fn=_single_outcome,
         extra_keys=["location_doc"],
     ),
     "requirements": TaskConfig(
         doc_key="requirements",
-        extract_fn=extract_requirement_embeddings,
+        plan_fn=plan_requirement_embeddings,
         return_shape="plain",
     ),
     "experienceLevel": TaskConfig(
         doc_key="experienceLevel",
-        extract_fn=extract_experience_level_embedding,
+        plan_fn=plan_experience_level_embedding,
         return_shape="plain",
     ),
 }
@@ -151,41 +195,247 @@ def get(section_key: str) -> TaskConfig:
     return _TASKS[section_key]
 
 
+# ── Fingerprints ──────────────────────────────────────────────────────────────
+
+
+def section_fingerprint(
+    section_key: str, value: Any, model_version: str, docs: Optional[list] = None
+) -> str:
+    """
+    Stable digest of everything that decides a section's result: its input
+    value, the pre-fetched docs it may take vectors and backfill ids from
+    (the TaskConfig.extra_keys values), the model, and the projection its
+    served vector went through.
+
+    Dict key order and the order of the docs do not matter; any other change
+    does. The value is hashed as sent, not canonicalized — "Python" and
+    "python " are different fingerprints even though they embed alike.
+    """
+    projection = projection_for(model_version)
+    return _digest(
+        [
+            _FINGERPRINT_VERSION,
+            section_key,
+            model_version,
+            projection.version if projection else None,
+            value,
+            sorted(_doc_digest(doc) for doc in _flatten_docs(docs or [])),
+        ]
+    )
+
+
+def _digest(payload: Any) -> str:
+    encoded = json.dumps(
+        payload,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _doc_digest(doc: dict) -> str:
+    return _digest([doc.get(f) for f in _FINGERPRINT_DOC_FIELDS])
+
+
+def _flatten_docs(docs: list) -> list[dict]:
+    """extra_keys values are a doc, None, or a list of docs."""
+    flat: list[dict] = []
+    for entry in docs:
+        if isinstance(entry, dict):
+            flat.append(entry)
+        elif isinstance(entry, list):
+            flat.extend(doc for doc in entry if isinstance(doc, dict))
+    return flat
+
+
+def fingerprint_fields(planned: dict[str, Optional[PlannedSection]]) -> dict:
+    """
+    The planned document's section_fingerprints and reused_sections, after
+    run_planned. A section with no trustworthy vector — empty, skipped at
+    the deadline, or failed — has no fingerprint, so it is never reused.
+    """
+    return {
+        "section_fingerprints": {
+            key: section.fingerprint if section is not None else None
+            for key, section in planned.items()
+        },
+        "reused_sections": [
+            key for key, section in planned.items() if section and section.reused
+        ],
+    }
+
+
 # ── Generic runner ────────────────────────────────────────────────────────────
 
 
-def run_task(section_key: str, doc: dict, run: PipelineRun, **kwargs) -> Any:
+@dataclass
+class PlannedSection:
+    """
+    A section after phase one — plan is None when the doc had no value, the
+    section is reused, or its result came from the section cache.
+    """
+
+    section_key: str
+    run: PipelineRun
+    plan: Optional[EncodePlan]
+    extra: list  # the TaskConfig.extra_keys values, for outcome_fn
+    started_at: float  # perf_counter() — the section is timed from here
+    fingerprint: Optional[str] = None
+    reused: bool = False
+    cached: Optional[CachedSection] = None
+
+
+def plan_task(
+    section_key: str,
+    doc: dict,
+    run: PipelineRun,
+    previous_fingerprints: Optional[dict[str, str]] = None,
+    **kwargs,
+) -> PlannedSection:
     """
-    Execute a registered embedding task.
+    Phase one of a registered embedding task.
 
     Args:
         section_key: Key into _TASKS (e.g. "skills", "jobTitle").
         doc:         Document dict (resume or job).
         run:         Shared PipelineRun for metrics.
+        previous_fingerprints: {section_key: fingerprint} the caller got
+                     last time. A match reuses the section.
         **kwargs:    Extra args declared in TaskConfig.extra_keys
                      (e.g. skill_docs, job_title_doc).
 
     Returns:
-        Raw result from extract_fn, or None / empty defaults if skipped.
+        The section's PlannedSection, for run_planned().
     """
     cfg = get(section_key)
+    started_at = time.perf_counter()
 
-    with measure_section(run, section_key) as ctx:
-        value = doc.get(cfg.doc_key)
+    value = doc.get(cfg.doc_key)
 
-        # normalize dict fields
-        if isinstance(value, dict):
-            value = value.get("name", "")
+    # normalize dict fields
+    if isinstance(value, dict):
+        value = value.get("name", "")
 
-        if not value:
-            ctx["cache_outcome"] = CacheOutcome.SKIPPED
-            return _empty_result(cfg.return_shape)
+    if not value:
+        return PlannedSection(section_key, run, None, [], started_at)
 
-        extra = [kwargs[k] for k in cfg.extra_keys]
-        result = cfg.extract_fn(value, *extra)
+    extra = [kwargs[k] for k in cfg.extra_keys]
+    fingerprint = section_fingerprint(
+        section_key, value, active_model().model_version, extra
+    )
+    if (previous_fingerprints or {}).get(section_key) == fingerprint:
+        return PlannedSection(
+            section_key, run, None, [], started_at, fingerprint, reused=True
+        )
+
+    labels = {"entity": run.entity_type, "section": section_key}
+    cached = section_cache.get(fingerprint)
+    if cached is not None:
+        embedding_section_cache_hits_total.labels(**labels).inc()
+        return PlannedSection(
+            section_key, run, None, [], started_at, fingerprint, cached=cached
+        )
+    embedding_section_cache_misses_total.labels(**labels).inc()
+
+    try:
+        plan = cfg.plan_fn(value, *extra)
+    except Exception:
+        # Record the failed section, then let the caller log it.
+        with measure_section(run, section_key, started_at):
+            raise
+    return PlannedSection(section_key, run, plan, extra, started_at, fingerprint)
 
-        outcome_fn = cfg.outcome_fn or _plain_outcome
-        outcome = outcome_fn(result, extra)
+
+def run_planned(planned: dict[str, Optional[PlannedSection]], run: PipelineRun) -> dict:
+    """
+    Phases two and three: one encoder call for every planned section's
+    texts, then each section assembled from its own rows.
+
+    Args:
+        planned: {section_key: PlannedSection | None} — None for a section
+                 whose planning failed.
+        run:     Shared PipelineRun; its model_calls counts the encode.
+
+    Returns:
+        {section_key: result | None} — None means the section failed. A
+        failing assembly is logged and never aborts the other sections.
+    """
+    return run_planned_batch([(planned, run)])[0]
+
+
+def run_planned_batch(
+    batch: list[tuple[dict[str, Optional[PlannedSection]], PipelineRun]],
+) -> list[dict]:
+    """
+    run_planned for several documents at once — the sections of every
+    document share ONE encoder call, counted on each run it served.
+
+    Returns:
+        One {section_key: result | None} per (planned, run) pair, in order.
+    """
+    lives = [
+        {key: section for key, section in planned.items() if section is not None}
+        for planned, _ in batch
+    ]
+    rows = iter(_encode([section for live in lives for section in live.values()]))
+
+    out = []
+    for (planned, _), live in zip(batch, lives):
+        results: dict[str, Any] = {key: None for key in planned}
+        for key, section in live.items():
+            section_rows = next(rows)
+            try:
+                results[key] = finish_task(section, section_rows)
+            except Exception as e:
+                section.fingerprint = None  # nothing valid to reuse next time
+                logger.error(f"Pipeline task '{key}' failed: {e}", exc_info=True)
+        out.append(results)
+    return out
+
+
+def run_task(section_key: str, doc: dict, run: PipelineRun, **kwargs) -> Any:
+    """
+    Execute one registered embedding task on its own — both phases, with
+    an encoder call for just this section's texts.
+
+    Returns:
+        Raw result from the section's plan, or None / empty defaults if skipped.
+    """
+    planned = plan_task(section_key, doc, run, **kwargs)
+    return finish_task(planned, _encode([planned])[0])
+
+
+def finish_task(planned: PlannedSection, rows: Optional[torch.Tensor]) -> Any:
+    """Phase three — assemble the section's result from its rows and record it."""
+    cfg = get(planned.section_key)
+    run = planned.run
+    section_key = planned.section_key
+
+    with measure_section(run, section_key, planned.started_at) as ctx:
+        if planned.reused:
+            ctx["cache_outcome"] = CacheOutcome.REUSED
+            embedding_sections_reused_total.labels(
+                entity=run.entity_type, section=section_key
+            ).inc()
+            return _empty_result(cfg.return_shape)
+
+        if planned.cached is not None:
+            result, outcome = planned.cached
+        elif planned.plan is None:
+            ctx["cache_outcome"] = CacheOutcome.SKIPPED
+            return _empty_result(cfg.return_shape)
+        else:
+            result = planned.plan.assemble(rows)
+            outcome_fn = cfg.outcome_fn or _plain_outcome
+            outcome = outcome_fn(result, planned.extra)
+            # Texts but no rows: the encode failed, and the result is missing
+            # what the model should have added — never cache or reuse it.
+            if planned.plan.texts and rows is None:
+                planned.fingerprint = None
+            if planned.fingerprint is not None:
+                section_cache.put(planned.fingerprint, result, outcome)
 
         ctx["cache_outcome"] = outcome
 
@@ -213,6 +463,26 @@ def run_task(section_key: str, doc: dict, run: PipelineRun, **kwargs) -> Any:
     return result
 
 
+def _encode(sections: list[PlannedSection]) -> list[Optional[torch.Tensor]]:
+    """
+    Rows per section from at most one encoder call, counted once on every
+    run whose sections needed it.
+    """
+    needed = [s for s in sections if s.plan is not None and s.plan.texts]
+    if not needed:
+        return [None] * len(sections)
+
+    for run in {id(s.run): s.run for s in needed}.values():
+        run.model_calls += 1
+
+    rows = iter(
+        encode_plans([cast(EncodePlan, s.plan) for s in needed], active_model())
+    )
+    return [
+        next(rows) if s.plan is not None and s.plan.texts else None for s in sections
+    ]
+
+
 # ── Empty result defaults ─────────────────────────────────────────────────────
 
 
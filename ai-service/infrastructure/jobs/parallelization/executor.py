@@ -0,0 +1,185 @@
+"""
+Process-wide executor for pipeline sections.
+
+Responsibility: run the section tasks of every in-flight pipeline on one
+long-lived, fixed-size thread pool, and push back on callers once enough
+work is already waiting.
+
+A pool per run_pipeline call meant 5 fresh threads per resume: under 50
+concurrent requests, hundreds of short-lived threads contending with
+torch's own intra-op threads. Here the worker count is fixed
+(PIPELINE_MAX_WORKERS). Sections no worker has picked up yet wait in a
+queue capped at PIPELINE_MAX_QUEUE, and a pipeline whose sections do not
+fit blocks its caller until they do.
+
+WHAT THIS MODULE DOES:
+    - Admits a pipeline's sections as one group, so a request never has
+      half its sections queued while the rest wait for room
+    - Blocks admission for as long as the caller's deadline allows
+      (PIPELINE_QUEUE_TIMEOUT_S without one), then raises
+      DeadlineExceeded or PipelineSaturated
+    - Publishes active workers, queue depth and per-task queue wait
+
+WHAT THIS MODULE DOES NOT DO:
+    - No context propagation — run_pipeline wraps each task in
+      contextvars.copy_context().run before submitting
+    - No result collection or deadline checks at task start (parallel_utils.py)
+
+Tasks must not submit to the executor and wait on the result: with every
+worker blocked that way, nothing is left to run what they wait for.
+
+The pool starts lazily on the first submit. A forked child (serve.py)
+gets a fresh, empty executor — threads do not survive fork().
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from metrics.prometheus_metrics import (
+    pipeline_executor_active_workers,
+    pipeline_executor_queue_depth,
+    pipeline_executor_saturated_total,
+    pipeline_executor_task_wait_seconds,
+)
+from models.deadline import DeadlineExceeded, current_deadline
+
+PIPELINE_MAX_WORKERS = int(os.environ.get("PIPELINE_MAX_WORKERS", "16"))
+PIPELINE_MAX_QUEUE = int(os.environ.get("PIPELINE_MAX_QUEUE", "64"))
+# Longest a pipeline without a deadline waits for queue room.
+PIPELINE_QUEUE_TIMEOUT_S = float(os.environ.get("PIPELINE_QUEUE_TIMEOUT_S", "30"))
+
+# Admission re-checks the caller's deadline this often — Deadline.cancel()
+# does not wake the condition.
+_POLL_S = 0.05
+
+
+class PipelineSaturated(RuntimeError):
+    """The executor's queue stayed full for longer than the caller could wait."""
+
+
+class PipelineExecutor:
+    """
+    Fixed-size thread pool with a bounded, group-admitted queue.
+
+    Args:
+        max_workers: Threads running sections.
+        max_queue:   Sections that may wait for a worker. A group larger
+                     than this is admitted once the queue is empty.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = PIPELINE_MAX_WORKERS,
+        max_queue: int = PIPELINE_MAX_QUEUE,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(1, max_queue)
+
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._cond = threading.Condition()
+        self._queued = 0
+        self._active = 0
+        _live_executors.add(self)
+
+    def submit_all(self, fns: list[Callable[[], Any]]) -> list[Future]:
+        """
+        Queue fns as one group and return their futures, in order.
+
+        Raises:
+            DeadlineExceeded if the caller's request ended while waiting for room.
+            PipelineSaturated if room did not come within PIPELINE_QUEUE_TIMEOUT_S.
+        """
+        if not fns:
+            return []
+
+        pool = self._ensure_pool()
+        self._admit(len(fns))
+        enqueued_at = time.perf_counter()
+        return [pool.submit(self._run, fn, enqueued_at) for fn in fns]
+
+    @property
+    def queue_depth(self) -> int:
+        with self._cond:
+            return self._queued
+
+    @property
+    def active_workers(self) -> int:
+        with self._cond:
+            return self._active
+
+    def _reset_after_fork(self) -> None:
+        """Child side of fork(): the pool's threads and its locks did not come along."""
+        self._pool = None
+        self._cond = threading.Condition()
+        self._queued = 0
+        self._active = 0
+
+    # ── Internals ─────────────────────────────────────────────────────────────
+
+    def _ensure_pool(self) -> ThreadPoolExecutor:
+        with self._cond:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="pipeline"
+                )
+            return self._pool
+
+    def _admit(self, count: int) -> None:
+        deadline = current_deadline()
+        remaining = deadline.remaining() if deadline is not None else None
+        wait_s = PIPELINE_QUEUE_TIMEOUT_S if remaining is None else remaining
+        give_up_at = time.monotonic() + wait_s
+
+        with self._cond:
+            while self._queued and self._queued + count > self.max_queue:
+                reason = deadline.reason if deadline is not None else None
+                if reason is not None:
+                    raise DeadlineExceeded(reason)
+                left = give_up_at - time.monotonic()
+                if left <= 0:
+                    pipeline_executor_saturated_total.inc()
+                    raise PipelineSaturated(
+                        f"{self._queued} pipeline sections already queued "
+                        f"(limit {self.max_queue}); waited {wait_s:.1f}s for room"
+                    )
+                self._cond.wait(min(left, _POLL_S))
+
+            self._queued += count
+            pipeline_executor_queue_depth.set(self._queued)
+
+    def _run(self, fn: Callable[[], Any], enqueued_at: float) -> Any:
+        with self._cond:
+            self._queued -= 1
+            self._active += 1
+            pipeline_executor_queue_depth.set(self._queued)
+            pipeline_executor_active_workers.set(self._active)
+            self._cond.notify_all()
+        pipeline_executor_task_wait_seconds.observe(time.perf_counter() - enqueued_at)
+
+        try:
+            return fn()
+        finally:
+            with self._cond:
+                self._active -= 1
+                pipeline_executor_active_workers.set(self._active)
+
+
+_live_executors: weakref.WeakSet[PipelineExecutor] = weakref.WeakSet()
+
+
+def _reset_executors_after_fork() -> None:
+    for executor in list(_live_executors):
+        executor._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):  # POSIX only
+    os.register_at_fork(after_in_child=_reset_executors_after_fork)
+
+
+pipeline_executor = PipelineExecutor()
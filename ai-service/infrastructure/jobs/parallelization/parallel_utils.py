@@ -1,13 +1,16 @@
 """
 Generic parallel pipeline executor.
 
-Responsibility: accept a map of named tasks, run them concurrently in a
-thread pool, collect results, and instrument with timing metrics.
+Responsibility: accept a map of named tasks, run them concurrently on the
+shared pipeline executor, collect results, and instrument with timing metrics.
 
 WHAT THIS MODULE DOES:
-    - Submits independent tasks concurrently (thread pool)
+    - Submits independent tasks concurrently (executor.pipeline_executor)
     - Drains futures into a keyed result dict
     - Records pipeline timing via persist_run()
+    - Skips tasks that start after their request's deadline has passed
+      (models/deadline.py) and raises DeadlineExceeded instead of
+      returning a partial result
 
 WHAT THIS MODULE DOES NOT DO:
     - No embedding logic
@@ -15,32 +18,58 @@ WHAT THIS MODULE DOES NOT DO:
     - No unpacking of domain-specific return shapes (that's the orchestrator's job)
 """
 
+import contextvars
 import time
 import logging
-from concurrent.futures import ThreadPoolExecutor, Future
+from functools import partial
+from concurrent.futures import Future
 from typing import Callable, Literal, cast
 
 from metrics.embedding_metrics import PipelineRun, persist_run
+from infrastructure.jobs.parallelization.executor import pipeline_executor
+from metrics.prometheus_metrics import embedding_sections_skipped_total
+from models.deadline import DeadlineExceeded, current_deadline
 
 logger = logging.getLogger(__name__)
 
 EntityType = Literal["resume", "job"]
 
 
-def _collect(futures: dict[Future, str]) -> dict:
+def _collect(futures: dict[Future, str]) -> tuple[dict, list[DeadlineExceeded]]:
     """
     Drain a {future: section_key} map into {section_key: result}.
     A failing task logs the error and stores None for that key
-    so one bad section never aborts the rest.
+    so one bad section never aborts the rest. Tasks stopped by the request's
+    deadline are returned separately — they are not errors.
     """
     results = {}
+    ended: list[DeadlineExceeded] = []
     for future, key in futures.items():
         try:
             results[key] = future.result()
+        except DeadlineExceeded as e:
+            ended.append(e)
+            results[key] = None
         except Exception as e:
             logger.error(f"Pipeline task '{key}' failed: {e}", exc_info=True)
             results[key] = None
-    return results
+    return results, ended
+
+
+def _unless_ended(fn: Callable, entity_type: str, section: str) -> Callable:
+    """fn, but raising DeadlineExceeded without running once the request has ended."""
+
+    def run():
+        deadline = current_deadline()
+        reason = deadline.reason if deadline is not None else None
+        if reason is not None:
+            embedding_sections_skipped_total.labels(
+                entity=entity_type, section=section, reason=reason
+            ).inc()
+            raise DeadlineExceeded(reason)
+        return fn()
+
+    return run
 
 
 def run_pipeline(
@@ -59,6 +88,12 @@ def run_pipeline(
 
     Returns:
         {section_key: result | None} — None means the task raised.
+
+    Raises:
+        DeadlineExceeded if any task was skipped or stopped because the
+        request's deadline passed or its client disconnected.
+        PipelineSaturated if the shared executor had no room for the tasks
+        within PIPELINE_QUEUE_TIMEOUT_S.
     """
     # PipelineRun expects Literal['resume', 'job']. entity_type is validated
     # upstream by pipeline_registry.normalize_entity_type() before reaching
@@ -69,10 +104,35 @@ def run_pipeline(
     run = PipelineRun(entity_type=typed_entity, entity_id=entity_id)
     t0 = time.perf_counter()
 
-    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
-        raw = _collect({pool.submit(fn): key for key, fn in tasks.items()})
+    # Each task runs in a copy of the caller's context so request-scoped
+    # state (e.g. the encode priority lane, the deadline) follows it into the pool.
+    keys = list(tasks)
+    try:
+        futures = pipeline_executor.submit_all(
+            [
+                partial(
+                    contextvars.copy_context().run,
+                    _unless_ended(tasks[key], entity_type, key),
+                )
+                for key in keys
+            ]
+        )
+    except DeadlineExceeded as e:
+        # Ended while waiting for room in the executor — no section started.
+        for key in keys:
+            embedding_sections_skipped_total.labels(
+                entity=entity_type, section=key, reason=e.reason
+            ).inc()
+        raise
+    raw, ended = _collect(dict(zip(futures, keys)))
 
     run.finish(total_duration_ms=(time.perf_counter() - t0) * 1000)
     persist_run(run)
 
+    if ended:
+        logger.info(
+            f"Pipeline {entity_type}={entity_id} stopped: {len(ended)} of "
+            f"{len(tasks)} sections did not finish ({ended[0].reason})"
+        )
+        raise ended[0]
     return raw
@@ -2,7 +2,6 @@ import sys
 import json
 import logging
 
-import torch
 
 # Configure logging to stderr so stdout stays clean for JSON output
 logging.basicConfig(
@@ -18,14 +17,16 @@ from services.analytics_service import AnalyticsService
 from services.scoring_service import ScoringService
 from services.resume_service import ResumeEmbeddings, ResumeService
 from services.job_service import JobService
-from utils.tensor_utils import tensor_to_list
+from utils.tensor_utils import tensor_to_list, to_unit_tensor
 from utils.websocket_utils import emit_progress
 from config.database import db
 from bson import ObjectId
-from transformers import logging as hf_logging
 import os
 
-hf_logging.set_verbosity_error()
+# The model stack is imported lazily, on the first encode — commands that
+# never encode (score_resume with stored embeddings) never import it. Set
+# transformers' verbosity through the env var it reads on import.
+os.environ.setdefault("TRANSFORMERS_VERBOSITY", "error")
 logging.getLogger("httpx").setLevel(logging.WARNING)
 logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
 
@@ -361,17 +362,10 @@ def score_resume(resume_id: str) -> dict:
             # Reconstruct NamedTuple from stored doc so .total_experience_years works
             mean = existing_embeddings.get("meanEmbeddings", {})
             embeddings = ResumeEmbeddings(
-                skills=torch.tensor(mean["skills"], dtype=torch.float32)
-                if mean.get("skills")
-                else None,
-                work_experience=torch.tensor(
-                    mean["workExperience"], dtype=torch.float32
-                )
-                if mean.get("workExperience")
-                else None,
-                certifications=torch.tensor(mean["certifications"], dtype=torch.float32)
-                if mean.get("certifications")
-                else None,
+                # Stored vectors may predate the unit-length contract.
+                skills=to_unit_tensor(mean.get("skills")),
+                work_experience=to_unit_tensor(mean.get("workExperience")),
+                certifications=to_unit_tensor(mean.get("certifications")),
                 total_experience_years=existing_embeddings.get(
                     "totalExperienceYears", 0.0
                 ),
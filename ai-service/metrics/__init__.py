@@ -7,7 +7,40 @@ from .prometheus_metrics import (
     embedding_cache_hits_total,
     embedding_cache_misses_total,
     embedding_null_backfills_total,
+    embedding_sections_reused_total,
+    embedding_section_cache_hits_total,
+    embedding_section_cache_misses_total,
     embedding_errors_total,
+    embedding_model_calls_per_run,
+    embedding_sections_skipped_total,
+    pipeline_executor_active_workers,
+    pipeline_executor_queue_depth,
+    pipeline_executor_task_wait_seconds,
+    pipeline_executor_saturated_total,
+    worker_pool_busy_workers,
+    worker_pool_wait_seconds,
+    event_loop_lag_seconds,
+    encoder_micro_batch_size,
+    encoder_micro_batch_queue_wait_seconds,
+    encoder_queue_depth,
+    encoder_skipped_texts_total,
+    encoder_cache_hits_total,
+    encoder_cache_misses_total,
+    encoder_cache_evictions_total,
+    encoder_cache_bytes,
+    encoder_canonical_rescues_total,
+    encoder_vocab_lookups_total,
+    encoder_stale_doc_vectors_total,
+    encoder_padding_waste_ratio,
+    encoder_bucket_duration_seconds,
+    encoder_batch_token_budget,
+    encoder_batch_tokens_per_second,
+    encoder_input_tokens,
+    encoder_chunked_texts_total,
+    encoder_chunks_per_text,
+    encoder_warmup_texts_per_second,
+    encoder_warmup_duration_seconds,
+    encoder_startup_seconds,
     scoring_requests_total,
     scoring_duration_seconds,
     matching_requests_total,
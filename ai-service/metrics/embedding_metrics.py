@@ -21,7 +21,7 @@ from typing import Generator, Literal, Optional
 
 logger = logging.getLogger(__name__)
 
-CacheOutcome = Literal["hit", "miss", "null_backfill", "skipped"]
+CacheOutcome = Literal["hit", "miss", "null_backfill", "skipped", "reused"]
 
 
 @dataclass
@@ -52,9 +52,14 @@ class PipelineRun:
     cache_hits: int = 0
     cache_misses: int = 0
     null_backfills: int = 0
+    sections_reused: int = 0
     slowest_section: Optional[str] = None
     had_errors: bool = False
 
+    # Encoder calls the run made — 1 when every section's misses share one
+    # pass, 0 when everything was served from docs.
+    model_calls: int = 0
+
     def finish(self, total_duration_ms: float) -> None:
         self.total_duration_ms = total_duration_ms
         self.completed_at = datetime.now(timezone.utc)
@@ -63,6 +68,9 @@ class PipelineRun:
         self.null_backfills = sum(
             1 for s in self.sections if s.cache_outcome == "null_backfill"
         )
+        self.sections_reused = sum(
+            1 for s in self.sections if s.cache_outcome == "reused"
+        )
         self.had_errors = any(s.error for s in self.sections)
         if self.sections:
             self.slowest_section = max(
@@ -79,8 +87,10 @@ class PipelineRun:
             "cacheHits": self.cache_hits,
             "cacheMisses": self.cache_misses,
             "nullBackfills": self.null_backfills,
+            "sectionsReused": self.sections_reused,
             "slowestSection": self.slowest_section,
             "hadErrors": self.had_errors,
+            "modelCalls": self.model_calls,
             "sections": [
                 {
                     "section": s.section,
@@ -97,6 +107,7 @@ class PipelineRun:
 def measure_section(
     run: PipelineRun,
     section: str,
+    started_at: Optional[float] = None,
 ) -> Generator[dict, None, None]:
     """
     Context manager that times a section and records its cache outcome.
@@ -110,14 +121,16 @@ def measure_section(
             ctx["cache_outcome"] = "hit" if all_from_db else "miss"
 
     Args:
-        run:     The PipelineRun this section belongs to.
-        section: Human-readable section name (e.g. "skills", "jobTitle").
+        run:        The PipelineRun this section belongs to.
+        section:    Human-readable section name (e.g. "skills", "jobTitle").
+        started_at: perf_counter() when the section's work began, if before
+                    the block — a planned section is timed from its plan.
 
     Yields:
         dict with key "cache_outcome" for the callee to populate.
     """
     ctx: dict = {"cache_outcome": "miss", "error": None}
-    t0 = time.perf_counter()
+    t0 = time.perf_counter() if started_at is None else started_at
     try:
         yield ctx
     except Exception as e:
@@ -151,8 +164,9 @@ def _log_summary(run: PipelineRun) -> None:
     lines = [
         f"[embedding_metrics] {run.entity_type}={run.entity_id} "
         f"total={run.total_duration_ms:.0f}ms "
-        f"hits={run.cache_hits} misses={run.cache_misses} backfills={run.null_backfills}"
-        + (" ERRORS" if run.had_errors else "")
+        f"hits={run.cache_hits} misses={run.cache_misses} backfills={run.null_backfills} "
+        f"reused={run.sections_reused} "
+        f"model_calls={run.model_calls}" + (" ERRORS" if run.had_errors else "")
     ]
     for s in sorted(run.sections, key=lambda x: x.duration_ms, reverse=True):
         marker = (
@@ -160,6 +174,8 @@ def _log_summary(run: PipelineRun) -> None:
             if s.cache_outcome == "hit"
             else "~"
             if s.cache_outcome == "null_backfill"
+            else "="
+            if s.cache_outcome == "reused"
             else "✗"
         )
         lines.append(
@@ -0,0 +1,173 @@
+"""
+Observability for the embedding model front-end (models/).
+
+Responsibility: record Prometheus observations for encoder internals.
+Mirrors metrics/gemini_metrics.py — the metric objects live in
+metrics/prometheus_metrics.py; this module only knows how to record them.
+
+Nothing in here touches the model. Every recorder is defensive:
+observability must never break an encode call.
+"""
+
+import logging
+from typing import Optional
+
+from metrics.prometheus_metrics import (
+    encoder_batch_token_budget,
+    encoder_batch_tokens_per_second,
+    encoder_bucket_duration_seconds,
+    encoder_cache_bytes,
+    encoder_cache_evictions_total,
+    encoder_cache_hits_total,
+    encoder_cache_misses_total,
+    encoder_canonical_rescues_total,
+    encoder_chunked_texts_total,
+    encoder_chunks_per_text,
+    encoder_input_tokens,
+    encoder_micro_batch_queue_wait_seconds,
+    encoder_micro_batch_size,
+    encoder_padding_waste_ratio,
+    encoder_queue_depth,
+    encoder_skipped_texts_total,
+    encoder_stale_doc_vectors_total,
+    encoder_startup_seconds,
+    encoder_vocab_lookups_total,
+    encoder_warmup_duration_seconds,
+    encoder_warmup_texts_per_second,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def record_micro_batch(batch_size: int, queue_waits: list[tuple[str, float]]) -> None:
+    """Observe one coalesced forward pass and how long each caller queued for it."""
+    try:
+        encoder_micro_batch_size.observe(batch_size)
+        for lane, wait in queue_waits:
+            encoder_micro_batch_queue_wait_seconds.labels(lane=lane).observe(wait)
+    except Exception:
+        logger.exception("[Encoder] failed to record micro-batch metrics")
+
+
+def record_queue_depth(lane: str, depth: int) -> None:
+    """Publish how many encode requests are waiting in one priority lane."""
+    try:
+        encoder_queue_depth.labels(lane=lane).set(depth)
+    except Exception:
+        logger.exception("[Encoder] failed to record queue depth metric")
+
+
+def record_stale_doc_vectors(kind: str, count: int) -> None:
+    """Count doc vectors ignored because another model version produced them."""
+    try:
+        if count:
+            encoder_stale_doc_vectors_total.labels(kind=kind).inc(count)
+    except Exception:
+        logger.exception("[Encoder] failed to record stale doc vector metric")
+
+
+def record_skipped_texts(stage: str, reason: str, count: int) -> None:
+    """Count texts dropped before a forward pass because their request ended."""
+    try:
+        if count:
+            encoder_skipped_texts_total.labels(stage=stage, reason=reason).inc(count)
+    except Exception:
+        logger.exception("[Encoder] failed to record skipped texts metric")
+
+
+def record_cache_lookup(hits: int, misses: int) -> None:
+    """Count per-text cache hits and misses for one lookup."""
+    try:
+        if hits:
+            encoder_cache_hits_total.inc(hits)
+        if misses:
+            encoder_cache_misses_total.inc(misses)
+    except Exception:
+        logger.exception("[Encoder] failed to record cache lookup metrics")
+
+
+def record_cache_evictions(evicted: int, resident_bytes: int) -> None:
+    """Count LRU evictions and publish the cache's current footprint."""
+    try:
+        if evicted:
+            encoder_cache_evictions_total.inc(evicted)
+        encoder_cache_bytes.set(resident_bytes)
+    except Exception:
+        logger.exception("[Encoder] failed to record cache eviction metrics")
+
+
+def record_canonical_rescues(stage: str, count: int) -> None:
+    """Count lookups that canonicalization saved from a model call."""
+    try:
+        if count:
+            encoder_canonical_rescues_total.labels(stage=stage).inc(count)
+    except Exception:
+        logger.exception("[Encoder] failed to record canonical rescue metric")
+
+
+def record_vocab_lookup(hit: bool) -> None:
+    """Count one closed-vocabulary table lookup as a hit or out-of-vocabulary."""
+    try:
+        encoder_vocab_lookups_total.labels(outcome="hit" if hit else "oov").inc()
+    except Exception:
+        logger.exception("[Encoder] failed to record vocab lookup metric")
+
+
+def record_padding_waste(ratio: float) -> None:
+    """Observe the padding-waste ratio of one bucketed encode call."""
+    try:
+        encoder_padding_waste_ratio.observe(ratio)
+    except Exception:
+        logger.exception("[Encoder] failed to record padding waste metric")
+
+
+def record_bucket_duration(bucket: str, duration_seconds: float) -> None:
+    """Observe one forward pass for a token-length bucket."""
+    try:
+        encoder_bucket_duration_seconds.labels(bucket=bucket).observe(duration_seconds)
+    except Exception:
+        logger.exception("[Encoder] failed to record bucket duration metric")
+
+
+def record_batch_budget(token_budget: int, tokens_per_second: Optional[float]) -> None:
+    """Publish the adaptive controller's token budget and measured throughput."""
+    try:
+        encoder_batch_token_budget.set(token_budget)
+        if tokens_per_second is not None:
+            encoder_batch_tokens_per_second.set(tokens_per_second)
+    except Exception:
+        logger.exception("[Encoder] failed to record batch budget metrics")
+
+
+def record_chunking(input_tokens: list[int], chunks_per_text: list[int]) -> None:
+    """Observe input token lengths and how many chunks each over-long text became."""
+    try:
+        for tokens in input_tokens:
+            encoder_input_tokens.observe(tokens)
+        if chunks_per_text:
+            encoder_chunked_texts_total.inc(len(chunks_per_text))
+        for chunks in chunks_per_text:
+            encoder_chunks_per_text.observe(chunks)
+    except Exception:
+        logger.exception("[Encoder] failed to record chunking metrics")
+
+
+def record_warmup(throughput: dict[int, float], duration_seconds: float) -> None:
+    """Publish startup warm-up throughput per sequence length and its total time."""
+    try:
+        for seq_len, texts_per_second in throughput.items():
+            encoder_warmup_texts_per_second.labels(seq_len=str(seq_len)).set(
+                texts_per_second
+            )
+        encoder_warmup_duration_seconds.set(duration_seconds)
+    except Exception:
+        logger.exception("[Encoder] failed to record warm-up metrics")
+
+
+def record_startup(phases: dict[str, float]) -> None:
+    """Publish seconds spent per startup phase (import, weights, tokenizer, warmup)."""
+    try:
+        for phase, seconds in phases.items():
+            encoder_startup_seconds.labels(phase=phase).set(seconds)
+    except Exception:
+        logger.exception("[Encoder] failed to record startup metrics")
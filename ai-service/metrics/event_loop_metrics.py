@@ -0,0 +1,40 @@
+"""
+Observability for the asyncio event loop itself.
+
+Responsibility: measure how late the loop runs what it schedules, and
+record it as aiservice_event_loop_lag_seconds. The metric object lives in
+metrics/prometheus_metrics.py; this module only knows how to sample it.
+
+A healthy loop wakes a sleeping coroutine within a millisecond or so of
+when it was due. When a blocking call runs on the loop, every timer and
+request on that worker, /health and /metrics included, waits behind it,
+and that wait shows up here. Routes hand blocking handlers to the worker
+pools (routers/shared/worker_pools.py) to keep it near zero.
+
+Sampling is defensive: observability must never take the loop down.
+"""
+
+import asyncio
+import logging
+import os
+
+from metrics.prometheus_metrics import event_loop_lag_seconds
+
+logger = logging.getLogger(__name__)
+
+# How often the loop is sampled; each sample is one timer, so this is cheap.
+EVENT_LOOP_LAG_INTERVAL_S = float(os.environ.get("EVENT_LOOP_LAG_INTERVAL_S", "0.5"))
+
+
+async def monitor_event_loop_lag(
+    interval_s: float = EVENT_LOOP_LAG_INTERVAL_S,
+) -> None:
+    """Sample the running loop's lag every interval_s until cancelled."""
+    loop = asyncio.get_running_loop()
+    while True:
+        due = loop.time() + interval_s
+        await asyncio.sleep(interval_s)
+        try:
+            event_loop_lag_seconds.observe(max(0.0, loop.time() - due))
+        except Exception:
+            logger.debug("[event_loop_metrics] failed to record lag", exc_info=True)
@@ -6,6 +6,9 @@ No instrumentation logic, no emit helpers, no imports from other app modules.
 
 Organized by pipeline:
   - Embedding  (resume + job, section-level granularity)
+  - Pipeline executor (shared section thread pool)
+  - Request workers (handler pools) and event-loop lag
+  - Encoder    (model front-end: micro-batching, text cache, length buckets)
   - Scoring
   - Matching
   - Salary prediction
@@ -55,12 +58,252 @@ embedding_null_backfills_total = Counter(
     labelnames=["entity", "section"],
 )
 
+# Whole-section result cache (infrastructure/embeddings/section_cache.py) —
+# hit rate per section is hits / (hits + misses)
+embedding_section_cache_hits_total = Counter(
+    name="aiservice_embedding_section_cache_hits_total",
+    documentation="Embedding sections served whole from the section result cache",
+    labelnames=["entity", "section"],
+)
+
+embedding_section_cache_misses_total = Counter(
+    name="aiservice_embedding_section_cache_misses_total",
+    documentation="Embedding sections not in the section result cache (computed)",
+    labelnames=["entity", "section"],
+)
+
+# Sections whose fingerprint matched the caller's previous one — not
+# recomputed, and left out of the response
+embedding_sections_reused_total = Counter(
+    name="aiservice_embedding_sections_reused_total",
+    documentation="Embedding sections reused because their inputs were unchanged",
+    labelnames=["entity", "section"],
+)
+
 embedding_errors_total = Counter(
     name="aiservice_embedding_errors_total",
     documentation="Embedding pipeline runs that had at least one section error",
     labelnames=["entity"],
 )
 
+# Encoder calls per pipeline run — 1 when every section's misses shared one
+# pass (task_registry.run_planned), 0 when docs served everything
+embedding_model_calls_per_run = Histogram(
+    name="aiservice_embedding_model_calls_per_run",
+    documentation="Encoder calls made by one embedding pipeline run",
+    labelnames=["entity"],
+    buckets=[0, 1, 2, 3, 5, 8],
+)
+
+# Sections run_pipeline never started because the request's deadline had
+# passed or the client had disconnected (models/deadline.py)
+embedding_sections_skipped_total = Counter(
+    name="aiservice_embedding_sections_skipped_total",
+    documentation="Pipeline sections skipped because their request expired or was cancelled",
+    labelnames=["entity", "section", "reason"],  # reason: expired | cancelled
+)
+
+# ── Pipeline executor ─────────────────────────────────────────────────────────
+# The shared section pool (infrastructure/jobs/parallelization/executor.py)
+
+pipeline_executor_active_workers = Gauge(
+    name="aiservice_pipeline_executor_active_workers",
+    documentation="Pipeline executor threads currently running a section",
+)
+
+# Sections admitted but not yet picked up by a worker — pinned near
+# PIPELINE_MAX_QUEUE means callers are being held back
+pipeline_executor_queue_depth = Gauge(
+    name="aiservice_pipeline_executor_queue_depth",
+    documentation="Pipeline sections waiting for an executor thread",
+)
+
+# One observation per section, from admission to a worker picking it up
+pipeline_executor_task_wait_seconds = Histogram(
+    name="aiservice_pipeline_executor_task_wait_seconds",
+    documentation="Time a pipeline section waited in the executor queue",
+    buckets=[0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5],
+)
+
+pipeline_executor_saturated_total = Counter(
+    name="aiservice_pipeline_executor_saturated_total",
+    documentation="Pipelines refused because the executor queue stayed full",
+)
+
+# ── Request workers ───────────────────────────────────────────────────────────
+# The per-class handler pools (routers/shared/worker_pools.py)
+
+worker_pool_busy_workers = Gauge(
+    name="aiservice_worker_pool_busy_workers",
+    documentation="Request worker threads currently running a handler",
+    labelnames=["pool"],  # pool: embedding | cpu | io
+)
+
+# One observation per request, from dispatch to a worker picking it up —
+# growing waits in one pool mean that class needs more workers
+worker_pool_wait_seconds = Histogram(
+    name="aiservice_worker_pool_wait_seconds",
+    documentation="Time a request waited for a worker in its handler pool",
+    labelnames=["pool"],
+    buckets=[0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5],
+)
+
+# How late the event loop wakes a timer (metrics/event_loop_metrics.py).
+# Anything past a few ms means something is blocking the loop, and
+# /health and /metrics on that worker are waiting behind it
+event_loop_lag_seconds = Histogram(
+    name="aiservice_event_loop_lag_seconds",
+    documentation="Delay between a scheduled event-loop wake-up and its callback",
+    buckets=[0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5],
+)
+
+# ── Encoder (model front-end) ─────────────────────────────────────────────────
+
+# One observation per forward pass — tune EMBEDDING_MICRO_BATCH_MAX_SIZE from this
+encoder_micro_batch_size = Histogram(
+    name="aiservice_encoder_micro_batch_size",
+    documentation="Texts per coalesced forward pass in the micro-batcher",
+    buckets=[1, 2, 4, 8, 16, 32, 64, 128, 256],
+)
+
+# One observation per caller — tune EMBEDDING_MICRO_BATCH_MAX_WAIT_MS against p99
+encoder_micro_batch_queue_wait_seconds = Histogram(
+    name="aiservice_encoder_micro_batch_queue_wait_seconds",
+    documentation="Time an encode request waited in the micro-batch queue",
+    labelnames=["lane"],  # lane: interactive | bulk
+    buckets=[0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5],
+)
+
+# Requests waiting per priority lane — a growing bulk lane is expected under
+# a regeneration burst; a growing interactive lane means we are out of capacity
+encoder_queue_depth = Gauge(
+    name="aiservice_encoder_queue_depth",
+    documentation="Encode requests waiting in the micro-batcher, per priority lane",
+    labelnames=["lane"],  # lane: interactive | bulk
+)
+
+# Counted per text, not per call — one encode_batch of 20 skills = 20 lookups
+encoder_cache_hits_total = Counter(
+    name="aiservice_encoder_cache_hits_total",
+    documentation="Texts served from the in-process embedding cache",
+)
+
+encoder_cache_misses_total = Counter(
+    name="aiservice_encoder_cache_misses_total",
+    documentation="Texts not in the in-process embedding cache (sent to the model)",
+)
+
+encoder_cache_evictions_total = Counter(
+    name="aiservice_encoder_cache_evictions_total",
+    documentation="Rows evicted from the in-process embedding cache to stay under its byte budget",
+)
+
+encoder_cache_bytes = Gauge(
+    name="aiservice_encoder_cache_bytes",
+    documentation="Tensor bytes currently held by the in-process embedding cache",
+)
+
+# Lookups that only succeeded because of canonicalization (models/canonical.py)
+#   doc_match — exact name missed Node's pre-fetched doc, canonical name hit it
+#   dedupe    — a spelling variant shared another input's model row
+encoder_canonical_rescues_total = Counter(
+    name="aiservice_encoder_canonical_rescues_total",
+    documentation="Lookups rescued from a model call by text canonicalization",
+    labelnames=["stage"],  # stage: doc_match | dedupe
+)
+
+# Doc vectors Node sent that a different model version produced — treated as
+# misses and backfilled. Climbs after an EMBEDDING_MODEL switch, then decays
+encoder_stale_doc_vectors_total = Counter(
+    name="aiservice_encoder_stale_doc_vectors_total",
+    documentation="Pre-fetched doc vectors ignored because another model version produced them",
+    labelnames=["kind"],  # kind: skill | job_title | location
+)
+
+# Closed-vocabulary table (models/vocab_table.py) — oov lookups go to the model
+encoder_vocab_lookups_total = Counter(
+    name="aiservice_encoder_vocab_lookups_total",
+    documentation="Closed-vocabulary embedding table lookups",
+    labelnames=["outcome"],  # outcome: hit | oov
+)
+
+# One observation per forward pass — padded token slots that held padding
+encoder_padding_waste_ratio = Histogram(
+    name="aiservice_encoder_padding_waste_ratio",
+    documentation="Fraction of padded token slots wasted on padding per encode call",
+    buckets=[0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9],
+)
+
+encoder_bucket_duration_seconds = Histogram(
+    name="aiservice_encoder_bucket_duration_seconds",
+    documentation="Forward-pass duration per token-length bucket",
+    labelnames=["bucket"],  # bucket: upper token bound — 16 | 32 | 64 | 128 | 256 | 384
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2],
+)
+
+# Set after every forward pass (models/batch_controller.py) — watch the
+# budget converge on the pass size that meets EMBEDDING_BATCH_TARGET_MS
+encoder_batch_token_budget = Gauge(
+    name="aiservice_encoder_batch_token_budget",
+    documentation="Padded tokens the adaptive controller allows per forward pass",
+)
+
+encoder_batch_tokens_per_second = Gauge(
+    name="aiservice_encoder_batch_tokens_per_second",
+    documentation="Smoothed forward-pass throughput in padded tokens per second",
+)
+
+# Texts dropped before reaching the model because their request expired or
+# was cancelled — CPU the service did not spend on answers nobody reads
+encoder_skipped_texts_total = Counter(
+    name="aiservice_encoder_skipped_texts_total",
+    documentation="Texts dropped before their forward pass because the request expired or was cancelled",
+    labelnames=[
+        "stage",
+        "reason",
+    ],  # stage: queue | forward, reason: expired | cancelled
+)
+
+# Pre-truncation token length of every text sent through encode_chunked —
+# the share above the model limit is what chunking rescues from truncation
+encoder_input_tokens = Histogram(
+    name="aiservice_encoder_input_tokens",
+    documentation="Token length (incl. special tokens, before truncation) of chunk-aware encode inputs",
+    buckets=[16, 32, 64, 128, 256, 384, 512, 768, 1024, 2048, 4096],
+)
+
+encoder_chunked_texts_total = Counter(
+    name="aiservice_encoder_chunked_texts_total",
+    documentation="Texts over the model's max sequence length that were split into chunks",
+)
+
+# One observation per chunked text
+encoder_chunks_per_text = Histogram(
+    name="aiservice_encoder_chunks_per_text",
+    documentation="Chunks an over-long text was split into before encoding",
+    buckets=[2, 3, 4, 6, 8, 12, 16, 32],
+)
+
+# Set once per worker at startup (models/warmup.py) — a baseline for the
+# steady-state encode throughput this host can sustain per sequence length
+encoder_warmup_texts_per_second = Gauge(
+    name="aiservice_encoder_warmup_texts_per_second",
+    documentation="Encode throughput measured during startup warm-up",
+    labelnames=["seq_len"],  # seq_len: 16 | 32 | 64 | 128 | 256 | 384
+)
+
+encoder_warmup_duration_seconds = Gauge(
+    name="aiservice_encoder_warmup_duration_seconds",
+    documentation="Wall time of the startup warm-up across all sequence lengths",
+)
+
+# Set once per worker at startup (app.py) — where cold-start time went
+encoder_startup_seconds = Gauge(
+    name="aiservice_encoder_startup_seconds",
+    documentation="Wall time of each model startup phase",
+    labelnames=["phase"],  # phase: import | weights | tokenizer | warmup
+)
+
 # ── Scoring ───────────────────────────────────────────────────────────────────
 
 scoring_requests_total = Counter(
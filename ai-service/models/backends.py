@@ -0,0 +1,157 @@
+"""
+Inference backends for the embedding model.
+
+Responsibility: turn (model name, backend) into a loaded SentenceTransformer
+whose .encode() behaves identically regardless of what runs underneath.
+
+Backends (EMBEDDING_BACKEND env var, or EmbeddingModel(backend=...)):
+    torch      PyTorch weights — the default, and the parity reference
+    onnx       Exported fp32 ONNX graph on ONNX Runtime (CPU)
+    onnx-int8  Dynamically int8-quantized ONNX graph — smallest + fastest on
+               CPU, at the cost of a small cosine drift vs torch. Run
+               `python -m benchmarks.embedding_backends` before switching.
+
+The ONNX backends need the optional extras (not in requirements.txt):
+    pip install "sentence-transformers[onnx]"
+
+The torch backend memory-maps model.safetensors from the local snapshot
+(models/weights.py) when EMBEDDING_MMAP_WEIGHTS is true (default), and falls
+back to the stock sentence-transformers loader when there is no local
+snapshot or mapping fails.
+
+WHAT THIS MODULE DOES NOT DO:
+    - No encoding, caching or batching (models/embeddings.py)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Literal, Optional, cast
+
+from models.weights import (
+    EMBEDDING_MMAP_WEIGHTS,
+    WEIGHTS_FILE,
+    local_snapshot,
+    mmap_state_dict,
+    weights_hook,
+)
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+logger = logging.getLogger(__name__)
+
+Backend = Literal["torch", "onnx", "onnx-int8"]
+BACKENDS: tuple[Backend, ...] = ("torch", "onnx", "onnx-int8")
+
+EMBEDDING_BACKEND = os.environ.get("EMBEDDING_BACKEND", "torch")
+# Matches the quantized graphs the sentence-transformers Hub repos ship with.
+# avx512_vnni suits modern x86 servers; use "avx2" or "arm64" elsewhere.
+EMBEDDING_ONNX_QUANTIZATION = os.environ.get(
+    "EMBEDDING_ONNX_QUANTIZATION", "avx512_vnni"
+)
+# Where a locally quantized graph is written when the Hub repo has none.
+EMBEDDING_ONNX_EXPORT_DIR = os.environ.get(
+    "EMBEDDING_ONNX_EXPORT_DIR", os.path.expanduser("~/.cache/ai-service/onnx")
+)
+
+
+def resolve_backend(backend: str | None) -> Backend:
+    """Validate a backend name, falling back to EMBEDDING_BACKEND when None."""
+    name = (backend or EMBEDDING_BACKEND).strip().lower()
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown embedding backend '{name}'. Expected one of {BACKENDS}"
+        )
+    return cast(Backend, name)
+
+
+def load_sentence_transformer(
+    model_name: str, backend: Backend, phases: Optional[dict[str, float]] = None
+) -> SentenceTransformer:
+    """
+    Load model_name on the requested backend.
+
+    phases, when given, receives seconds spent per startup phase:
+        import     importing sentence-transformers (torch, transformers)
+        weights    getting the weights into the model
+        tokenizer  the rest of the build — config, tokenizer, pooling
+                   (ONNX backends: included in weights)
+    """
+    phases = {} if phases is None else phases
+
+    started = time.perf_counter()
+    # Imported here, not at module level: sentence-transformers drags in
+    # torch and transformers, and resolve_backend() must stay cheap.
+    from sentence_transformers import SentenceTransformer
+
+    phases["import"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    if backend == "torch":
+        model = _load_torch(model_name, phases)
+        phases["tokenizer"] = time.perf_counter() - started - phases["weights"]
+        return model
+
+    if backend == "onnx":
+        # Uses onnx/model.onnx from the repo, or exports one on the fly.
+        model = SentenceTransformer(model_name, backend="onnx")
+    else:
+        model = _load_quantized(model_name)
+    phases["weights"] = time.perf_counter() - started
+    return model
+
+
+def _load_torch(model_name: str, phases: dict[str, float]) -> SentenceTransformer:
+    from sentence_transformers import SentenceTransformer
+
+    snapshot = local_snapshot(model_name) if EMBEDDING_MMAP_WEIGHTS else None
+    if snapshot is not None:
+        try:
+            state_dict = mmap_state_dict(os.path.join(snapshot, WEIGHTS_FILE))
+            with weights_hook(phases, state_dict):
+                model = SentenceTransformer(snapshot)
+            logger.info(f"Memory-mapped {model_name} weights from {snapshot}")
+            return model
+        except Exception as e:
+            logger.warning(
+                f"Memory-mapped load of {model_name} failed ({e}) — "
+                "falling back to the stock loader"
+            )
+
+    phases["weights"] = 0.0
+    with weights_hook(phases):
+        return SentenceTransformer(model_name)
+
+
+def _load_quantized(model_name: str) -> SentenceTransformer:
+    from sentence_transformers import SentenceTransformer
+
+    file_name = f"onnx/model_qint8_{EMBEDDING_ONNX_QUANTIZATION}.onnx"
+
+    try:
+        return SentenceTransformer(
+            model_name, backend="onnx", model_kwargs={"file_name": file_name}
+        )
+    except Exception as e:
+        logger.warning(
+            f"No pre-quantized graph {file_name} for {model_name} ({e}) — "
+            f"quantizing locally into {EMBEDDING_ONNX_EXPORT_DIR}"
+        )
+
+    # Only needed on this path, and it pulls in optimum.
+    from sentence_transformers import export_dynamic_quantized_onnx_model
+
+    export_dir = os.path.join(EMBEDDING_ONNX_EXPORT_DIR, model_name.replace("/", "__"))
+    if not os.path.exists(os.path.join(export_dir, file_name)):
+        fp32 = SentenceTransformer(model_name, backend="onnx")
+        fp32.save(export_dir)
+        export_dynamic_quantized_onnx_model(
+            fp32, EMBEDDING_ONNX_QUANTIZATION, export_dir
+        )
+
+    return SentenceTransformer(
+        export_dir, backend="onnx", model_kwargs={"file_name": file_name}
+    )
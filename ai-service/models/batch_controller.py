@@ -0,0 +1,111 @@
+"""
+Adaptive forward-pass sizing for the encoder.
+
+Responsibility: decide how many padded tokens one forward pass may hold, so
+a pass takes about EMBEDDING_BATCH_TARGET_MS on this host.
+
+A fixed EMBEDDING_BATCH_SIZE is wrong at both ends. Thirty-two 8-token
+skill names are a trivially small pass. Thirty-two 384-token requirement
+paragraphs are a pass that holds up every caller queued behind it. Either
+way the right number depends on how many cores the node has. Forward-pass
+cost scales with padded tokens (texts × padded length), so the controller
+budgets tokens instead of texts. plan_buckets turns the budget into texts
+per pass for each length bucket.
+
+WHAT THIS MODULE DOES:
+    - Keeps an exponentially weighted estimate of seconds per padded token
+      from every forward pass's (padded tokens, wall time)
+    - Sets the token budget to target latency / that cost, clamped to
+      [EMBEDDING_BATCH_MIN_TOKENS, EMBEDDING_BATCH_MAX_TOKENS] and moving
+      at most a factor of _MAX_STEP per pass so one noisy pass cannot swing it
+    - Publishes the budget and the observed throughput as gauges
+
+WHAT THIS MODULE DOES NOT DO:
+    - No bucketing — models/length_buckets.py plans the passes
+    - No timing of its own — EmbeddingModel._forward reports each pass
+
+Thread-safe: inline encodes from several request threads report passes
+concurrently. Passes that ran concurrently are slower, so the budget
+shrinks under contention — the behaviour the target latency asks for.
+"""
+
+import os
+import threading
+from typing import Optional
+
+from metrics.encoder_metrics import record_batch_budget
+
+EMBEDDING_ADAPTIVE_BATCH = (
+    os.environ.get("EMBEDDING_ADAPTIVE_BATCH", "true").lower() == "true"
+)
+EMBEDDING_BATCH_TARGET_MS = float(os.environ.get("EMBEDDING_BATCH_TARGET_MS", "250"))
+EMBEDDING_BATCH_MIN_TOKENS = int(os.environ.get("EMBEDDING_BATCH_MIN_TOKENS", "512"))
+EMBEDDING_BATCH_MAX_TOKENS = int(os.environ.get("EMBEDDING_BATCH_MAX_TOKENS", "32768"))
+# Upper bound on texts per pass when the budget would allow more — keeps
+# a pass of 8-token skill names from growing into thousands of rows.
+EMBEDDING_BATCH_MAX_TEXTS = int(os.environ.get("EMBEDDING_BATCH_MAX_TEXTS", "256"))
+
+# Starting budget: 32 texts at the 128-token bucket, the old fixed setting.
+_INITIAL_TOKENS = 4096
+# Weight of a full-budget pass in the cost estimate.
+_SMOOTHING = 0.3
+# Largest factor the budget moves by after one pass.
+_MAX_STEP = 1.5
+
+
+class BatchSizeController:
+    """
+    Online token-budget controller.
+
+    Args:
+        target_latency_s: Wall time one forward pass should take.
+        min_tokens:       Floor for the budget.
+        max_tokens:       Ceiling for the budget.
+        initial_tokens:   Budget before the first observation.
+    """
+
+    def __init__(
+        self,
+        target_latency_s: float = EMBEDDING_BATCH_TARGET_MS / 1000,
+        min_tokens: int = EMBEDDING_BATCH_MIN_TOKENS,
+        max_tokens: int = EMBEDDING_BATCH_MAX_TOKENS,
+        initial_tokens: int = _INITIAL_TOKENS,
+    ):
+        self._target = target_latency_s
+        self._min = max(1, min_tokens)
+        self._max = max(self._min, max_tokens)
+        self._budget = min(max(initial_tokens, self._min), self._max)
+        self._cost: Optional[float] = None  # seconds per padded token
+        self._lock = threading.Lock()
+        record_batch_budget(self._budget, None)
+
+    @property
+    def token_budget(self) -> int:
+        """Max padded tokens the next forward pass may hold."""
+        return self._budget
+
+    def observe(self, padded_tokens: int, seconds: float) -> None:
+        """
+        Fold one forward pass into the cost estimate and move the budget.
+
+        A pass much smaller than the budget (a lone short text) carries a
+        fixed overhead that overstates the per-token cost, so each pass
+        counts in proportion to how much of the budget it filled.
+        """
+        if padded_tokens <= 0 or seconds <= 0:
+            return
+
+        with self._lock:
+            cost = seconds / padded_tokens
+            if self._cost is None:
+                self._cost = cost
+            else:
+                weight = _SMOOTHING * min(1.0, padded_tokens / self._budget)
+                self._cost += weight * (cost - self._cost)
+
+            wanted = self._target / self._cost
+            step = min(max(wanted, self._budget / _MAX_STEP), self._budget * _MAX_STEP)
+            self._budget = int(min(max(step, self._min), self._max))
+            budget, throughput = self._budget, 1 / self._cost
+
+        record_batch_budget(budget, throughput)
@@ -0,0 +1,84 @@
+"""
+Canonical text forms for encoder inputs.
+
+Responsibility: make trivially different spellings of the same term —
+"Python", "python ", "PYTHON", "Python 3" — one cache key, one doc-map key
+and one model call.
+
+Two strengths:
+    fold_text()     Unicode NFKC + whitespace collapse. Meaning-preserving for
+                    any text, so the embedding cache / store key every input
+                    by it.
+    canonicalize()  fold_text() + case folding + optional version-suffix
+                    stripping. For short term-like inputs (skill and
+                    certification names) only — never for prose.
+
+Case folding costs nothing in embedding quality: the all-mpnet-base-v2
+tokenizer lowercases its input anyway, so "Python" and "python" already
+produce the same vector — they just used to pay for it twice.
+
+Version suffixes ("Python 3.11", "Angular v15", "Java 17") are stripped when
+EMBEDDING_CANONICAL_STRIP_VERSIONS is true (default). Only a trailing one- or
+two-digit major (with optional .minor / .x / +) counts as a version, so
+"ISO 27001" and "Office 365" keep their numbers; terms listed in
+EMBEDDING_CANONICAL_KEEP_VERSIONS (canonical spelling, comma-separated)
+are never stripped.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import unicodedata
+from typing import Optional
+
+EMBEDDING_CANONICAL_STRIP_VERSIONS = (
+    os.environ.get("EMBEDDING_CANONICAL_STRIP_VERSIONS", "true").lower() == "true"
+)
+EMBEDDING_CANONICAL_KEEP_VERSIONS = frozenset(
+    term.strip().casefold()
+    for term in os.environ.get(
+        "EMBEDDING_CANONICAL_KEEP_VERSIONS", "web 2.0,web 3.0"
+    ).split(",")
+    if term.strip()
+)
+
+_VERSION_SUFFIX = re.compile(r"\s+v?\d{1,2}(?:\.\d+)*(?:\.x|\+)?$")
+
+
+def fold_text(text: str) -> str:
+    """NFKC-normalize and collapse whitespace."""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+def canonicalize(text: str, strip_versions: Optional[bool] = None) -> str:
+    """
+    Canonical form of a term. strip_versions defaults to
+    EMBEDDING_CANONICAL_STRIP_VERSIONS.
+
+    Never returns "" for a non-blank input — a term that is nothing but a
+    version ("3.11") keeps it.
+    """
+    folded = fold_text(text).casefold()
+
+    if strip_versions is None:
+        strip_versions = EMBEDDING_CANONICAL_STRIP_VERSIONS
+    if not strip_versions or folded in EMBEDDING_CANONICAL_KEEP_VERSIONS:
+        return folded
+
+    return _VERSION_SUFFIX.sub("", folded) or folded
+
+
+def dedupe_canonical(texts: list[str]) -> dict[str, list[str]]:
+    """
+    Group texts by canonical form, in first-seen order.
+
+    Returns:
+        { canonical form: the distinct original spellings that map to it }
+    """
+    groups: dict[str, list[str]] = {}
+    for text in texts:
+        spellings = groups.setdefault(canonicalize(text), [])
+        if text not in spellings:
+            spellings.append(text)
+    return groups
@@ -0,0 +1,103 @@
+"""
+Token-aware chunking of over-long encoder inputs.
+
+Responsibility: split a text that exceeds the model's max sequence length
+into pieces that each fit, so nothing past the limit is silently truncated.
+The caller encodes every chunk and mean-pools them back per source text.
+
+Split preference, coarsest first:
+    1. sentence boundaries  (. ! ? ; or a newline)
+    2. clause boundaries    (,) — responsibility lists are comma-joined
+    3. word windows         — last resort for one enormous run-on clause
+
+Adjacent pieces are then packed greedily into chunks of at most `budget`
+tokens, so a long text becomes as few forward-pass rows as possible.
+
+WHAT THIS MODULE DOES NOT DO:
+    - No tokenization of its own — callers pass count_tokens, a batched
+      callable(list[str]) → list[int] of token counts without special tokens
+    - No model calls, no pooling (models/embeddings.py)
+
+Pure functions — no torch, no model.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import Callable
+
+CountTokens = Callable[[list[str]], list[int]]
+
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?;])\s+|\s*\n+\s*")
+_CLAUSE_BREAK = re.compile(r"(?<=,)\s+")
+
+
+def split_sentences(text: str) -> list[str]:
+    return [s.strip() for s in _SENTENCE_BREAK.split(text) if s.strip()]
+
+
+def chunk_text(text: str, budget: int, count_tokens: CountTokens) -> list[str]:
+    """
+    Split text into chunks of at most `budget` tokens (excluding special
+    tokens), breaking on the coarsest boundary that fits.
+
+    Returns:
+        [text] unchanged when it already fits; otherwise ≥ 1 chunks in order.
+    """
+    budget = max(1, budget)
+    pieces = _fit(split_sentences(text) or [text], budget, count_tokens)
+    return _pack(pieces, budget)
+
+
+def _fit(
+    pieces: list[str], budget: int, count_tokens: CountTokens
+) -> list[tuple[str, int]]:
+    """Break every piece over budget into smaller ones; keep token counts."""
+    fitted: list[tuple[str, int]] = []
+
+    for piece, tokens in zip(pieces, count_tokens(pieces)):
+        if tokens <= budget:
+            fitted.append((piece, tokens))
+            continue
+
+        clauses = [c for c in _CLAUSE_BREAK.split(piece) if c.strip()]
+        if len(clauses) > 1:
+            fitted.extend(_fit(clauses, budget, count_tokens))
+        else:
+            fitted.extend(_word_windows(piece, tokens, budget))
+
+    return fitted
+
+
+def _word_windows(piece: str, tokens: int, budget: int) -> list[tuple[str, int]]:
+    """Split on whitespace into windows sized by the piece's tokens-per-word."""
+    words = piece.split()
+    per_window = max(1, len(words) * budget // tokens)
+    return [
+        (
+            " ".join(words[i : i + per_window]),
+            min(
+                budget, math.ceil(tokens * len(words[i : i + per_window]) / len(words))
+            ),
+        )
+        for i in range(0, len(words), per_window)
+    ]
+
+
+def _pack(pieces: list[tuple[str, int]], budget: int) -> list[str]:
+    """Greedily join adjacent pieces while the running token count fits."""
+    chunks: list[str] = []
+    current: list[str] = []
+    used = 0
+
+    for piece, tokens in pieces:
+        if current and used + tokens > budget:
+            chunks.append(" ".join(current))
+            current, used = [], 0
+        current.append(piece)
+        used += tokens
+
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
@@ -0,0 +1,90 @@
+"""
+Request deadlines for encoder work.
+
+Responsibility: let a route say "nobody wants this result after time T, or
+after the client hangs up" without threading a parameter through every
+pipeline, task and embedding util between the handler and the model.
+
+Like the priority lane (models/priority.py), the deadline travels in a
+ContextVar. Routes set it around their handler with request_deadline();
+the micro-batcher captures it at submit() and drops the request before its
+forward pass once it is past, and run_pipeline skips sections that have
+not started. Either raises DeadlineExceeded in the caller.
+
+Work without a deadline never expires — CLI commands and scripts are
+unaffected.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import StrEnum
+from typing import Generator, Optional
+
+
+class SkipReason(StrEnum):
+    EXPIRED = "expired"  # the deadline passed
+    CANCELLED = "cancelled"  # the client disconnected
+
+
+class DeadlineExceeded(RuntimeError):
+    """The request this work belongs to expired or was cancelled."""
+
+    def __init__(self, reason: SkipReason):
+        super().__init__(f"request {reason} before its encoder work ran")
+        self.reason = reason
+
+
+class Deadline:
+    """
+    A point in time after which a request's work is worthless, plus a flag
+    for cancelling it early. Thread-safe: routes cancel it from the event
+    loop while pipeline threads read it.
+
+    Args:
+        timeout_s: Seconds from now. None → only cancel() ends it.
+    """
+
+    def __init__(self, timeout_s: Optional[float] = None):
+        self._expires_at = (
+            None if timeout_s is None else time.monotonic() + max(0.0, timeout_s)
+        )
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    @property
+    def reason(self) -> Optional[SkipReason]:
+        """Why the work should be dropped — None while it is still wanted."""
+        if self._cancelled.is_set():
+            return SkipReason.CANCELLED
+        if self._expires_at is not None and time.monotonic() >= self._expires_at:
+            return SkipReason.EXPIRED
+        return None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left (0 once past), or None without a time limit."""
+        if self._expires_at is None:
+            return None
+        return max(0.0, self._expires_at - time.monotonic())
+
+
+_current: ContextVar[Optional[Deadline]] = ContextVar("encode_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current.get()
+
+
+@contextmanager
+def request_deadline(deadline: Optional[Deadline]) -> Generator[None, None, None]:
+    """Run the enclosed block's encoder calls under the given deadline."""
+    token = _current.set(deadline)
+    try:
+        yield
+    finally:
+        _current.reset(token)
@@ -0,0 +1,134 @@
+"""
+Content-hash LRU cache in front of the embedding model.
+
+Responsibility: remember raw encoder rows for texts we have already seen,
+so repeated skill names, certification names, experience levels and
+requirement strings never pay for a second forward pass.
+
+WHAT THIS MODULE DOES:
+    - Keys rows by (model name, sha1 of the NFKC / whitespace-folded text —
+      models/canonical.py)
+    - Evicts least-recently-used rows once the stored tensor bytes exceed
+      max_bytes (byte-based, not entry-based — rows differ in width per model)
+    - Records hit / miss / eviction counters and a resident-bytes gauge
+
+WHAT THIS MODULE DOES NOT DO:
+    - No model calls — EmbeddingModel decides what to do with misses
+    - No persistence — the cache dies with the process
+
+Rows are stored unnormalized, exactly as the forward pass produced them,
+so encode() and encode_batch() can share entries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+
+from metrics.encoder_metrics import record_cache_lookup, record_cache_evictions
+from models.canonical import fold_text
+
+if TYPE_CHECKING:
+    import torch
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_ENABLED = (
+    os.environ.get("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+)
+EMBEDDING_CACHE_MAX_BYTES = int(
+    os.environ.get("EMBEDDING_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+)
+
+CacheKey = tuple[str, str]
+
+
+def normalize_cache_text(text: str) -> str:
+    """Unicode- and whitespace-fold so trivially different spellings share one key."""
+    return fold_text(text)
+
+
+def make_cache_key(model_name: str, text: str) -> CacheKey:
+    digest = hashlib.sha1(normalize_cache_text(text).encode("utf-8")).hexdigest()
+    return model_name, digest
+
+
+class EmbeddingCache:
+    """
+    Bounded, thread-safe LRU of encoder rows.
+
+    Args:
+        max_bytes: Upper bound on the summed nbytes of stored tensors.
+                   A single row larger than this is never stored.
+    """
+
+    def __init__(self, max_bytes: int = EMBEDDING_CACHE_MAX_BYTES):
+        self.max_bytes = max(0, max_bytes)
+        self._rows: OrderedDict[CacheKey, torch.Tensor] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def get_many(
+        self, model_name: str, texts: list[str]
+    ) -> list[Optional[torch.Tensor]]:
+        """Look up every text; None marks a miss. Hits are promoted to MRU."""
+        keys = [make_cache_key(model_name, t) for t in texts]
+        found: list[Optional[torch.Tensor]] = []
+
+        with self._lock:
+            for key in keys:
+                row = self._rows.get(key)
+                if row is not None:
+                    self._rows.move_to_end(key)
+                found.append(row)
+
+        hits = sum(1 for row in found if row is not None)
+        record_cache_lookup(hits=hits, misses=len(found) - hits)
+        return found
+
+    def put_many(self, model_name: str, texts: list[str], rows: torch.Tensor) -> None:
+        """Store one row per text, evicting LRU entries to stay under max_bytes."""
+        evicted = 0
+
+        with self._lock:
+            for text, row in zip(texts, rows):
+                # clone() so a cached row doesn't pin the whole batch tensor
+                # it was sliced from (and so nbytes reflects what we hold).
+                row = row.detach().clone()
+                size = row.element_size() * row.numel()
+                if size > self.max_bytes:
+                    continue
+
+                key = make_cache_key(model_name, text)
+                previous = self._rows.pop(key, None)
+                if previous is not None:
+                    self._bytes -= previous.element_size() * previous.numel()
+
+                self._rows[key] = row
+                self._bytes += size
+
+                while self._bytes > self.max_bytes and self._rows:
+                    _, old = self._rows.popitem(last=False)
+                    self._bytes -= old.element_size() * old.numel()
+                    evicted += 1
+
+            resident = self._bytes
+
+        record_cache_evictions(evicted, resident_bytes=resident)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rows.clear()
+            self._bytes = 0
+        record_cache_evictions(0, resident_bytes=0)
@@ -0,0 +1,382 @@
+"""
+Persistent, memory-mapped embedding store shared by every worker on a host.
+
+Responsibility: keep encoder rows on local disk so a restarted (or freshly
+forked) worker is warm immediately, and so N uvicorn workers share one copy
+of the cache instead of each rebuilding its own.
+
+On-disk layout (inside EMBEDDING_STORE_DIR):
+
+    rows.f32    append-only raw little-endian float32 rows, back to back
+    index.bin   append-only fixed-size records, one per row:
+                  sha1(text)    20 bytes
+                  model tag      8 bytes   (sha1(model name)[:8])
+                  row offset     u64       (bytes into rows.f32)
+                  dim            u32
+    .lock       flock() target — serializes appends and compaction
+
+WHAT THIS MODULE DOES:
+    - Loads index.bin into a dict on open; tails new records on demand
+    - Serves rows as zero-copy tensors over a private mmap of rows.f32
+    - Appends under an exclusive flock, row bytes first, index record last,
+      so a reader that sees a complete record always sees its row
+    - compact(): rewrites both files keeping only the given model versions
+
+WHAT THIS MODULE DOES NOT DO:
+    - No model calls, no eviction — the store only grows until compacted
+    - No cross-host sharing — flock and mmap are single-host primitives
+
+Compaction swaps both files by rename. Open stores notice the new inode on
+their next refresh and reload, so it is safe (if briefly slower) to compact
+while workers are serving.
+
+CLI:
+    python -m models.embedding_store compact --keep all-mpnet-base-v2
+    python -m models.embedding_store stats
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Generator, Optional
+
+from models.embedding_cache import normalize_cache_text
+
+if TYPE_CHECKING:
+    import torch
+
+try:  # POSIX only — on Windows dev boxes the store runs single-process
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_STORE_DIR = os.environ.get("EMBEDDING_STORE_DIR", "")
+
+_ROWS_FILE = "rows.f32"
+_INDEX_FILE = "index.bin"
+_LOCK_FILE = ".lock"
+
+_RECORD = struct.Struct("<20s8sQI")
+_FLOAT_BYTES = 4
+
+StoreKey = tuple[bytes, bytes]  # (model tag, text digest)
+
+
+def _model_tag(model_name: str) -> bytes:
+    return hashlib.sha1(model_name.encode("utf-8")).digest()[:8]
+
+
+def _text_digest(text: str) -> bytes:
+    return hashlib.sha1(normalize_cache_text(text).encode("utf-8")).digest()
+
+
+def _row_end(entry: tuple[int, int]) -> int:
+    offset, dim = entry
+    return offset + dim * _FLOAT_BYTES
+
+
+class EmbeddingStore:
+    """
+    Append-only float32 vector store over an mmap'd row file.
+
+    Args:
+        directory: Where rows.f32 / index.bin live. Created if missing.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+        self._rows_path = os.path.join(directory, _ROWS_FILE)
+        self._index_path = os.path.join(directory, _INDEX_FILE)
+        self._lock_path = os.path.join(directory, _LOCK_FILE)
+
+        for path in (self._rows_path, self._index_path, self._lock_path):
+            open(path, "ab").close()
+
+        self._index: dict[StoreKey, tuple[int, int]] = {}
+        self._index_pos = 0
+        self._index_inode: Optional[int] = None
+        self._rows_map: Optional[mmap.mmap] = None
+        self._rows_mapped = 0
+        self._lock = threading.Lock()
+
+        with self._lock, self._file_lock(exclusive=False):
+            self._reload_locked()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    # ── Reads ─────────────────────────────────────────────────────────────────
+
+    def get_many(
+        self, model_name: str, texts: list[str]
+    ) -> list[Optional[torch.Tensor]]:
+        """Zero-copy lookup; None marks a miss. Tails the index once on a miss."""
+        tag = _model_tag(model_name)
+        keys = [(tag, _text_digest(t)) for t in texts]
+
+        with self._lock:
+            if any(key not in self._index for key in keys):
+                self._sync_locked()
+            return [self._row_locked(key) for key in keys]
+
+    def _row_locked(self, key: StoreKey) -> Optional[torch.Tensor]:
+        entry = self._index.get(key)
+        if entry is not None and _row_end(entry) > self._rows_mapped:
+            # Appended (by us or a sibling) since the last map — re-sync.
+            self._sync_locked()
+            entry = self._index.get(key)
+
+        if (
+            entry is None
+            or self._rows_map is None
+            or _row_end(entry) > self._rows_mapped
+        ):
+            return None
+
+        import torch
+
+        offset, dim = entry
+        # Private (ACCESS_COPY) mapping: the tensor is a view over the shared
+        # page cache until somebody writes to it, which nobody should.
+        return torch.frombuffer(
+            self._rows_map, dtype=torch.float32, count=dim, offset=offset
+        )
+
+    # ── Writes ────────────────────────────────────────────────────────────────
+
+    def put_many(self, model_name: str, texts: list[str], rows: torch.Tensor) -> None:
+        """Append rows not already present. Safe across processes on one host."""
+        import torch
+
+        tag = _model_tag(model_name)
+
+        with self._lock, self._file_lock(exclusive=True):
+            # Another worker may have compacted or appended since we last looked.
+            self._refresh_locked()
+            # Bytes past the last whole record can only be a crashed writer's
+            # torn append — drop them so our records stay aligned.
+            if os.path.getsize(self._index_path) > self._index_pos:
+                os.truncate(self._index_path, self._index_pos)
+
+            with (
+                open(self._rows_path, "ab") as rows_f,
+                open(self._index_path, "ab") as index_f,
+            ):
+                offset = rows_f.seek(0, os.SEEK_END)
+                records = []
+
+                for text, row in zip(texts, rows):
+                    key = (tag, _text_digest(text))
+                    if key in self._index:
+                        continue
+                    data = row.detach().cpu().to(torch.float32).contiguous()
+                    payload = data.numpy().astype("<f4", copy=False).tobytes()
+                    rows_f.write(payload)
+                    records.append((key, offset, data.numel()))
+                    self._index[key] = (offset, data.numel())
+                    offset += len(payload)
+
+                if not records:
+                    return
+
+                # Rows must be durable in the page cache before any reader
+                # can see an index record pointing at them.
+                rows_f.flush()
+                index_f.write(
+                    b"".join(
+                        _RECORD.pack(digest, model_tag, off, dim)
+                        for (model_tag, digest), off, dim in records
+                    )
+                )
+                index_f.flush()
+                self._index_pos = index_f.tell()
+
+    # ── Maintenance ───────────────────────────────────────────────────────────
+
+    def compact(self, keep_models: list[str]) -> dict:
+        """
+        Rewrite the store keeping only rows for the given model names.
+
+        Returns:
+            { "kept": int, "dropped": int, "bytes_before": int, "bytes_after": int }
+        """
+        keep_tags = {_model_tag(name) for name in keep_models}
+
+        with self._lock, self._file_lock(exclusive=True):
+            self._refresh_locked()
+            bytes_before = os.path.getsize(self._rows_path)
+
+            tmp_rows = self._rows_path + ".compact"
+            tmp_index = self._index_path + ".compact"
+            kept = dropped = 0
+
+            with (
+                open(self._rows_path, "rb") as src,
+                open(tmp_rows, "wb") as rows_f,
+                open(tmp_index, "wb") as index_f,
+            ):
+                for (tag, digest), (offset, dim) in self._index.items():
+                    if tag not in keep_tags:
+                        dropped += 1
+                        continue
+                    src.seek(offset)
+                    new_offset = rows_f.tell()
+                    rows_f.write(src.read(dim * _FLOAT_BYTES))
+                    index_f.write(_RECORD.pack(digest, tag, new_offset, dim))
+                    kept += 1
+                rows_f.flush()
+                os.fsync(rows_f.fileno())
+                index_f.flush()
+                os.fsync(index_f.fileno())
+
+            # Rows first: a reader that races in between sees the old index
+            # (pointing into the old inode it still has mapped) or the new
+            # one — never new index offsets against the old row file.
+            os.replace(tmp_rows, self._rows_path)
+            os.replace(tmp_index, self._index_path)
+            self._reload_locked()
+
+            return {
+                "kept": kept,
+                "dropped": dropped,
+                "bytes_before": bytes_before,
+                "bytes_after": os.path.getsize(self._rows_path),
+            }
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._sync_locked()
+            per_model: dict[str, int] = {}
+            for tag, _ in self._index:
+                per_model[tag.hex()] = per_model.get(tag.hex(), 0) + 1
+            return {
+                "rows": len(self._index),
+                "bytes": os.path.getsize(self._rows_path),
+                "rows_by_model_tag": per_model,
+            }
+
+    # ── Internals ─────────────────────────────────────────────────────────────
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool) -> Generator[None, None, None]:
+        """Shared for readers re-syncing, exclusive for appends and compaction."""
+        with open(self._lock_path, "ab") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _sync_locked(self) -> None:
+        # The shared flock keeps compaction's two renames atomic from our
+        # point of view: we see both old files or both new ones.
+        with self._file_lock(exclusive=False):
+            self._refresh_locked()
+
+    def _refresh_locked(self) -> None:
+        """Reload on compaction (inode change), else read any new index records."""
+        if os.stat(self._index_path).st_ino != self._index_inode:
+            self._reload_locked()
+            return
+        self._tail_index_locked()
+        if os.path.getsize(self._rows_path) > self._rows_mapped:
+            self._remap_locked()
+
+    def _reload_locked(self) -> None:
+        self._index = {}
+        self._index_pos = 0
+        self._index_inode = os.stat(self._index_path).st_ino
+        self._rows_map = None
+        self._rows_mapped = 0
+        self._tail_index_locked()
+        self._remap_locked()
+
+    def _tail_index_locked(self) -> None:
+        with open(self._index_path, "rb") as f:
+            f.seek(self._index_pos)
+            data = f.read()
+
+        usable = len(data) - len(data) % _RECORD.size  # ignore a torn tail write
+        for start in range(0, usable, _RECORD.size):
+            digest, tag, offset, dim = _RECORD.unpack_from(data, start)
+            self._index[(tag, digest)] = (offset, dim)
+        self._index_pos += usable
+
+    def _remap_locked(self) -> None:
+        size = os.path.getsize(self._rows_path)
+        if size == 0:
+            return
+        with open(self._rows_path, "rb") as f:
+            # Old maps are not closed: tensors handed out earlier may still
+            # reference them. They are released once those tensors are gone.
+            self._rows_map = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_COPY)
+        self._rows_mapped = size
+
+
+_store: Optional[EmbeddingStore] = None
+
+
+def get_embedding_store() -> Optional[EmbeddingStore]:
+    """Process-wide store for EMBEDDING_STORE_DIR, or None when unset/unusable."""
+    global _store
+    if _store is None and EMBEDDING_STORE_DIR:
+        try:
+            _store = EmbeddingStore(EMBEDDING_STORE_DIR)
+            logger.info(
+                f"[EmbeddingStore] opened {EMBEDDING_STORE_DIR} ({len(_store)} rows)"
+            )
+        except OSError:
+            logger.exception(
+                f"[EmbeddingStore] could not open {EMBEDDING_STORE_DIR} — disabled"
+            )
+    return _store
+
+
+# ── CLI ───────────────────────────────────────────────────────────────────────
+
+
+def _main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m models.embedding_store")
+    parser.add_argument("--dir", default=EMBEDDING_STORE_DIR, help="store directory")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    compact = sub.add_parser("compact", help="drop rows from stale model versions")
+    compact.add_argument(
+        "--keep",
+        action="append",
+        required=True,
+        help="model name to keep (repeatable)",
+    )
+    sub.add_parser("stats", help="print row counts per model tag")
+
+    args = parser.parse_args(argv)
+    if not args.dir:
+        parser.error("set EMBEDDING_STORE_DIR or pass --dir")
+
+    store = EmbeddingStore(args.dir)
+    if args.command == "compact":
+        result = store.compact(args.keep)
+    else:
+        result = store.stats()
+
+    print(json.dumps(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
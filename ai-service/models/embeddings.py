@@ -1,69 +1,432 @@
-"""Embedding model management."""
+"""
+Embedding model management.
 
-import torch
-from sentence_transformers import SentenceTransformer
-from typing import Optional, List
+Every vector returned by encode() / encode_batch() / encode_chunked() is
+L2-normalized (see the vector contract in utils/tensor_utils.py). Cache and
+store tiers hold raw rows; normalization happens on the way out.
+
+encode_chunked() is for free-form paragraphs that may exceed the model's max
+sequence length: they are split on sentence boundaries (models/chunking.py)
+instead of being silently truncated.
+
+Failures return None — except DeadlineExceeded (models/deadline.py), which
+encode calls raise once the request they run under has expired or been
+cancelled, so its pipeline stops instead of encoding the next section.
+
+Nothing heavy happens at import: torch, transformers and sentence-transformers
+are imported, and the weights loaded, by load() — which app.py's lifespan
+calls at startup and every encode call makes on first use. Importing this
+module (every router does, through the handlers) costs milliseconds, so the
+salary / matching routes and the CLI commands that never encode never pay
+for the model stack.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Optional, List, cast
 import logging
 
+from models.backends import Backend, load_sentence_transformer, resolve_backend
+from models.batch_controller import (
+    EMBEDDING_ADAPTIVE_BATCH,
+    EMBEDDING_BATCH_MAX_TEXTS,
+    BatchSizeController,
+)
+from models.chunking import chunk_text
+from models.deadline import DeadlineExceeded, current_deadline
+from models.embedding_cache import EMBEDDING_CACHE_ENABLED, EmbeddingCache
+from models.embedding_store import EmbeddingStore, get_embedding_store
+from models.length_buckets import padding_waste, plan_buckets
+from models.micro_batcher import MICRO_BATCH_ENABLED, MicroBatcher
+from metrics.encoder_metrics import (
+    record_bucket_duration,
+    record_chunking,
+    record_padding_waste,
+    record_skipped_texts,
+)
+
+if TYPE_CHECKING:
+    import torch
+    from sentence_transformers import SentenceTransformer
+
 logger = logging.getLogger(__name__)
 
+# Max texts per padded forward pass (within one length bucket) when the
+# adaptive controller (models/batch_controller.py) is off.
+ENCODE_BATCH_SIZE = int(os.environ.get("EMBEDDING_BATCH_SIZE", "32"))
+
+
+# Model every request encodes with. Vectors are tagged with its
+# model_version; see models/migration.py for swapping it without a
+# stop-the-world recompute.
+EMBEDDING_MODEL = os.environ.get("EMBEDDING_MODEL", "all-mpnet-base-v2")
+
 
 class EmbeddingModel:
-    """Manages sentence embedding model as a singleton."""
+    """
+    Manages a sentence embedding model — one instance per model name, so the
+    serving model and a migration target (models/migration.py) can coexist.
+    """
 
-    _instance: Optional["EmbeddingModel"] = None  # type hint only
+    _instances: dict[str, EmbeddingModel] = {}
     _model: Optional[SentenceTransformer] = None
+    _model_name: str = "all-mpnet-base-v2"
+    _backend: Backend = "torch"
+    _batcher: Optional[MicroBatcher] = None
+    _cache: Optional[EmbeddingCache] = None
+    _store: Optional[EmbeddingStore] = None
+    _batch_controller: Optional[BatchSizeController] = None
+    _load_phases: dict[str, float] = {}
+    # Shared by every instance — weights_hook (models/weights.py) patches
+    # transformers process-wide while a load runs.
+    _load_lock = threading.Lock()
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    def __new__(cls, model_name: str = EMBEDDING_MODEL, *args, **kwargs):
+        if model_name not in cls._instances:
+            cls._instances[model_name] = super().__new__(cls)
+        return cls._instances[model_name]
 
-    def __init__(self, model_name: str = "all-mpnet-base-v2"):
+    def __init__(
+        self, model_name: str = EMBEDDING_MODEL, backend: Optional[str] = None
+    ):
+        # Cheap on purpose — the weights load in load() / on first encode.
         if self._model is None:
-            logger.info(f"Loading embedding model: {model_name}")
-            self._model = SentenceTransformer(model_name)
+            self._model_name = model_name
+            self._backend = resolve_backend(backend)
+
+    def load(self) -> None:
+        """
+        Load the weights and build the cache / store / batcher tiers.
+        Idempotent and thread-safe — concurrent first encodes load once.
+        """
+        if self._model is not None:
+            return
+
+        with self._load_lock:
+            if self._model is not None:
+                return
+
+            logger.info(
+                f"Loading embedding model: {self._model_name} (backend={self._backend})"
+            )
+            phases: dict[str, float] = {}
+            model = load_sentence_transformer(self._model_name, self._backend, phases)
+            self._load_phases = phases
+            if EMBEDDING_CACHE_ENABLED:
+                self._cache = EmbeddingCache()
+            # Shared on-disk tier behind the in-process cache — None unless
+            # EMBEDDING_STORE_DIR is set.
+            self._store = get_embedding_store()
+            # Sizes forward passes by padded tokens against a latency target
+            # instead of the fixed EMBEDDING_BATCH_SIZE.
+            if EMBEDDING_ADAPTIVE_BATCH:
+                self._batch_controller = BatchSizeController()
+            # Every encode / encode_batch from every request thread funnels
+            # through one queue so concurrent pipelines share forward passes.
+            if MICRO_BATCH_ENABLED:
+                self._batcher = MicroBatcher(self._forward)
+            # Last: is_loaded flips only once every tier exists.
+            self._model = model
+
+    def _ensure_loaded(self) -> bool:
+        """Load on first use. False (logged) when the weights cannot be loaded."""
+        if self._model is not None:
+            return True
+        try:
+            self.load()
+        except Exception:
+            logger.exception("Embedding model failed to load — cannot encode")
+            return False
+        return True
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._model is not None
+
+    @property
+    def load_phases(self) -> dict[str, float]:
+        """Seconds load() spent per phase (import / weights / tokenizer) — {} before it."""
+        return dict(self._load_phases)
+
+    @property
+    def model_name(self) -> str:
+        return self._model_name
 
-    def encode(self, text: str) -> Optional[torch.Tensor]:
+    @property
+    def backend(self) -> Backend:
+        return self._backend
+
+    @property
+    def model_version(self) -> str:
+        """
+        Namespace for cached rows, and the tag on every vector this service
+        emits. Quantized / exported backends drift slightly from torch, so
+        their rows never mix with the reference backend's.
+        """
+        if self._backend == "torch":
+            return self._model_name
+        return f"{self._model_name}+{self._backend}"
+
+    @property
+    def cache(self) -> Optional[EmbeddingCache]:
+        return self._cache
+
+    def encode(self, text: str, use_cache: bool = True) -> Optional[torch.Tensor]:
         if not text or not isinstance(text, str):
             logger.warning(f"Invalid text input: {text}")
             return None
 
-        if self._model is None:
-            # Should never happen post-__init__, but mypy can't prove that
-            # across instance boundaries, and a stale singleton reference
-            # during a failed reload is a real (if rare) failure mode.
-            logger.error("Embedding model is not loaded — cannot encode")
+        if not self._ensure_loaded():
             return None
 
+        import torch.nn.functional as F
+
         try:
-            embedding = self._model.encode(text, convert_to_numpy=True)
-            return torch.tensor(embedding, dtype=torch.float32)
+            return F.normalize(self._run([text], use_cache=use_cache)[0], p=2, dim=0)
+        except DeadlineExceeded:
+            raise  # the request is gone — abort its pipeline, not just this row
         except Exception as e:
             logger.error(f"Error generating embedding for text: {e}")
             return None
 
-    def encode_batch(self, texts: List[str]) -> Optional[torch.Tensor]:
+    def encode_batch(
+        self, texts: List[str], use_cache: bool = True
+    ) -> Optional[torch.Tensor]:
         if not texts:
             return None
 
-        if self._model is None:
-            logger.error("Embedding model is not loaded — cannot encode batch")
+        if not self._ensure_loaded():
             return None
 
+        import torch.nn.functional as F
+
         try:
-            embeddings = self._model.encode(
-                texts,
-                batch_size=32,  # true batch — one forward pass
-                convert_to_tensor=True,
-                show_progress_bar=False,
-                normalize_embeddings=True,  # cosine similarity becomes dot product — faster at match time
-            )
-            return embeddings.cpu()
+            return F.normalize(self._run(texts, use_cache=use_cache), p=2, dim=1)
+        except DeadlineExceeded:
+            raise  # the request is gone — abort its pipeline, not just this row
         except Exception as e:
             logger.error(f"Error generating batch embeddings: {e}")
             return None
 
+    def encode_chunked(
+        self, texts: List[str], use_cache: bool = True
+    ) -> Optional[torch.Tensor]:
+        """
+        encode_batch for texts that may exceed the model's max sequence length.
+
+        Over-long texts are split into chunks that fit; the chunks of every
+        text go through ONE batched encode together with the texts that fit
+        as-is, and each text's row is the re-normalized mean of its chunk
+        rows. Texts that fit produce exactly the row encode_batch would.
+
+        Returns:
+            (len(texts), D) unit-length tensor, or None on failure.
+        """
+        if not texts:
+            return None
+
+        if not self._ensure_loaded():
+            return None
+
+        import torch
+        import torch.nn.functional as F
+
+        try:
+            plan = self._plan_chunks(texts)
+            flat = [chunk for chunks in plan for chunk in chunks]
+            rows = F.normalize(self._run(flat, use_cache=use_cache), p=2, dim=1)
+
+            pooled = []
+            offset = 0
+            for chunks in plan:
+                pooled.append(rows[offset : offset + len(chunks)].mean(dim=0))
+                offset += len(chunks)
+            return F.normalize(torch.stack(pooled), p=2, dim=1)
+        except DeadlineExceeded:
+            raise  # the request is gone — abort its pipeline, not just this row
+        except Exception as e:
+            logger.error(f"Error generating chunked batch embeddings: {e}")
+            return None
+
+    def _plan_chunks(self, texts: List[str]) -> List[List[str]]:
+        """One chunk list per text — [text] itself when it already fits."""
+        lengths = self._token_counts(texts, special_tokens=True)
+        budget = self._max_length() - self._special_token_count()
+
+        plan: List[List[str]] = []
+        chunked: List[int] = []
+        for text, n in zip(texts, lengths):
+            if n <= self._max_length():
+                plan.append([text])
+                continue
+            chunks = chunk_text(
+                text, budget, lambda xs: self._token_counts(xs, special_tokens=False)
+            )
+            plan.append(chunks)
+            chunked.append(len(chunks))
+
+        record_chunking(lengths, chunked)
+        return plan
+
+    # ── Forward pass ──────────────────────────────────────────────────────────
+
+    def _run(self, texts: List[str], use_cache: bool = True) -> torch.Tensor:
+        """
+        Resolve rows tier by tier — in-process cache, then the shared on-disk
+        store, then the model for whatever is left (deduplicated) — and stitch
+        them back into the caller's order. Fresh rows are written to both
+        tiers. use_cache=False bypasses every tier — reads and writes.
+        """
+        import torch
+
+        if not use_cache:
+            return self._encode_uncached(texts)
+
+        rows: List[Optional[torch.Tensor]] = [None] * len(texts)
+
+        for tier in (self._cache, self._store):
+            pending = [i for i, row in enumerate(rows) if row is None]
+            if tier is None or not pending:
+                continue
+            found = tier.get_many(self.model_version, [texts[i] for i in pending])
+            for i, row in zip(pending, found):
+                rows[i] = row
+
+        missing = list(dict.fromkeys(t for t, row in zip(texts, rows) if row is None))
+
+        if missing:
+            fresh = self._encode_uncached(missing)
+            if self._cache is not None:
+                self._cache.put_many(self.model_version, missing, fresh)
+            if self._store is not None:
+                try:
+                    self._store.put_many(self.model_version, missing, fresh)
+                except OSError as e:
+                    # A full or read-only disk must never fail an encode.
+                    logger.error(f"Error appending to embedding store: {e}")
+            by_text = dict(zip(missing, fresh))
+            rows = [
+                row if row is not None else by_text[t] for t, row in zip(texts, rows)
+            ]
+
+        return torch.stack(cast("List[torch.Tensor]", rows))
+
+    def _encode_uncached(self, texts: List[str]) -> torch.Tensor:
+        """Route through the micro-batcher when enabled, else encode inline."""
+        if self._batcher is not None:
+            return self._batcher.encode(texts)
+        return self._forward(texts)
+
+    def _forward(self, texts: List[str]) -> torch.Tensor:
+        """
+        Raw forward passes → (N, D) float32 CPU tensor, unnormalized, in the
+        caller's order. Inputs are grouped into token-length buckets so short
+        skill names never pad out to the length of a requirements paragraph.
+        Raises on failure so the micro-batcher can fail every caller's future.
+        """
+        if self._model is None:
+            raise RuntimeError("Embedding model is not loaded")
+
+        import torch
+
+        lengths = self._token_lengths(texts)
+        controller = self._batch_controller
+        plan = plan_buckets(
+            lengths,
+            max_length=self._max_length(),
+            batch_size=EMBEDDING_BATCH_MAX_TEXTS if controller else ENCODE_BATCH_SIZE,
+            token_budget=controller.token_budget if controller else None,
+        )
+        record_padding_waste(padding_waste(lengths, plan))
+
+        # Set only on the inline path — the micro-batcher's worker thread
+        # runs outside any request context and checks deadlines itself.
+        deadline = current_deadline()
+
+        out: Optional[torch.Tensor] = None
+        for n, bucket in enumerate(plan):
+            reason = deadline.reason if deadline is not None else None
+            if reason is not None:
+                record_skipped_texts(
+                    "forward", reason, sum(len(b.indices) for b in plan[n:])
+                )
+                raise DeadlineExceeded(reason)
+
+            t0 = time.perf_counter()
+            rows = self._encode_raw([texts[i] for i in bucket.indices])
+            elapsed = time.perf_counter() - t0
+            record_bucket_duration(bucket.label, elapsed)
+            if controller is not None:
+                controller.observe(bucket.padded_length * len(bucket.indices), elapsed)
+
+            if out is None:
+                out = torch.empty(len(texts), rows.shape[1], dtype=torch.float32)
+            out[torch.tensor(bucket.indices)] = rows
+
+        if out is None:
+            raise RuntimeError("Encode produced no rows")
+        return out
+
+    def _encode_raw(self, texts: List[str]) -> torch.Tensor:
+        """Exactly one padded forward pass over texts."""
+        if self._model is None:
+            raise RuntimeError("Embedding model is not loaded")
+
+        import torch
+
+        embeddings = self._model.encode(
+            texts,
+            batch_size=len(texts),  # one bucket = one forward pass
+            convert_to_tensor=True,
+            show_progress_bar=False,
+            normalize_embeddings=False,
+        )
+        return embeddings.detach().cpu().to(torch.float32)
+
+    def _token_lengths(self, texts: List[str]) -> List[int]:
+        """Post-truncation token counts (incl. special tokens) per text."""
+        if self._model is None:
+            raise RuntimeError("Embedding model is not loaded")
+
+        encoded = self._model.tokenizer(
+            texts,
+            add_special_tokens=True,
+            truncation=True,
+            max_length=self._max_length(),
+        )
+        return [len(ids) for ids in encoded["input_ids"]]
+
+    def _token_counts(self, texts: List[str], special_tokens: bool) -> List[int]:
+        """Untruncated token counts per text — how long the input really is."""
+        if self._model is None:
+            raise RuntimeError("Embedding model is not loaded")
+
+        encoded = self._model.tokenizer(
+            texts,
+            add_special_tokens=special_tokens,
+            truncation=False,
+            verbose=False,  # no "sequence length is longer than" warning
+        )
+        return [len(ids) for ids in encoded["input_ids"]]
+
+    def _special_token_count(self) -> int:
+        """Tokens the tokenizer adds around every input ([CLS] / [SEP] ...)."""
+        if self._model is None:
+            raise RuntimeError("Embedding model is not loaded")
+        return self._model.tokenizer.num_special_tokens_to_add(pair=False)
+
+    @property
+    def max_length(self) -> int:
+        """Token limit per input — longer texts are truncated to it."""
+        return self._max_length()
+
+    def _max_length(self) -> int:
+        # Unset on some exported models — 512 is the transformer default.
+        return (self._model.max_seq_length if self._model else None) or 512
+
 
-# Singleton instance
+# Serving model
 embedding_model = EmbeddingModel()
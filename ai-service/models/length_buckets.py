@@ -0,0 +1,93 @@
+"""
+Token-length bucketing for encoder forward passes.
+
+Responsibility: decide which texts share a padded batch. A batch pads every
+row to its longest member, so mixing a 3-token skill name with a 300-token
+requirement paragraph spends ~99% of that row's compute on padding.
+
+WHAT THIS MODULE DOES:
+    - Assigns each text to the smallest length bucket that fits it
+    - Splits each bucket into chunks of at most batch_size texts, or of at
+      most token_budget padded tokens when one is given
+    - Reports the padding-waste ratio of a plan
+
+WHAT THIS MODULE DOES NOT DO:
+    - No tokenization or model calls (models/embeddings.py)
+
+Pure functions over token lengths — no torch, no model.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+# Upper token bounds per bucket; the model's max_seq_length caps the last one.
+BUCKET_BOUNDARIES: tuple[int, ...] = (16, 32, 64, 128, 256)
+
+
+@dataclass(frozen=True)
+class Bucket:
+    """One padded forward pass: which inputs it holds and how long it pads to."""
+
+    label: str  # upper token bound, e.g. "32" — used as a Prometheus label
+    indices: list[int]  # positions in the caller's original text list
+    padded_length: int  # longest member — every row is padded to this
+
+
+def plan_buckets(
+    lengths: list[int],
+    max_length: int,
+    batch_size: int,
+    boundaries: tuple[int, ...] = BUCKET_BOUNDARIES,
+    token_budget: Optional[int] = None,
+) -> list[Bucket]:
+    """
+    Group inputs by token length, shortest bucket first.
+
+    Args:
+        lengths:      Token length per input (after truncation), in caller order.
+        max_length:   Model max sequence length — longer inputs are truncated
+                      to it, so it closes the final bucket.
+        batch_size:   Max inputs per forward pass.
+        token_budget: Max padded tokens per forward pass. Each bucket then
+                      holds token_budget // its upper bound inputs (at least
+                      one, at most batch_size) — many short texts per pass,
+                      few long ones.
+
+    Returns:
+        Buckets covering every index exactly once.
+    """
+    bounds = sorted({b for b in boundaries if b < max_length} | {max_length})
+    grouped: dict[int, list[int]] = {b: [] for b in bounds}
+
+    for i, n in enumerate(lengths):
+        bound = next((b for b in bounds if n <= b), max_length)
+        grouped[bound].append(i)
+
+    plan: list[Bucket] = []
+    for bound, indices in grouped.items():
+        size = max(1, batch_size)
+        if token_budget is not None:
+            size = max(1, min(size, token_budget // bound))
+
+        # Longest-first inside a bucket keeps each chunk's padding tight too.
+        indices.sort(key=lambda i: lengths[i], reverse=True)
+        for start in range(0, len(indices), size):
+            chunk = indices[start : start + size]
+            plan.append(
+                Bucket(
+                    label=str(bound),
+                    indices=chunk,
+                    padded_length=max(lengths[i] for i in chunk),
+                )
+            )
+    return plan
+
+
+def padding_waste(lengths: list[int], plan: list[Bucket]) -> float:
+    """Fraction of padded token slots in the plan that hold padding (0.0–1.0)."""
+    padded = sum(b.padded_length * len(b.indices) for b in plan)
+    if padded == 0:
+        return 0.0
+    return 1.0 - sum(lengths) / padded
@@ -0,0 +1,311 @@
+"""
+Cross-request micro-batching front-end for the embedding model.
+
+Responsibility: collect encode calls from every in-flight pipeline thread
+for a short window, run them through the model as ONE forward pass, and
+resolve each caller's future with its own rows.
+
+WHAT THIS MODULE DOES:
+    - Queues (texts, future) pairs submitted from any thread, in one lane
+      per priority class (models/priority.py)
+    - A single daemon worker drains the lanes until either the batch is
+      full (max_batch_size texts) or the oldest request has waited
+      max_wait_ms, then calls the model once for the whole batch
+    - Always takes interactive work first; in a batch that carries
+      interactive work, bulk may fill at most bulk_max_share of it, so
+      interactive callers don't pay for a bulk burst's forward time. With
+      no interactive work waiting, bulk fills the whole batch
+    - Flushes as soon as only over-budget bulk work is left, rather than
+      holding queued work back for the rest of the max_wait_ms window
+    - Drops requests whose deadline (models/deadline.py) passed while they
+      queued — their texts never reach the model and the caller gets
+      DeadlineExceeded
+    - Slices the stacked output back per caller, in submission order
+    - Records batch size, per-lane queue wait and per-lane depth to Prometheus
+
+WHAT THIS MODULE DOES NOT DO:
+    - No model loading (models/embeddings.py)
+    - No normalization — callers decide what to do with raw rows
+    - No per-request semantics (caching, bucketing)
+
+The worker thread starts lazily on the first submit(), so importing the
+module (or constructing the singleton model) never spawns threads. A forked
+child (serve.py) gets fresh lanes and starts its own worker on demand —
+threads do not survive fork(), and the parent's pending requests are not
+the child's to answer.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import Future, InvalidStateError
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from metrics.encoder_metrics import (
+    record_micro_batch,
+    record_queue_depth,
+    record_skipped_texts,
+)
+from models.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    SkipReason,
+    current_deadline,
+)
+from models.priority import Priority, current_priority
+
+logger = logging.getLogger(__name__)
+
+MICRO_BATCH_ENABLED = (
+    os.environ.get("EMBEDDING_MICRO_BATCH_ENABLED", "true").lower() == "true"
+)
+MICRO_BATCH_MAX_WAIT_MS = float(
+    os.environ.get("EMBEDDING_MICRO_BATCH_MAX_WAIT_MS", "5")
+)
+MICRO_BATCH_MAX_SIZE = int(os.environ.get("EMBEDDING_MICRO_BATCH_MAX_SIZE", "64"))
+# Fraction of a forward pass's texts bulk work may occupy while interactive
+# work is in the batch. CPU forward time grows ~linearly with texts, so this
+# bounds what a bulk burst adds to an interactive caller's own pass.
+MICRO_BATCH_BULK_MAX_SHARE = float(
+    os.environ.get("EMBEDDING_MICRO_BATCH_BULK_MAX_SHARE", "0.25")
+)
+
+
+@dataclass
+class _PendingRequest:
+    """One caller's slice of a future micro-batch."""
+
+    texts: list[str]
+    future: Future
+    priority: Priority = Priority.INTERACTIVE
+    deadline: Optional[Deadline] = None
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent encode calls into shared forward passes.
+
+    Args:
+        encode_fn:      callable(list[str]) → row-indexable result (N, D).
+                        Called only from the worker thread.
+        max_wait_ms:    How long the first request in a batch may wait for
+                        company before the batch is flushed.
+        max_batch_size: Soft cap on texts per forward pass. A single request
+                        larger than this is never split — it runs alone.
+        bulk_max_share: Cap on the fraction of a batch bulk texts may fill
+                        when the batch carries interactive work. Bulk-only
+                        batches fill up to max_batch_size.
+    """
+
+    def __init__(
+        self,
+        encode_fn: Callable[[list[str]], Any],
+        max_wait_ms: float = MICRO_BATCH_MAX_WAIT_MS,
+        max_batch_size: int = MICRO_BATCH_MAX_SIZE,
+        bulk_max_share: float = MICRO_BATCH_BULK_MAX_SHARE,
+    ):
+        self._encode_fn = encode_fn
+        self.max_wait_s = max(0.0, max_wait_ms) / 1000
+        self.max_batch_size = max(1, max_batch_size)
+        self.bulk_max_rows = max(1, int(self.max_batch_size * bulk_max_share))
+
+        self._lanes: dict[Priority, deque[_PendingRequest]] = {
+            p: deque() for p in Priority
+        }
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        _live_batchers.add(self)
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def submit(self, texts: list[str], priority: Optional[Priority] = None) -> Future:
+        """
+        Queue texts for a coming micro-batch and return a Future of their rows.
+        priority defaults to the caller's encode_priority() context; the
+        caller's request_deadline() context, if any, travels with the texts.
+        """
+        future: Future = Future()
+        request = _PendingRequest(
+            texts=list(texts),
+            future=future,
+            priority=priority or current_priority(),
+            deadline=current_deadline(),
+        )
+        if _skip_if_ended(request, stage="queue"):
+            return future  # already past its deadline — never queued
+
+        self._ensure_worker()
+        with self._cond:
+            self._lanes[request.priority].append(request)
+            self._record_depths_locked()
+            self._cond.notify()
+        return future
+
+    def encode(self, texts: list[str], priority: Optional[Priority] = None) -> Any:
+        """
+        Blocking convenience wrapper — submit and wait for this caller's rows.
+        Waits no longer than the caller's deadline: a request still queued
+        when it passes is withdrawn and DeadlineExceeded raised.
+        """
+        future = self.submit(texts, priority)
+        deadline = current_deadline()
+        timeout = deadline.remaining() if deadline is not None else None
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            if not future.cancel():
+                return future.result()  # already in a forward pass — take the rows
+            record_skipped_texts("queue", SkipReason.EXPIRED, len(texts))
+            raise DeadlineExceeded(SkipReason.EXPIRED) from None
+
+    def queue_depth(self, priority: Priority) -> int:
+        with self._cond:
+            return len(self._lanes[priority])
+
+    def _reset_after_fork(self) -> None:
+        """Child side of fork(): the worker thread and its locks did not come along."""
+        self._lanes = {p: deque() for p in Priority}
+        self._cond = threading.Condition()
+        self._worker = None
+        self._lock = threading.Lock()
+
+    # ── Worker ────────────────────────────────────────────────────────────────
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run,
+                    name="embedding-micro-batcher",
+                    daemon=True,
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = self._drain()
+            try:
+                self._flush(batch)
+            except Exception:
+                # _flush already routes model errors to the futures; anything
+                # reaching here is a bug in the batcher itself. Never let it
+                # kill the worker — every later caller would hang.
+                logger.exception("[MicroBatcher] unexpected error flushing batch")
+
+    def _drain(self) -> list[_PendingRequest]:
+        """Block for the first request, then gather more until full or timed out."""
+        with self._cond:
+            while not any(self._lanes.values()):
+                self._cond.wait()
+
+            batch: list[_PendingRequest] = []
+            rows = bulk_rows = 0
+            flush_at = time.perf_counter() + self.max_wait_s
+
+            while rows < self.max_batch_size:
+                request = self._pop_next_locked(rows, bulk_rows)
+                if request is not None:
+                    batch.append(request)
+                    rows += len(request.texts)
+                    if request.priority is Priority.BULK:
+                        bulk_rows += len(request.texts)
+                    continue
+                if self._lanes[Priority.BULK]:
+                    break  # only over-budget bulk is left; it runs next pass
+
+                remaining = flush_at - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            self._record_depths_locked()
+            return batch
+
+    def _pop_next_locked(self, rows: int, bulk_rows: int) -> Optional[_PendingRequest]:
+        """Interactive first; bulk only while the batch's bulk budget allows."""
+        interactive = self._lanes[Priority.INTERACTIVE]
+        if interactive:
+            return interactive.popleft()
+
+        bulk = self._lanes[Priority.BULK]
+        if not bulk:
+            return None
+        # The share cap protects interactive callers in this batch; without
+        # any, bulk may use the room up to max_batch_size.
+        budget = self.bulk_max_rows if rows > bulk_rows else self.max_batch_size
+        if rows == 0 or bulk_rows + len(bulk[0].texts) <= budget:
+            return bulk.popleft()
+        return None
+
+    def _record_depths_locked(self) -> None:
+        for priority, lane in self._lanes.items():
+            record_queue_depth(priority, len(lane))
+
+    def _flush(self, batch: list[_PendingRequest]) -> None:
+        # set_running_or_notify_cancel() returns False for futures the caller
+        # already cancelled; requests whose deadline passed in the queue are
+        # failed here. Neither's texts reach the model.
+        live = [
+            req
+            for req in batch
+            if not _skip_if_ended(req, stage="queue")
+            and req.future.set_running_or_notify_cancel()
+        ]
+        if not live:
+            return
+
+        flat = [text for req in live for text in req.texts]
+        now = time.perf_counter()
+        record_micro_batch(
+            batch_size=len(flat),
+            queue_waits=[(req.priority, now - req.enqueued_at) for req in live],
+        )
+
+        try:
+            rows = self._encode_fn(flat)
+        except Exception as e:
+            for req in live:
+                req.future.set_exception(e)
+            return
+
+        offset = 0
+        for req in live:
+            n = len(req.texts)
+            req.future.set_result(rows[offset : offset + n])
+            offset += n
+
+
+def _skip_if_ended(request: _PendingRequest, stage: str) -> bool:
+    """Fail request with DeadlineExceeded if its deadline has passed — True if so."""
+    reason = request.deadline.reason if request.deadline is not None else None
+    if reason is None:
+        return False
+    try:
+        request.future.set_exception(DeadlineExceeded(reason))
+    except InvalidStateError:
+        return True  # the caller withdrew it first and already counted it
+    record_skipped_texts(stage, reason, len(request.texts))
+    return True
+
+
+_live_batchers: weakref.WeakSet[MicroBatcher] = weakref.WeakSet()
+
+
+def _reset_batchers_after_fork() -> None:
+    for batcher in list(_live_batchers):
+        batcher._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):  # POSIX only
+    os.register_at_fork(after_in_child=_reset_batchers_after_fork)
@@ -0,0 +1,100 @@
+"""
+Model versions and dual-encode migration.
+
+Responsibility: let the service swap its embedding model without a
+stop-the-world recompute of every stored vector.
+
+Every vector the service emits is tagged with the model_version that
+produced it (MODEL_VERSION_KEY in utils/tensor_utils.py), and doc vectors
+Node passes in are only reused when their tag matches the model encoding
+the request. To move from model A to model B:
+
+    1. EMBEDDING_MIGRATION_MODEL=B: every embedding route still answers with
+       A's vectors, so the stored A index keeps serving. The same work is
+       run a second time with B and returned under MIGRATION_KEY, tagged
+       with B's version, for Node to write alongside.
+    2. Once Node's B vectors cover the data: EMBEDDING_MODEL=B and unset
+       EMBEDDING_MIGRATION_MODEL.
+
+Like the priority lane and the deadline, the model a request encodes with
+travels in a ContextVar: dual_encode() sets it for the second run, and
+embedding_utils / embed_text read it with active_model().
+
+WHAT THIS MODULE DOES:
+    - Resolves the serving model and the optional migration target
+    - Runs a compute function once per model and merges the results
+
+WHAT THIS MODULE DOES NOT DO:
+    - No doc version matching — utils/embedding_utils.py does that
+    - No DB writes — Node owns where the migration vectors are stored
+"""
+
+import logging
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Generator, Optional
+
+from models.deadline import DeadlineExceeded
+from models.embeddings import EmbeddingModel, embedding_model
+
+logger = logging.getLogger(__name__)
+
+# Model the index is migrating to — empty when no migration is running.
+EMBEDDING_MIGRATION_MODEL = os.environ.get("EMBEDDING_MIGRATION_MODEL", "")
+
+# Response key holding the migration target's copy of the result.
+MIGRATION_KEY = "migration"
+
+_current: ContextVar[Optional[EmbeddingModel]] = ContextVar(
+    "encode_model", default=None
+)
+
+
+def active_model() -> EmbeddingModel:
+    """The model the current request encodes with — the serving model unless set."""
+    return _current.get() or embedding_model
+
+
+@contextmanager
+def use_model(model: EmbeddingModel) -> Generator[None, None, None]:
+    """Run the enclosed block's encoder calls with the given model."""
+    token = _current.set(model)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+def migration_model() -> Optional[EmbeddingModel]:
+    """The migration target, or None when no migration is configured."""
+    if EMBEDDING_MIGRATION_MODEL in ("", embedding_model.model_name):
+        return None
+    return EmbeddingModel(EMBEDDING_MIGRATION_MODEL)
+
+
+def dual_encode(compute: Callable[[], dict]) -> dict:
+    """
+    compute() with the serving model; during a migration, compute() again
+    with the target and attach its result under MIGRATION_KEY.
+
+    The serving result is what callers rely on, so a failed migration run
+    is logged and left out — Node simply has nothing to backfill this time.
+    """
+    result = compute()
+
+    target = migration_model()
+    if target is None:
+        return result
+
+    try:
+        with use_model(target):
+            result[MIGRATION_KEY] = compute()
+    except DeadlineExceeded as e:
+        logger.warning(f"[Migration] {target.model_version} encode skipped: {e}")
+    except Exception:
+        logger.exception(
+            f"[Migration] {target.model_version} encode failed — "
+            "returning the serving model's result only"
+        )
+    return result
@@ -0,0 +1,44 @@
+"""
+Priority classes for encoder work.
+
+Responsibility: let a caller say "a user is waiting on this" (interactive)
+or "this is background regeneration" (bulk) without threading a parameter
+through every pipeline, task and embedding util between the handler and
+the model.
+
+The class travels in a ContextVar. Handlers set it around their work with
+encode_priority(); MicroBatcher.submit() reads it. Thread pools that fan
+work out (parallel_utils.run_pipeline) must submit through
+contextvars.copy_context().run so workers inherit it.
+
+Unmarked work is interactive — an unclassified caller is never demoted.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import StrEnum
+from typing import Generator
+
+
+class Priority(StrEnum):
+    INTERACTIVE = "interactive"  # a user is waiting — always drained first
+    BULK = "bulk"  # background regeneration — capped share of each forward pass
+
+
+_current: ContextVar[Priority] = ContextVar(
+    "encode_priority", default=Priority.INTERACTIVE
+)
+
+
+def current_priority() -> Priority:
+    return _current.get()
+
+
+@contextmanager
+def encode_priority(priority: Priority) -> Generator[None, None, None]:
+    """Run the enclosed block's encoder calls in the given priority lane."""
+    token = _current.set(priority)
+    try:
+        yield
+    finally:
+        _current.reset(token)
@@ -0,0 +1,308 @@
+"""
+Reduced-dimension projection of retrieval vectors.
+
+Responsibility: shrink the 768-d section vectors the service emits to 128,
+256 or 384 dimensions with a PCA fitted on our own resume / job corpus, so
+payloads to Node and Pinecone and every similarity matmul get 2–6× smaller.
+
+A projection is a mean and a (k, D) component matrix: x ↦ normalize((x − mean)
+@ componentsᵀ). Re-normalizing keeps the vector contract — projected vectors
+are unit length, so cosine similarity is still a dot product. It is fitted
+for one model_version and persisted as a safetensors file whose metadata
+records that model and the projection's own version tag
+("pca256-<8 hex of the weights>").
+
+WHAT THIS MODULE DOES:
+    - Fits a projection on a corpus and measures recall@k on a held-out split
+    - Saves / loads projection files
+    - Serves the configured projection (EMBEDDING_PROJECTION_PATH) to the
+      serializers and SimilarityService
+
+WHAT THIS MODULE DOES NOT DO:
+    - No projection of doc-cache vectors: skill / job-title / location
+      vectors and backfill rows stay full-dimensional, since the pipelines
+      average them before projecting
+    - No Pinecone index management — Node owns the index and must create it
+      with the projection's dimension
+
+CLI:
+    python -m models.projection fit --corpus corpus.jsonl --dims 256 \
+        --out projections/pca256.safetensors
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import random
+import sys
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import torch
+
+logger = logging.getLogger(__name__)
+
+# Projection file to apply — empty keeps full-dimensional vectors.
+EMBEDDING_PROJECTION_PATH = os.environ.get("EMBEDDING_PROJECTION_PATH", "")
+
+PROJECTION_DIMS = (128, 256, 384)
+
+
+@dataclass(frozen=True)
+class Projection:
+    """A fitted linear projection — see the module docstring for the map."""
+
+    mean: torch.Tensor  # (D,)
+    components: torch.Tensor  # (k, D), orthonormal rows
+    model_version: str  # the model whose vectors it was fitted on
+    version: str  # tag carried by every projected payload
+
+    @property
+    def dims(self) -> int:
+        return self.components.shape[0]
+
+    def apply(self, vectors: torch.Tensor) -> torch.Tensor:
+        """(D,) or (N, D) unit vectors → (k,) or (N, k) unit vectors."""
+        import torch.nn.functional as F
+
+        projected = (vectors - self.mean) @ self.components.T
+        return F.normalize(projected, p=2, dim=-1)
+
+    def save(self, path: str) -> None:
+        from safetensors.torch import save_file
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        save_file(
+            {
+                "mean": self.mean.contiguous(),
+                "components": self.components.contiguous(),
+            },
+            path,
+            metadata={"model_version": self.model_version, "version": self.version},
+        )
+
+    @classmethod
+    def load(cls, path: str) -> Projection:
+        from safetensors import safe_open
+
+        with safe_open(path, framework="pt") as f:
+            metadata = f.metadata() or {}
+            mean = f.get_tensor("mean")
+            components = f.get_tensor("components")
+
+        if "model_version" not in metadata or "version" not in metadata:
+            raise ValueError(f"{path}: not a projection file (metadata missing)")
+        if mean.dim() != 1 or components.dim() != 2:
+            raise ValueError(f"{path}: malformed projection tensors")
+        if components.shape[1] != mean.shape[0]:
+            raise ValueError(f"{path}: components do not match the mean's dimension")
+
+        return cls(
+            mean=mean,
+            components=components,
+            model_version=metadata["model_version"],
+            version=metadata["version"],
+        )
+
+
+# ── Fitting ───────────────────────────────────────────────────────────────────
+
+
+def fit(vectors: torch.Tensor, dims: int, model_version: str) -> Projection:
+    """
+    PCA of the (N, D) unit vectors: the top-dims eigenvectors of their
+    covariance. Eigen-decomposing the D × D covariance keeps the cost
+    independent of N beyond one pass over the data.
+    """
+    import torch
+
+    if not 0 < dims < vectors.shape[1]:
+        raise ValueError(f"dims must be in (0, {vectors.shape[1]}), got {dims}")
+    if vectors.shape[0] <= dims:
+        raise ValueError(
+            f"need more than {dims} vectors to fit, got {vectors.shape[0]}"
+        )
+
+    data = vectors.to(torch.float64)
+    mean = data.mean(dim=0)
+    centered = data - mean
+    covariance = centered.T @ centered / (data.shape[0] - 1)
+    _, eigenvectors = torch.linalg.eigh(covariance)  # ascending eigenvalues
+    components = eigenvectors[:, -dims:].flip(dims=[1]).T.contiguous()
+
+    mean32, components32 = mean.to(torch.float32), components.to(torch.float32)
+    digest = hashlib.sha1(components32.numpy().tobytes()).hexdigest()[:8]
+    return Projection(
+        mean=mean32,
+        components=components32,
+        model_version=model_version,
+        version=f"pca{dims}-{digest}",
+    )
+
+
+def explained_variance(projection: Projection, vectors: torch.Tensor) -> float:
+    """Share of the vectors' variance the projection keeps (0.0–1.0)."""
+    centered = vectors - projection.mean
+    total = centered.pow(2).sum().item()
+    kept = (centered @ projection.components.T).pow(2).sum().item()
+    return kept / total if total else 0.0
+
+
+def recall_at_k(projection: Projection, vectors: torch.Tensor, k: int) -> float:
+    """
+    Mean overlap between each vector's k nearest neighbours (itself excluded)
+    by full-vector cosine and by projected cosine.
+    """
+    if vectors.shape[0] <= k:
+        raise ValueError(f"need more than {k} held-out vectors, got {vectors.shape[0]}")
+
+    def neighbours(unit: torch.Tensor) -> torch.Tensor:
+        scores = unit @ unit.T
+        scores.fill_diagonal_(float("-inf"))
+        return scores.topk(k, dim=1).indices
+
+    full = neighbours(vectors)
+    reduced = neighbours(projection.apply(vectors))
+    hits = sum(len(set(a.tolist()) & set(b.tolist())) for a, b in zip(full, reduced))
+    return hits / (k * vectors.shape[0])
+
+
+# ── Serving ───────────────────────────────────────────────────────────────────
+
+_projection: Optional[Projection] = None
+_loaded = False
+_lock = threading.Lock()
+
+
+def get_projection() -> Optional[Projection]:
+    """
+    The configured projection, loaded once — None when EMBEDDING_PROJECTION_PATH
+    is unset or the file cannot be read (logged; vectors stay full).
+    """
+    global _projection, _loaded
+    if _loaded:
+        return _projection
+
+    with _lock:
+        if not _loaded and EMBEDDING_PROJECTION_PATH:
+            try:
+                _projection = Projection.load(EMBEDDING_PROJECTION_PATH)
+                logger.info(
+                    f"[Projection] {_projection.version} for "
+                    f"{_projection.model_version} loaded from {EMBEDDING_PROJECTION_PATH}"
+                )
+            except Exception:
+                logger.exception(
+                    f"[Projection] could not load {EMBEDDING_PROJECTION_PATH} — "
+                    "emitting full vectors"
+                )
+        _loaded = True
+    return _projection
+
+
+def projection_for(model_version: str) -> Optional[Projection]:
+    """The configured projection if it was fitted on model_version's vectors."""
+    projection = get_projection()
+    if projection is None or projection.model_version != model_version:
+        return None
+    return projection
+
+
+def project(
+    vector: Optional[torch.Tensor], projection: Optional[Projection]
+) -> Optional[torch.Tensor]:
+    """vector projected — or unchanged without a projection (or a vector)."""
+    if vector is None or projection is None:
+        return vector
+    return projection.apply(vector)
+
+
+# ── CLI ───────────────────────────────────────────────────────────────────────
+
+
+def _read_corpus(path: str) -> tuple[list[list[float]], list[str]]:
+    """
+    JSONL, one record per line: {"embedding": [...]} (e.g. exported from
+    Mongo) is used as-is, {"text": "..."} is encoded with the serving model.
+    """
+    vectors: list[list[float]] = []
+    texts: list[str] = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get("embedding"):
+                vectors.append(record["embedding"])
+            elif record.get("text"):
+                texts.append(record["text"])
+    return vectors, texts
+
+
+def _main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m models.projection")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    fit_cmd = sub.add_parser("fit", help="fit a PCA projection on a corpus")
+    fit_cmd.add_argument("--corpus", required=True, help="JSONL of texts / embeddings")
+    fit_cmd.add_argument("--dims", type=int, choices=PROJECTION_DIMS, required=True)
+    fit_cmd.add_argument("--out", required=True, help="projection file to write")
+    fit_cmd.add_argument(
+        "--holdout", type=float, default=0.1, help="share held out for recall@k"
+    )
+    fit_cmd.add_argument("--k", type=int, default=10, help="neighbours for recall@k")
+    fit_cmd.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args(argv)
+
+    import torch
+    import torch.nn.functional as F
+
+    from models.embeddings import embedding_model
+
+    vectors, texts = _read_corpus(args.corpus)
+    rows = [torch.tensor(vectors, dtype=torch.float32)] if vectors else []
+    if texts:
+        encoded = embedding_model.encode_chunked(texts)
+        if encoded is None:
+            parser.error("encoding the corpus texts failed")
+        rows.append(encoded)
+    if not rows:
+        parser.error(f"{args.corpus} has no texts or embeddings")
+
+    data = F.normalize(torch.cat(rows), p=2, dim=1)
+    order = list(range(data.shape[0]))
+    random.Random(args.seed).shuffle(order)
+    split = max(args.k + 1, int(len(order) * args.holdout))
+    held_out, train = data[order[:split]], data[order[split:]]
+
+    projection = fit(train, args.dims, embedding_model.model_version)
+    projection.save(args.out)
+
+    print(
+        json.dumps(
+            {
+                "version": projection.version,
+                "model_version": projection.model_version,
+                "dims": projection.dims,
+                "train": train.shape[0],
+                "held_out": held_out.shape[0],
+                "explained_variance": round(
+                    explained_variance(projection, held_out), 4
+                ),
+                f"recall@{args.k}": round(recall_at_k(projection, held_out, args.k), 4),
+                "out": args.out,
+            }
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
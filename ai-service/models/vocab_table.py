@@ -0,0 +1,118 @@
+"""
+Precomputed embedding tables for closed vocabularies.
+
+Responsibility: embed small fixed vocabularies (seniority levels, salary
+frequencies) once, then serve every later lookup as an array index instead
+of a trip through the cache, the micro-batcher and the model.
+
+WHAT THIS MODULE DOES:
+    - Encodes every term of the registered vocabularies in one batch into a
+      (V, D) unit-row matrix, keyed by canonical form (models/canonical.py)
+    - Tags the matrix with the model version it was built with and rebuilds
+      it on the next lookup after that version changes (model or backend swap)
+    - Counts lookups served from the table vs. out-of-vocabulary misses
+
+WHAT THIS MODULE DOES NOT DO:
+    - No fallback encoding — an out-of-vocabulary lookup returns None and
+      the caller decides (utils/embedding_utils.py encodes it normally)
+    - No scheduling — app.py's lifespan builds the table at startup
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING, Iterable, Optional, cast
+
+from metrics.encoder_metrics import record_vocab_lookup
+from models.canonical import canonicalize
+from models.embeddings import EmbeddingModel
+
+if TYPE_CHECKING:
+    import torch
+
+logger = logging.getLogger(__name__)
+
+
+class VocabTable:
+    """
+    Closed-vocabulary embedding table.
+
+    Args:
+        model:        Encoder the table is built with.
+        vocabularies: { vocabulary name: its terms }. Names are for logs only;
+                      terms from every vocabulary share one matrix.
+    """
+
+    def __init__(self, model: EmbeddingModel, vocabularies: dict[str, Iterable[str]]):
+        self._model = model
+        # canonical form → spelling sent to the model (first one registered)
+        self._terms: dict[str, str] = {}
+        for terms in vocabularies.values():
+            for term in terms:
+                self._terms.setdefault(canonicalize(term), term)
+        self._vocabularies = list(vocabularies)
+        self._index = {key: i for i, key in enumerate(self._terms)}
+
+        self._matrix: Optional[torch.Tensor] = None
+        self._version: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    @property
+    def model_version(self) -> Optional[str]:
+        """Model version the current matrix was built with — None before build()."""
+        return self._version
+
+    def build(self) -> None:
+        """
+        Encode every term with the current model version — a no-op when the
+        table is already current. Raises on failure.
+        """
+        with self._lock:
+            self._build_locked()
+
+    def lookup(self, text: str) -> Optional[torch.Tensor]:
+        """
+        Unit-length row for text, or None when it is not in the vocabulary
+        (or the table cannot be built). Builds first if the model version
+        changed since the last build — or there was none.
+        """
+        if not text:
+            return None
+
+        index = self._index.get(canonicalize(text))
+        if index is None:
+            record_vocab_lookup(hit=False)
+            return None
+
+        if self._version != self._model.model_version:
+            try:
+                self.build()
+            except Exception as e:
+                logger.error(f"[VocabTable] rebuild failed, encoding inline: {e}")
+                record_vocab_lookup(hit=False)
+                return None
+
+        record_vocab_lookup(hit=True)
+        return cast("torch.Tensor", self._matrix)[index]
+
+    def _build_locked(self) -> None:
+        version = self._model.model_version
+        if self._version == version:
+            return  # another thread rebuilt while we waited for the lock
+
+        keys = list(self._index)
+        # Bypass the text cache: these rows live here for the process lifetime.
+        rows = self._model.encode_batch([self._terms[k] for k in keys], use_cache=False)
+        if rows is None:
+            raise RuntimeError(f"vocabulary table encode failed ({version})")
+
+        self._matrix = rows.detach().cpu().contiguous()
+        self._version = version
+        logger.info(
+            f"[VocabTable] built {len(keys)} terms from "
+            f"{', '.join(self._vocabularies)} with {version}"
+        )
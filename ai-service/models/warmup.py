@@ -0,0 +1,118 @@
+"""
+Embedding model warm-up and readiness.
+
+Responsibility: make the first real request as fast as the thousandth. The
+first forward pass at a given shape pays for allocator growth, kernel
+selection and tokenizer caches, so we pay for them at startup instead, at
+every sequence length the length buckets will produce.
+
+WHAT THIS MODULE DOES:
+    - Encodes synthetic batches at several token lengths (cache bypassed),
+      one untimed pass then one timed pass per length
+    - Records texts/sec per length and the total warm-up time
+    - Holds the process-wide readiness flag /health/ready reports
+
+WHAT THIS MODULE DOES NOT DO:
+    - No model loading (models/embeddings.py — EmbeddingModel.load)
+    - No scheduling — app.py's lifespan decides when warm-up runs
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+from metrics.encoder_metrics import record_warmup
+from models.embeddings import EmbeddingModel
+from models.length_buckets import BUCKET_BOUNDARIES
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_WARMUP_ENABLED = (
+    os.environ.get("EMBEDDING_WARMUP_ENABLED", "true").lower() == "true"
+)
+# Texts per warm-up batch. Small: this runs on every worker at startup.
+EMBEDDING_WARMUP_BATCH_SIZE = int(os.environ.get("EMBEDDING_WARMUP_BATCH_SIZE", "8"))
+
+# Common words that are a single token in the mpnet / BERT vocabularies, so
+# n words ≈ n tokens (plus the two special tokens).
+_FILLER_WORDS = ("team", "data", "build", "service", "design", "system", "code", "work")
+
+_ready = threading.Event()
+_report: dict[int, float] = {}
+
+
+def warmup_lengths(max_length: int) -> list[int]:
+    """One sequence length per length bucket, capped at the model limit."""
+    return sorted({n for n in BUCKET_BOUNDARIES if n < max_length} | {max_length})
+
+
+def synthetic_text(tokens: int, seed: int = 0) -> str:
+    """Roughly `tokens` tokens long, different per seed so rows never dedupe."""
+    words = max(1, tokens - 2)  # [CLS] / [SEP]
+    return " ".join(
+        _FILLER_WORDS[(seed + i) % len(_FILLER_WORDS)] for i in range(words)
+    )
+
+
+def warm_up(
+    model: EmbeddingModel, batch_size: int = EMBEDDING_WARMUP_BATCH_SIZE
+) -> dict[int, float]:
+    """
+    Run the model at every warm-up length and measure throughput.
+
+    Returns:
+        { sequence length: texts/sec of the timed pass }
+
+    Raises:
+        RuntimeError if the model returns nothing — a model that cannot
+        encode must never report ready.
+    """
+    started = time.perf_counter()
+    throughput: dict[int, float] = {}
+
+    for length in warmup_lengths(model.max_length):
+        texts = [synthetic_text(length, seed) for seed in range(batch_size)]
+        # Untimed pass absorbs first-shape costs; the second one is steady state.
+        for timed in (False, True):
+            t0 = time.perf_counter()
+            rows = model.encode_batch(texts, use_cache=False)
+            if rows is None:
+                raise RuntimeError(f"warm-up encode failed at {length} tokens")
+            if timed:
+                throughput[length] = len(texts) / (time.perf_counter() - t0)
+
+    duration = time.perf_counter() - started
+    record_warmup(throughput, duration)
+    logger.info(
+        f"[Warmup] done in {duration:.2f}s — texts/s by length: "
+        + ", ".join(f"{n}={tps:.1f}" for n, tps in throughput.items())
+    )
+    return throughput
+
+
+def run_warmup(model: EmbeddingModel) -> None:
+    """Warm the model (unless disabled) and flip readiness. Raises on failure."""
+    if EMBEDDING_WARMUP_ENABLED:
+        _report.update(warm_up(model))
+    else:
+        logger.info("[Warmup] disabled via EMBEDDING_WARMUP_ENABLED")
+    _ready.set()
+
+
+def is_ready() -> bool:
+    return _ready.is_set()
+
+
+def warmup_report() -> Optional[dict[int, float]]:
+    """texts/sec per warm-up length, or None before warm-up has finished."""
+    return dict(_report) if _ready.is_set() else None
+
+
+def reset_readiness() -> None:
+    """Mark the process not ready (shutdown, failed warm-up, tests)."""
+    _ready.clear()
+    _report.clear()
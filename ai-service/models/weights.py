@@ -0,0 +1,230 @@
+"""
+Memory-mapped model weights.
+
+Responsibility: get the encoder's weights from a local safetensors snapshot
+into the model without reading and copying the whole file, and time the
+phases of building the model.
+
+A safetensors file is an 8-byte little-endian header length, a JSON header
+(name → dtype, shape, byte offsets) and the raw tensor bytes. That makes it
+mappable: mmap_state_dict() maps the file once (private, copy-on-write) and
+returns tensors that are views into the mapping, so "loading" is building a
+few hundred views. Pages fault in from the page cache as the first forward
+pass touches them. Pre-forked workers (serve.py) share those pages with the
+page cache instead of each holding an anonymous copy.
+
+WHAT THIS MODULE DOES:
+    - Finds the local snapshot directory of a Hub model (no network)
+    - Maps a safetensors file into {name: tensor view}
+    - weights_hook(): while active, transformers' AutoModel.from_pretrained
+      builds the model skeleton without weights and assigns the mapped
+      tensors as its parameters. It also times that call as the "weights"
+      phase, with or without a mapped state dict
+
+WHAT THIS MODULE DOES NOT DO:
+    - No fallback decision — models/backends.py falls back to the stock
+      loader when anything in here raises
+    - No quantized or ONNX weights (torch backend only)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator, Optional, cast
+
+if TYPE_CHECKING:
+    import torch
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MMAP_WEIGHTS = (
+    os.environ.get("EMBEDDING_MMAP_WEIGHTS", "true").lower() == "true"
+)
+
+WEIGHTS_FILE = "model.safetensors"
+
+# safetensors dtype tag → torch dtype attribute name
+_DTYPES = {
+    "F64": "float64",
+    "F32": "float32",
+    "F16": "float16",
+    "BF16": "bfloat16",
+    "I64": "int64",
+    "I32": "int32",
+    "I16": "int16",
+    "I8": "int8",
+    "U8": "uint8",
+    "BOOL": "bool",
+}
+
+# from_pretrained kwargs that only matter when the weights come from a file.
+# Anything else (dtype, device_map, quantization, ...) goes to the stock loader.
+_FILE_ONLY_KWARGS = frozenset(
+    {
+        "config",
+        "cache_dir",
+        "revision",
+        "token",
+        "local_files_only",
+        "trust_remote_code",
+    }
+)
+
+
+def local_snapshot(model_name: str) -> Optional[str]:
+    """
+    Local directory holding model_name's config and safetensors weights —
+    model_name itself when it is one, else its Hub cache snapshot. None when
+    there is no local copy (never downloads).
+    """
+    if os.path.isdir(model_name):
+        return model_name if _has_weights(model_name) else None
+
+    from huggingface_hub import snapshot_download
+
+    # sentence-transformers resolves bare names under its own Hub org.
+    repo_ids = [model_name]
+    if "/" not in model_name:
+        repo_ids.append(f"sentence-transformers/{model_name}")
+
+    for repo_id in repo_ids:
+        try:
+            path = snapshot_download(repo_id, local_files_only=True)
+        except Exception:
+            continue
+        if _has_weights(path):
+            return path
+    return None
+
+
+def _has_weights(path: str) -> bool:
+    return os.path.isfile(os.path.join(path, WEIGHTS_FILE)) and os.path.isfile(
+        os.path.join(path, "config.json")
+    )
+
+
+def mmap_state_dict(path: str) -> dict[str, torch.Tensor]:
+    """
+    Map a safetensors file and return its tensors as views into the mapping.
+
+    Raises:
+        ValueError for a malformed header, an unknown dtype or a tensor whose
+        offset is not aligned to its element size — views need alignment.
+    """
+    import torch
+
+    with open(path, "rb") as f:
+        (header_size,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_size))
+
+    data_start = 8 + header_size
+    file_size = os.path.getsize(path)
+    # shared=False → MAP_PRIVATE: writes (there are none) would copy the page,
+    # never reach the file.
+    storage = cast(
+        "torch.UntypedStorage",
+        torch.UntypedStorage.from_file(path, shared=False, nbytes=file_size),
+    )
+
+    state_dict: dict[str, torch.Tensor] = {}
+    for name, info in header.items():
+        if name == "__metadata__":
+            continue
+
+        tag = info.get("dtype")
+        if tag not in _DTYPES:
+            raise ValueError(f"{path}: unsupported dtype {tag} for {name}")
+        dtype = getattr(torch, _DTYPES[tag])
+        shape = info["shape"]
+        start, end = info["data_offsets"]
+
+        item_size = torch.empty((), dtype=dtype).element_size()
+        offset = data_start + start
+        if offset % item_size or data_start + end > file_size:
+            raise ValueError(f"{path}: {name} is misaligned or out of bounds")
+
+        # Row-major strides, as safetensors stores them
+        stride = torch.empty(shape, device="meta").stride()
+        view = torch.empty(0, dtype=dtype)
+        view.set_(storage, offset // item_size, shape, stride)
+        state_dict[name] = view
+
+    return state_dict
+
+
+@contextmanager
+def weights_hook(
+    phases: dict[str, float], state_dict: Optional[dict[str, torch.Tensor]] = None
+) -> Iterator[None]:
+    """
+    Route AutoModel.from_pretrained through this module while active.
+
+    Every call adds its wall time to phases["weights"]. With a state_dict,
+    the model is built from its config on the meta device and the mapped
+    tensors are assigned as its parameters — nothing is read or copied.
+    Without one, the stock loader runs (timed only).
+
+    Not re-entrant and process-global: EmbeddingModel.load holds its lock.
+    """
+    from transformers import AutoModel
+
+    saved = AutoModel.__dict__.get("from_pretrained")
+    stock = AutoModel.from_pretrained
+
+    def from_pretrained(cls, name, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            if state_dict is None or not _mappable(args, kwargs):
+                return stock(name, *args, **kwargs)
+            return _from_state_dict(name, kwargs.get("config"), state_dict)
+        finally:
+            phases["weights"] = (
+                phases.get("weights", 0.0) + time.perf_counter() - started
+            )
+
+    AutoModel.from_pretrained = classmethod(from_pretrained)  # type: ignore[method-assign,assignment]
+    try:
+        yield
+    finally:
+        if saved is None:
+            del AutoModel.from_pretrained
+        else:
+            AutoModel.from_pretrained = saved  # type: ignore[method-assign]
+
+
+def _mappable(args: tuple, kwargs: dict) -> bool:
+    """True when a from_pretrained call asks for nothing but the snapshot's weights."""
+    # The mapped file is the snapshot root's — a subfolder model is another file.
+    if args or kwargs.get("subfolder"):
+        return False
+    return not set(kwargs) - _FILE_ONLY_KWARGS - {"subfolder"}
+
+
+def _from_state_dict(name: str, config, state_dict: dict[str, torch.Tensor]):
+    """Build name's architecture without weights, then adopt state_dict's tensors."""
+    import torch
+    from transformers import AutoConfig, AutoModel
+    from transformers.integrations.accelerate import init_empty_weights
+
+    if config is None:
+        config = AutoConfig.from_pretrained(name)
+
+    # Parameters on the meta device (no memory); buffers stay real.
+    with init_empty_weights():
+        model = AutoModel.from_config(config)
+
+    with torch.no_grad():
+        model.load_state_dict(state_dict, strict=False, assign=True)
+    model.tie_weights()
+
+    missing = [n for n, p in model.named_parameters() if p.is_meta]
+    missing += [n for n, b in model.named_buffers() if b.is_meta]
+    if missing:
+        raise ValueError(f"{name}: checkpoint has no weights for {missing[:5]}")
+
+    return model.eval()
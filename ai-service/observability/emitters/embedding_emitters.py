@@ -20,6 +20,7 @@ from metrics.prometheus_metrics import (
     embedding_duration_seconds,
     embedding_section_duration_seconds,
     embedding_errors_total,
+    embedding_model_calls_per_run,
 )
 import logging
 
@@ -39,6 +40,7 @@ def emit_pipeline_run(run: PipelineRun, entity: str, status: str = "success") ->
     embedding_duration_seconds.labels(entity=entity).observe(
         run.total_duration_ms / 1000
     )
+    embedding_model_calls_per_run.labels(entity=entity).observe(run.model_calls)
 
     for section in run.sections:
         _emit_section(section, entity)
@@ -1,7 +1,19 @@
-from fastapi import APIRouter
-from routers.shared import ComputeRequest, wrap
-from handlers.resume_handlers import generate_resume_embeddings
-from handlers.job_handlers import generate_job_posting_embeddings
+from fastapi import APIRouter, Request
+from routers.shared import (
+    AI_SERVICE_BULK_REQUEST_TIMEOUT_S,
+    ComputeRequest,
+    response_vector_encoding,
+    run_with_deadline,
+    wrap,
+)
+from handlers.resume_handlers import (
+    generate_resume_embeddings,
+    generate_resume_embeddings_batch,
+)
+from handlers.job_handlers import (
+    generate_job_posting_embeddings,
+    generate_job_posting_embeddings_batch,
+)
 from handlers.market_handlers import (
     generate_skill_embeddings,
     generate_job_title_embeddings,
@@ -11,53 +23,135 @@ from handlers.market_handlers import (
 router = APIRouter(prefix="/compute")
 
 
+def _alias_job_title(job):
+    # Normalize: job postings store the title ref as 'title',
+    # but the embedding task_registry reads doc.get("jobTitle").
+    # Alias it here so the pipeline finds it without changing shared infrastructure.
+    if isinstance(job, dict) and "title" in job and "jobTitle" not in job:
+        job["jobTitle"] = job["title"]
+    return job
+
+
+# Handlers run on the embedding worker pool under the request's deadline (header or
+# route default) — see routers/shared/deadline.py. Resume and job routes
+# serialize vectors in the encoding X-Vector-Encoding asks for — see
+# routers/shared/vector_encoding.py. `previousFingerprints` ({ section:
+# fingerprint }, or { _id: { section: fingerprint } } on batch routes) makes
+# unchanged sections reused: left out of the response, listed in
+# reusedSections.
+
+
 @router.post("/generate_resume_embeddings")
-async def resume_embeddings(body: ComputeRequest) -> dict:
+async def resume_embeddings(body: ComputeRequest, request: Request) -> dict:
     data = body.model_dump()
 
-    return wrap(
-        generate_resume_embeddings(
+    with response_vector_encoding(request):
+        result = await run_with_deadline(
+            request,
+            generate_resume_embeddings,
             resume_body=data.get("resume", data),
             skill_docs=data.get("skillDocs", []),
             job_title_doc=data.get("jobTitleDoc"),
             location_doc=data.get("locationDoc"),
             work_experience_title_docs=data.get("workExperienceTitleDocs", []),
+            previous_fingerprints=data.get("previousFingerprints"),
         )
-    )
+    return wrap(result)
 
 
 @router.post("/generate_job_posting_embeddings")
-async def job_posting_embeddings(body: ComputeRequest) -> dict:
+async def job_posting_embeddings(body: ComputeRequest, request: Request) -> dict:
     data = body.model_dump()
 
-    job = data.get("job", data)
+    job = _alias_job_title(data.get("job", data))
 
-    # Normalize: job postings store the title ref as 'title',
-    # but the embedding task_registry reads doc.get("jobTitle").
-    # Alias it here so the pipeline finds it without changing shared infrastructure.
-    if "title" in job and "jobTitle" not in job:
-        job["jobTitle"] = job["title"]
-
-    return wrap(
-        generate_job_posting_embeddings(
+    with response_vector_encoding(request):
+        result = await run_with_deadline(
+            request,
+            generate_job_posting_embeddings,
             job_body=job,
             skill_docs=data.get("skillDocs", []),
             job_title_doc=data.get("jobTitleDoc"),
             location_doc=data.get("locationDoc"),
+            previous_fingerprints=data.get("previousFingerprints"),
         )
-    )
+    return wrap(result)
+
+
+# Batch routes: many documents, one shared doc pool, one encoder call —
+# see infrastructure/embeddings/doc_pool.py. Bulk lane and bulk timeout.
+
+
+@router.post("/generate_resume_embeddings_batch")
+async def resume_embeddings_batch(body: ComputeRequest, request: Request) -> dict:
+    data = body.model_dump()
+
+    with response_vector_encoding(request):
+        result = await run_with_deadline(
+            request,
+            generate_resume_embeddings_batch,
+            resume_bodies=data.get("resumes", []),
+            skill_docs=data.get("skillDocs", []),
+            job_title_docs=data.get("jobTitleDocs", []),
+            location_docs=data.get("locationDocs", []),
+            previous_fingerprints=data.get("previousFingerprints"),
+            default_timeout_s=AI_SERVICE_BULK_REQUEST_TIMEOUT_S,
+        )
+    return wrap(result)
+
+
+@router.post("/generate_job_posting_embeddings_batch")
+async def job_posting_embeddings_batch(body: ComputeRequest, request: Request) -> dict:
+    data = body.model_dump()
+    jobs = data.get("jobs", [])
+
+    with response_vector_encoding(request):
+        result = await run_with_deadline(
+            request,
+            generate_job_posting_embeddings_batch,
+            job_bodies=[_alias_job_title(job) for job in jobs]
+            if isinstance(jobs, list)
+            else jobs,
+            skill_docs=data.get("skillDocs", []),
+            job_title_docs=data.get("jobTitleDocs", []),
+            location_docs=data.get("locationDocs", []),
+            previous_fingerprints=data.get("previousFingerprints"),
+            default_timeout_s=AI_SERVICE_BULK_REQUEST_TIMEOUT_S,
+        )
+    return wrap(result)
 
 
 @router.post("/generate_skill_embeddings")
-async def skill_embeddings(body: ComputeRequest) -> dict:
-    return wrap(generate_skill_embeddings(body.model_dump()))
+async def skill_embeddings(body: ComputeRequest, request: Request) -> dict:
+    return wrap(
+        await run_with_deadline(
+            request,
+            generate_skill_embeddings,
+            body.model_dump(),
+            default_timeout_s=AI_SERVICE_BULK_REQUEST_TIMEOUT_S,
+        )
+    )
 
 
 @router.post("/generate_job_title_embeddings")
-async def job_title_embeddings(body: ComputeRequest) -> dict:
-    return wrap(generate_job_title_embeddings(body.model_dump()))
+async def job_title_embeddings(body: ComputeRequest, request: Request) -> dict:
+    return wrap(
+        await run_with_deadline(
+            request,
+            generate_job_title_embeddings,
+            body.model_dump(),
+            default_timeout_s=AI_SERVICE_BULK_REQUEST_TIMEOUT_S,
+        )
+    )
 
 
 @router.post("/generate_location_embeddings")
-async def location_embeddings(body: ComputeRequest) -> dict:
-    return wrap(generate_location_embeddings(body.model_dump()))
+async def location_embeddings(body: ComputeRequest, request: Request) -> dict:
+    return wrap(
+        await run_with_deadline(
+            request,
+            generate_location_embeddings,
+            body.model_dump(),
+            default_timeout_s=AI_SERVICE_BULK_REQUEST_TIMEOUT_S,
+        )
+    )
@@ -2,7 +2,17 @@
 # @app.get() is like app.get() in express.
 # FastAPI automatically serializes the returned dict to JSON.
 # No res.json() needed — whatever you return becomes the response body.
-from fastapi import APIRouter
+#
+# Liveness vs readiness (like a k8s livenessProbe / readinessProbe):
+#   /health/live   200 as soon as the process answers HTTP — restart it if not
+#   /health/ready  503 until the lifespan warm-up has finished, then 200 —
+#                  route traffic only once this passes
+#   /health        legacy combined view, always 200, reports both flags
+from fastapi import APIRouter, Response, status
+
+from models.embeddings import embedding_model
+from models.migration import migration_model
+from models.warmup import is_ready, warmup_report
 
 # ── Router ─────────────────────────────────────────────────────────────────────
 router = APIRouter()
@@ -10,4 +20,31 @@ router = APIRouter()
 
 @router.get("/health")
 async def health():
-    return {"status": "ok", "embedding_model": "all-mpnet-base-v2"}
+    return {
+        "status": "ok",
+        "embedding_model": embedding_model.model_name,
+        "live": True,
+        "ready": is_ready(),
+    }
+
+
+@router.get("/health/live")
+async def health_live():
+    return {"status": "alive"}
+
+
+@router.get("/health/ready")
+async def health_ready(response: Response):
+    if not is_ready():
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "warming_up"}
+
+    target = migration_model()
+    return {
+        "status": "ready",
+        "embedding_model": embedding_model.model_version,
+        # set while the index is dual-encoded for a model swap
+        "migration_model": target.model_version if target else None,
+        # texts/sec measured per sequence length during warm-up
+        "warmup_texts_per_second": warmup_report(),
+    }
@@ -3,7 +3,7 @@ import json
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from routers.shared import ComputeRequest, wrap
+from routers.shared import ComputeRequest, WorkerClass, run_in_worker, wrap
 from handlers.matching_handler import score_matches
 from handlers.match_insight_handler import generate_match_insight
 from gemini.match_insight_engine import stream_match_insight
@@ -32,7 +32,10 @@ async def generate_match_insight_stream_endpoint(body: MatchInsightRequest):
 
 @router.post("/generate_match_insight")
 async def generate_match_insight_endpoint(body: MatchInsightRequest) -> dict:
-    result = generate_match_insight(
+    # The non-streaming Gemini client blocks on the network.
+    result = await run_in_worker(
+        WorkerClass.IO,
+        generate_match_insight,
         resume=body.resume,
         matches=body.matches,
         job_id=body.jobId,
@@ -43,7 +46,9 @@ async def generate_match_insight_endpoint(body: MatchInsightRequest) -> dict:
 @router.post("/score_matches")
 async def score_matches_endpoint(body: ComputeRequest) -> dict:
     data = body.model_dump()
-    result = score_matches(
+    result = await run_in_worker(
+        WorkerClass.CPU,
+        score_matches,
         resume=data.get("resume", {}),
         job_matches=data.get("jobMatches", []),
         skill_market_data=data.get("skillMarketData", []),  # ← added
@@ -42,6 +42,7 @@ from fastapi import APIRouter
 
 from routers.shared.request import ComputeRequest
 from routers.shared.response import wrap
+from routers.shared.worker_pools import WorkerClass, run_in_worker
 from handlers.salary_handler import predict_salary
 
 router = APIRouter(prefix="/compute")
@@ -52,7 +53,9 @@ async def predict_salary_endpoint(body: ComputeRequest):
     data = body.model_dump()
 
     return wrap(
-        predict_salary(
+        await run_in_worker(
+            WorkerClass.CPU,
+            predict_salary,
             seniority_level=data.get("seniority_level"),
             resume_score=data.get("resume_score"),
             total_experience_years=data.get(
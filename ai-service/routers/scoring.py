@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from routers.shared import ComputeRequest, wrap
+from routers.shared import ComputeRequest, WorkerClass, run_in_worker, wrap
 from handlers.resume_handlers import score_resume
 import logging
 
@@ -20,4 +20,6 @@ async def calculate_score(body: ComputeRequest) -> dict:
         "skillMarketData": data.get("skillMarketData", []),
     }
 
-    return wrap(score_resume(resume_body, scoring_payload))
+    return wrap(
+        await run_in_worker(WorkerClass.CPU, score_resume, resume_body, scoring_payload)
+    )
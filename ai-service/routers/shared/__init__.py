@@ -1,2 +1,5 @@
 from .request import ComputeRequest
 from .response import wrap
+from .deadline import AI_SERVICE_BULK_REQUEST_TIMEOUT_S, run_with_deadline
+from .vector_encoding import response_vector_encoding
+from .worker_pools import WorkerClass, run_in_worker
@@ -0,0 +1,78 @@
+# routers/shared/deadline.py
+"""
+Request deadlines for /compute routes.
+
+Node's aiClient gives up on a call after 30 s (backend/src/infrastructure/
+clients/aiClientHandler.ts) and says so in `X-Request-Timeout-Ms`. Routes
+without the header fall back to a per-route default. Either way the handler
+runs on a request worker pool (worker_pools.py) under a Deadline
+(models/deadline.py), so encoder work still queued when Node stops waiting
+— or when the client disconnects — is dropped before it reaches the model
+instead of computed and thrown away.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Callable, Optional
+
+from fastapi import Request
+
+from models.deadline import Deadline, request_deadline
+from routers.shared.worker_pools import WorkerClass, run_in_worker
+
+logger = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT_HEADER = "X-Request-Timeout-Ms"
+
+# Per-route defaults when the header is absent; 0 → no time limit.
+AI_SERVICE_REQUEST_TIMEOUT_S = float(
+    os.environ.get("AI_SERVICE_REQUEST_TIMEOUT_S", "30")
+)
+AI_SERVICE_BULK_REQUEST_TIMEOUT_S = float(
+    os.environ.get("AI_SERVICE_BULK_REQUEST_TIMEOUT_S", "30")
+)
+
+_DISCONNECT_POLL_S = 0.25
+
+
+def request_timeout_s(request: Request, default_s: float) -> Optional[float]:
+    """Seconds the caller will wait — the header if valid, else default_s."""
+    raw = request.headers.get(REQUEST_TIMEOUT_HEADER)
+    if raw is not None:
+        try:
+            timeout_ms = float(raw)
+            if timeout_ms > 0:
+                return timeout_ms / 1000
+        except ValueError:
+            pass
+        logger.warning(f"Ignoring invalid {REQUEST_TIMEOUT_HEADER}: {raw!r}")
+    return default_s if default_s > 0 else None
+
+
+async def run_with_deadline(
+    request: Request,
+    fn: Callable[..., dict],
+    *args: Any,
+    default_timeout_s: float = AI_SERVICE_REQUEST_TIMEOUT_S,
+    worker_class: WorkerClass = WorkerClass.EMBEDDING,
+    **kwargs: Any,
+) -> dict:
+    """
+    Run a blocking handler on worker_class's pool under the request's
+    deadline, cancelling it if the client disconnects first.
+    """
+    deadline = Deadline(request_timeout_s(request, default_timeout_s))
+    watcher = asyncio.create_task(_cancel_on_disconnect(request, deadline))
+    try:
+        # The pool copies this context, deadline included, into the worker.
+        with request_deadline(deadline):
+            return await run_in_worker(worker_class, fn, *args, **kwargs)
+    finally:
+        watcher.cancel()
+
+
+async def _cancel_on_disconnect(request: Request, deadline: Deadline) -> None:
+    while not await request.is_disconnected():
+        await asyncio.sleep(_DISCONNECT_POLL_S)
+    deadline.cancel()
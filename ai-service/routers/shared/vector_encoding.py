@@ -0,0 +1,43 @@
+# routers/shared/vector_encoding.py
+"""
+Per-request vector wire encoding for /compute embedding routes.
+
+Callers that can decode compact vectors ask for them with
+`X-Vector-Encoding: float16` or `int8` (see utils/vector_codec.py). No
+header, `json`, or an unknown value keeps the float-array default, so
+existing callers are unaffected.
+"""
+
+import logging
+from contextlib import contextmanager
+from typing import Generator
+
+from fastapi import Request
+
+from utils.vector_codec import VectorEncoding, vector_encoding
+
+logger = logging.getLogger(__name__)
+
+VECTOR_ENCODING_HEADER = "X-Vector-Encoding"
+
+
+def request_vector_encoding(request: Request) -> VectorEncoding:
+    """The encoding the caller asked for — JSON unless the header names another."""
+    raw = request.headers.get(VECTOR_ENCODING_HEADER)
+    if raw is None:
+        return VectorEncoding.JSON
+    try:
+        return VectorEncoding(raw.strip().lower())
+    except ValueError:
+        logger.warning(f"Ignoring invalid {VECTOR_ENCODING_HEADER}: {raw!r}")
+        return VectorEncoding.JSON
+
+
+@contextmanager
+def response_vector_encoding(request: Request) -> Generator[None, None, None]:
+    """
+    Serialize the enclosed handler's vectors as the request asked. Enter it
+    around run_with_deadline — the worker pool copies this context.
+    """
+    with vector_encoding(request_vector_encoding(request)):
+        yield
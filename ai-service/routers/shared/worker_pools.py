@@ -0,0 +1,141 @@
+# routers/shared/worker_pools.py
+"""
+Worker pools that keep blocking handlers off the event loop.
+
+Responsibility: give every /compute route an awaitable way to run its
+handler on a long-lived, bounded thread pool chosen by what the handler
+spends its time on.
+
+Routes are `async def`, so a handler called directly runs ON the event
+loop: while one resume scores, nothing else on that worker is served,
+/health and /metrics included. Each class of handler gets its own pool,
+so a flood of one kind cannot starve the others:
+
+    embedding   encoder-bound — torch releases the GIL in forward passes
+    cpu         pure-Python scoring, matching and salary prediction
+    io          blocking Gemini calls that mostly wait on the network
+
+WHAT THIS MODULE DOES:
+    - Runs fn(*args, **kwargs) on its class's pool and awaits the result
+    - Copies the caller's context into the worker, so the deadline,
+      priority lane and vector encoding set around the call still apply
+    - Publishes busy workers and dispatch wait per pool
+
+WHAT THIS MODULE DOES NOT DO:
+    - No deadlines — run_with_deadline (deadline.py) wraps this
+    - No process pools. Handlers share the in-process model, caches and
+      Mongo client, and payloads would have to be pickled both ways;
+      serve.py's pre-forked workers already spread CPU work over processes
+
+Pools start lazily on first use. A forked child (serve.py) gets fresh,
+empty pools — threads do not survive fork().
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from enum import StrEnum
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+
+from metrics.prometheus_metrics import (
+    worker_pool_busy_workers,
+    worker_pool_wait_seconds,
+)
+
+T = TypeVar("T")
+
+
+class WorkerClass(StrEnum):
+    EMBEDDING = "embedding"
+    CPU = "cpu"
+    IO = "io"
+
+
+AI_SERVICE_EMBEDDING_WORKERS = int(os.environ.get("AI_SERVICE_EMBEDDING_WORKERS", "8"))
+AI_SERVICE_CPU_WORKERS = int(os.environ.get("AI_SERVICE_CPU_WORKERS", "4"))
+AI_SERVICE_IO_WORKERS = int(os.environ.get("AI_SERVICE_IO_WORKERS", "16"))
+
+
+class WorkerPool:
+    """
+    A lazily started, fixed-size thread pool for one class of handler.
+
+    Args:
+        worker_class: Names the pool's threads and metric label.
+        max_workers:  Handlers of this class that may run at once; the
+                      rest wait for a thread.
+    """
+
+    def __init__(self, worker_class: WorkerClass, max_workers: int):
+        self.worker_class = worker_class
+        self.max_workers = max(1, max_workers)
+
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    async def run(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Run fn on this pool under the caller's context and await its result."""
+        call = partial(contextvars.copy_context().run, fn, *args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._ensure_pool(), self._call, call, time.perf_counter()
+        )
+
+    def _reset_after_fork(self) -> None:
+        """Child side of fork(): the pool's threads and its lock did not come along."""
+        self._pool = None
+        self._lock = threading.Lock()
+
+    # ── Internals ─────────────────────────────────────────────────────────────
+
+    def _ensure_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=f"worker-{self.worker_class}",
+                )
+            return self._pool
+
+    def _call(self, call: Callable[[], T], dispatched_at: float) -> T:
+        label = self.worker_class.value
+        worker_pool_wait_seconds.labels(pool=label).observe(
+            time.perf_counter() - dispatched_at
+        )
+        busy = worker_pool_busy_workers.labels(pool=label)
+        busy.inc()
+        try:
+            return call()
+        finally:
+            busy.dec()
+
+
+worker_pools: dict[WorkerClass, WorkerPool] = {
+    WorkerClass.EMBEDDING: WorkerPool(
+        WorkerClass.EMBEDDING, AI_SERVICE_EMBEDDING_WORKERS
+    ),
+    WorkerClass.CPU: WorkerPool(WorkerClass.CPU, AI_SERVICE_CPU_WORKERS),
+    WorkerClass.IO: WorkerPool(WorkerClass.IO, AI_SERVICE_IO_WORKERS),
+}
+
+
+async def run_in_worker(
+    worker_class: WorkerClass, fn: Callable[..., T], /, *args: Any, **kwargs: Any
+) -> T:
+    """Run a blocking handler on its class's pool without blocking the loop."""
+    return await worker_pools[worker_class].run(fn, *args, **kwargs)
+
+
+def _reset_pools_after_fork() -> None:
+    for pool in worker_pools.values():
+        pool._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):  # POSIX only
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
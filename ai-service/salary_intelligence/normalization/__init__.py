@@ -19,6 +19,7 @@ from .constants import (
     FREQUENCY_MONTH,
     FREQUENCY_YEAR,
     VALID_FREQUENCIES,
+    SENIORITY_LEVELS,
     SUPPORTED_CURRENCIES,
     BASE_CURRENCY,
 )
@@ -46,6 +47,7 @@ __all__ = [
     "FREQUENCY_MONTH",
     "FREQUENCY_YEAR",
     "VALID_FREQUENCIES",
+    "SENIORITY_LEVELS",
     "SUPPORTED_CURRENCIES",
     "BASE_CURRENCY",
     # types
@@ -9,6 +9,9 @@ This ensures compatibility when seeding JobTitle data from external sources.
 
 Frequency enum values match the jobPosting schema exactly:
     ['hour', 'day', 'week', 'month', 'year']
+
+Seniority enum values match jobPosting.experienceLevel exactly:
+    ['Intern', 'Entry', 'Mid-Level', 'Senior']
 """
 # ── Work schedule conventions ─────────────────────────────────────────────────
 
@@ -53,6 +56,21 @@ FREQUENCY_TO_YEARLY_MULTIPLIER: dict[str, int] = {
     FREQUENCY_YEAR: 1,
 }
 
+# ── Seniority enum ────────────────────────────────────────────────────────────
+# Matches jobPosting.experienceLevel schema enum exactly, lowest to highest.
+
+SENIORITY_INTERN: str = "Intern"
+SENIORITY_ENTRY: str = "Entry"
+SENIORITY_MID_LEVEL: str = "Mid-Level"
+SENIORITY_SENIOR: str = "Senior"
+
+SENIORITY_LEVELS: tuple[str, ...] = (
+    SENIORITY_INTERN,
+    SENIORITY_ENTRY,
+    SENIORITY_MID_LEVEL,
+    SENIORITY_SENIOR,
+)
+
 # ── Currency enum ─────────────────────────────────────────────────────────────
 # Matches currency fields across JobTitle, Skill, Location, Industry schemas.
 
@@ -1,20 +1,70 @@
-from utils.tensor_utils import tensor_to_list
+from models.projection import project, projection_for
+from utils.tensor_utils import (
+    MODEL_VERSION_KEY,
+    NORMALIZED_FLAG,
+    PROJECTION_KEY,
+    tensor_to_list,
+)
+from utils.vector_codec import encode_vector
 
 
-def serialize_job_embeddings(job_id, emb) -> dict:
+def serialize_job_embeddings(job_id, emb, model_version: str) -> dict:
+    projection = projection_for(model_version)
+    # Reused sections are left out — Node keeps the vectors it stored.
+    reused = set(emb.reused_sections)
     return {
         "job_id": job_id,
+        NORMALIZED_FLAG: True,  # every vector below is unit length
+        MODEL_VERSION_KEY: model_version,  # ...and produced by this model
+        # Covers the section vectors only — backfill rows are never projected.
+        PROJECTION_KEY: projection.version if projection else None,
+        # Every section vector is a float array or, if the caller negotiated
+        # it, a compact object (utils/vector_codec.py).
         "embeddings": {
-            "jobTitle": tensor_to_list(emb.job_title),
-            "location": tensor_to_list(emb.location),
+            key: encode_vector(project(vector, projection))
+            for key, vector in (
+                ("jobTitle", emb.job_title),
+                ("location", emb.location),
+            )
+            if key not in reused
         },
         "meanEmbeddings": {
-            "skills": tensor_to_list(emb.skills),
+            key: encode_vector(project(vector, projection))
+            for key, vector in (("skills", emb.skills),)
+            if key not in reused
         },
+        "fingerprints": emb.section_fingerprints or {},
+        "reusedSections": list(emb.reused_sections),
+        # Backfill rows are written into the market docs Node sends back as
+        # doc vectors on every request, so they stay full-precision floats
+        # whatever encoding the caller negotiated.
         "skill_ids_to_backfill": emb.skill_ids_to_backfill,
         "skill_embeddings_to_backfill": [
             tensor_to_list(e) for e in emb.skill_embeddings_to_backfill
         ],
         "job_title_id_to_backfill": emb.job_title_id_to_backfill,
         "location_id_to_backfill": emb.location_id_to_backfill,
+        # Market docs stay full-dimensional, so they get their own copy of the
+        # title / location vector rather than the projected one in embeddings.
+        "job_title_embedding_to_backfill": (
+            tensor_to_list(emb.job_title) if emb.job_title_id_to_backfill else None
+        ),
+        "location_embedding_to_backfill": (
+            tensor_to_list(emb.location) if emb.location_id_to_backfill else None
+        ),
+    }
+
+
+def serialize_job_embeddings_batch(jobs, outcomes, model_version: str) -> dict:
+    """One entry per job, in request order — its embeddings or its error."""
+    results = [
+        {"job_id": job.get("_id"), "error": str(emb)}
+        if isinstance(emb, Exception)
+        else serialize_job_embeddings(job.get("_id"), emb, model_version)
+        for job, emb in zip(jobs, outcomes)
+    ]
+    return {
+        MODEL_VERSION_KEY: model_version,
+        "results": results,
+        "failed": sum(1 for r in results if "error" in r),
     }
@@ -0,0 +1,183 @@
+"""
+Pre-fork server for app.py.
+
+Responsibility: import the app and load the embedding model ONCE in a
+parent process, then fork N uvicorn workers that share the weight pages
+copy-on-write instead of each loading its own ~420 MB copy.
+
+    python serve.py --workers 4 --port 8000
+
+`uvicorn app:app --workers N` spawns fresh interpreters, so every worker
+re-imports app.py and loads the model itself: memory grows by a full model
+per worker. Here the parent pays for it once.
+
+WHAT THIS MODULE DOES:
+    - Disables the GC while importing app.py, then gc.freeze()s everything
+      that exists at fork time. Frozen objects are never scanned by a
+      worker's collector, so their pages are never written — and never
+      copied — just because a worker ran gc
+    - Binds the listening socket once; every worker accept()s on it
+    - Gives each worker cores / workers torch threads (AI_SERVICE_TORCH_THREADS)
+    - Supervises: respawns workers that die, forwards SIGTERM / SIGINT
+
+WHAT THIS MODULE DOES NOT DO:
+    - No hot reload — use `uvicorn app:app --reload` for development
+    - No metric aggregation — each worker serves its own /metrics
+    - No Windows support (os.fork)
+
+Benchmark RSS / PSS per worker and throughput for 1..N workers with
+`python -m benchmarks.prefork_workers` (see README).
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+
+import torch
+from fastapi import FastAPI
+
+logger = logging.getLogger(__name__)
+
+AI_SERVICE_WORKERS = int(os.environ.get("AI_SERVICE_WORKERS", "2"))
+# torch intra-op threads per worker; 0 → split the machine's cores evenly.
+AI_SERVICE_TORCH_THREADS = int(os.environ.get("AI_SERVICE_TORCH_THREADS", "0"))
+
+# A worker that dies sooner than this after spawning is crash-looping —
+# back off before replacing it instead of forking in a tight loop.
+_RESPAWN_BACKOFF_S = 1.0
+
+
+def _bind(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)  # uvicorn's default backlog
+    sock.set_inheritable(True)
+    return sock
+
+
+def _worker_threads(workers: int) -> int:
+    if AI_SERVICE_TORCH_THREADS > 0:
+        return AI_SERVICE_TORCH_THREADS
+    return max(1, (os.cpu_count() or 1) // workers)
+
+
+def _run_worker(app: FastAPI, sock: socket.socket, torch_threads: int) -> None:
+    """Child side of the fork. Never returns."""
+    import uvicorn
+
+    # Drop the parent's supervisor handlers — uvicorn installs its own.
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    gc.enable()
+    # The parent never ran a parallel region, so this builds a fresh
+    # OpenMP pool in the child rather than inheriting a dead one.
+    torch.set_num_threads(torch_threads)
+
+    try:
+        server = uvicorn.Server(uvicorn.Config(app))
+        server.run(sockets=[sock])
+    except BaseException:
+        logger.exception(f"[prefork] worker {os.getpid()} crashed")
+        os._exit(1)
+    os._exit(0)
+
+
+def serve(host: str, port: int, workers: int) -> int:
+    # Keep the parent single-threaded inside torch: an OpenMP pool created
+    # here would not survive fork() and could hang the workers' first encode.
+    torch.set_num_threads(1)
+
+    # No collections while app.py loads — freed objects would leave holes
+    # in pages that every worker then shares (and later dirties).
+    gc.disable()
+    from app import app
+    from models.embeddings import embedding_model
+    from models.migration import migration_model
+
+    # Importing app no longer loads the weights — load them here, pre-fork,
+    # so every worker shares them; each worker's lifespan load is a no-op.
+    embedding_model.load()
+    target = migration_model()
+    if target is not None:
+        target.load()
+
+    sock = _bind(host, port)
+    torch_threads = _worker_threads(workers)
+    gc.freeze()
+
+    children: dict[int, float] = {}  # pid → spawn time
+    stopping = False
+
+    def _spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            _run_worker(app, sock, torch_threads)
+        children[pid] = time.monotonic()
+        logger.info(f"[prefork] started worker {pid}")
+
+    def _stop(signum: int, _frame: object) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    logger.info(
+        f"[prefork] serving on {host}:{port} — {workers} workers, "
+        f"{torch_threads} torch threads each"
+    )
+    for _ in range(workers):
+        _spawn()
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+
+        started = children.pop(pid, None)
+        if started is None or stopping:
+            continue
+
+        logger.error(
+            f"[prefork] worker {pid} exited unexpectedly "
+            f"(status {os.waitstatus_to_exitcode(status)}) — respawning"
+        )
+        if time.monotonic() - started < _RESPAWN_BACKOFF_S:
+            time.sleep(_RESPAWN_BACKOFF_S)
+        if not stopping:
+            _spawn()
+
+    sock.close()
+    logger.info("[prefork] all workers stopped")
+    return 0
+
+
+def _main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python serve.py")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=AI_SERVICE_WORKERS)
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return serve(args.host, args.port, args.workers)
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
@@ -21,11 +21,13 @@ Node payload contract for compare():
             "skills":         float[] | null,
             "workExperience": float[] | null,
             "certifications": float[] | null,
+            "normalized":     bool,          # optional — true skips re-normalizing
         },
         "jobEmbeddings": {
             "skills":       float[] | null,
             "requirements": float[] | null,
             "title":        float[] | null,
+            "normalized":   bool,            # optional
         },
         "resume": {          # only needed for detailed skill analysis
             "skills": [{ "name": str }, ...]
@@ -34,12 +36,18 @@ Node payload contract for compare():
             "skills": [{ "name": str }, ...]
         }
     }
+
+Untagged vectors (anything cached before the unit-length contract) are
+normalized on read; see services/similarity_service.py.
 """
 
-import torch
 from typing import Optional, Dict
 import logging
-from services.similarity_service import SimilarityService, SimilarityWeights
+from services.similarity_service import (
+    SimilarityScore,
+    SimilarityService,
+    SimilarityWeights,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -47,21 +55,6 @@ logger = logging.getLogger(__name__)
 class ComparisonService:
     """Handles resume-to-job comparison. Pure compute — no DB access."""
 
-    # ──────────────────────────────────────────────────────────────────────
-    # Tensor helpers
-    # ──────────────────────────────────────────────────────────────────────
-
-    @staticmethod
-    def _to_tensor(value) -> Optional[torch.Tensor]:
-        """Convert a list or existing tensor to a torch.Tensor, or return None."""
-        if value is None:
-            return None
-        if isinstance(value, torch.Tensor):
-            return value
-        if isinstance(value, list) and value:
-            return torch.tensor(value)
-        return None
-
     # ──────────────────────────────────────────────────────────────────────
     # Core comparison — pure compute
     # ──────────────────────────────────────────────────────────────────────
@@ -78,7 +71,8 @@ class ComparisonService:
         Compare a resume to a job using pre-computed embedding vectors.
 
         Node fetches and caches embeddings; Python receives them as plain lists
-        and runs cosine similarity. No DB access whatsoever.
+        and runs cosine similarity (a dot product over unit vectors). No DB access
+        whatsoever.
 
         Args:
             resume_embeddings: Dict of { skills, workExperience, certifications }
@@ -95,24 +89,22 @@ class ComparisonService:
             Dict with similarity scores, percentages, recommendation level,
             and optional skill gap analysis.
         """
-        to_t = ComparisonService._to_tensor
-
-        resume_skills_t = to_t(resume_embeddings.get("skills"))
-        resume_work_t = to_t(resume_embeddings.get("workExperience"))
-        resume_certs_t = to_t(resume_embeddings.get("certifications"))
-
-        job_skills_t = to_t(job_embeddings.get("skills"))
-        job_reqs_t = to_t(job_embeddings.get("requirements"))
-        job_title_t = to_t(job_embeddings.get("title"))
+        score = SimilarityService.calculate_similarity(
+            resume_embeddings, job_embeddings, weights
+        )
+        return ComparisonService._build_result(score, resume, job)
 
-        if weights is None:
-            weights = SimilarityWeights()
-
-        skill_sim = SimilarityService.cosine_similarity(resume_skills_t, job_skills_t)
-        exp_sim = SimilarityService.cosine_similarity(resume_work_t, job_title_t)
-        req_sim = SimilarityService.cosine_similarity(resume_certs_t, job_reqs_t)
-
-        total_score = skill_sim * weights.skills + exp_sim * weights.experience
+    @staticmethod
+    def _build_result(
+        score: SimilarityScore,
+        resume: Optional[dict] = None,
+        job: Optional[dict] = None,
+    ) -> Dict:
+        """Turn a SimilarityScore into the response dict, with optional skill gaps."""
+        skill_sim = score.skill_similarity
+        exp_sim = score.experience_similarity
+        req_sim = score.requirement_similarity
+        total_score = score.total_score
 
         result: Dict = {
             "skillSimilarity": float(skill_sim) if skill_sim is not None else None,
@@ -211,13 +203,15 @@ class ComparisonService:
         Returns:
             List of comparison result dicts, each including the jobId.
         """
+        scores = SimilarityService.calculate_similarity_batch(
+            resume_embeddings,
+            [job_payload.get("jobEmbeddings", {}) for job_payload in jobs_payload],
+            weights,
+        )
+
         results = []
-        for job_payload in jobs_payload:
-            result = ComparisonService.compare(
-                resume_embeddings=resume_embeddings,
-                job_embeddings=job_payload.get("jobEmbeddings", {}),
-                weights=weights,
-            )
+        for job_payload, score in zip(jobs_payload, scores):
+            result = ComparisonService._build_result(score)
             result["jobId"] = job_payload.get("jobId")
             results.append(result)
         return results
@@ -15,6 +15,7 @@ import logging
 from typing import Any
 from utils.date_utils import calculate_total_experience
 from metrics.prometheus_metrics import matching_score_tiers_total
+from salary_intelligence.normalization.constants import SENIORITY_LEVELS
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +36,7 @@ PENALTY_DOMAIN_MISMATCH = (
     0.35  # near-zero skill overlap on a skilled role — different field entirely
 )
 
-SENIORITY_LADDER = ["Intern", "Entry", "Mid-Level", "Senior"]
+SENIORITY_LADDER = list(SENIORITY_LEVELS)
 SENIORITY_LADDER_NORMALIZED = [level.lower() for level in SENIORITY_LADDER]
 
 DOMAIN_MISMATCH_SKILL_THRESHOLD = (
@@ -6,10 +6,18 @@ ARCHITECTURE NOTE:
     zero DB access, returns embeddings only.
 """
 
-from typing import Optional, NamedTuple
-import torch
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, NamedTuple, Union
 import logging
-from infrastructure.embeddings.embedding_orchestrator import extract_embeddings_parallel
+from infrastructure.embeddings.doc_pool import DocPool
+from infrastructure.embeddings.embedding_orchestrator import (
+    extract_embeddings_batch,
+    extract_embeddings_parallel,
+)
+
+if TYPE_CHECKING:
+    import torch
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +35,10 @@ class JobEmbeddings(NamedTuple):
     skill_embeddings_to_backfill: list[torch.Tensor]
     job_title_id_to_backfill: Optional[str]
     location_id_to_backfill: Optional[str]
+    # Incremental re-embedding — {section_key: input fingerprint}, and the
+    # sections left empty because the caller's fingerprint still matched
+    section_fingerprints: Optional[dict[str, Optional[str]]] = None
+    reused_sections: tuple[str, ...] = ()
 
 
 class JobService:
@@ -38,6 +50,7 @@ class JobService:
         skill_docs: list[dict],
         job_title_doc: Optional[dict],
         location_doc: Optional[dict],
+        previous_fingerprints: Optional[dict[str, str]] = None,
     ) -> JobEmbeddings:
         """
         Extract embeddings from a job posting using pre-fetched market documents.
@@ -52,6 +65,9 @@ class JobService:
                            Shape: { _id, title, embedding | null }
             location_doc:  Pre-fetched location doc for job.location, or None.
                            Shape: { _id, name, embedding | null }
+            previous_fingerprints: section_fingerprints from this job's last
+                           run. Sections whose input is unchanged are reused,
+                           not recomputed.
 
         Returns:
             JobEmbeddings with all computed tensors.
@@ -63,8 +79,53 @@ class JobService:
             skill_docs=skill_docs,
             job_title_doc=job_title_doc,
             location_doc=location_doc,
+            previous_fingerprints=previous_fingerprints,
+        )
+        return JobService._to_embeddings(result)
+
+    @staticmethod
+    def extract_embeddings_batch(
+        jobs: list[dict],
+        pool: DocPool,
+        previous_fingerprints: Optional[dict[str, dict[str, str]]] = None,
+    ) -> list[Union[JobEmbeddings, Exception]]:
+        """
+        extract_embeddings for many job postings, sharing one encoder call.
+
+        Args:
+            jobs: Job posting dicts, as for extract_embeddings.
+            pool: The batch's shared skill / job title / location docs — each
+                  job gets the docs its single-document call would have.
+            previous_fingerprints: Per job _id, as for extract_embeddings.
+
+        Returns:
+            Per job, in order: its JobEmbeddings, or the exception that failed it.
+        """
+        results = extract_embeddings_batch(
+            "job_posting",
+            [
+                (
+                    str(job.get("_id") or "unknown"),
+                    {
+                        "job": job,
+                        "skill_docs": pool.skill_docs_for(job.get("skills", [])),
+                        "job_title_doc": pool.job_title_doc_for(job.get("jobTitle")),
+                        "location_doc": pool.location_doc_for(job.get("location")),
+                        "previous_fingerprints": (previous_fingerprints or {}).get(
+                            str(job.get("_id"))
+                        ),
+                    },
+                )
+                for job in jobs
+            ],
         )
+        return [
+            r if isinstance(r, Exception) else JobService._to_embeddings(r)
+            for r in results
+        ]
 
+    @staticmethod
+    def _to_embeddings(result: dict) -> JobEmbeddings:
         return JobEmbeddings(
             skills=result["skills"],
             requirements=result["requirements"],
@@ -75,6 +136,8 @@ class JobService:
             skill_embeddings_to_backfill=result.get("skill_embeddings_to_backfill", []),
             job_title_id_to_backfill=result.get("job_title_id_to_backfill"),
             location_id_to_backfill=result.get("location_id_to_backfill"),
+            section_fingerprints=result.get("section_fingerprints"),
+            reused_sections=tuple(result.get("reused_sections", ())),
         )
 
     @staticmethod
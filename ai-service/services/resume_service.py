@@ -8,12 +8,20 @@ ARCHITECTURE NOTE:
     so Node can write null-embedding updates back.
 """
 
-from typing import Optional, NamedTuple
-import torch
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, NamedTuple, Union
 import logging
-from infrastructure.embeddings.embedding_orchestrator import extract_embeddings_parallel
+from infrastructure.embeddings.doc_pool import DocPool
+from infrastructure.embeddings.embedding_orchestrator import (
+    extract_embeddings_batch,
+    extract_embeddings_parallel,
+)
 from utils.date_utils import calculate_total_experience
 
+if TYPE_CHECKING:
+    import torch
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,6 +39,10 @@ class ResumeEmbeddings(NamedTuple):
     skill_embeddings_to_backfill: list[torch.Tensor]
     job_title_id_to_backfill: Optional[str]
     location_id_to_backfill: Optional[str]
+    # Incremental re-embedding — {section_key: input fingerprint}, and the
+    # sections left empty because the caller's fingerprint still matched
+    section_fingerprints: Optional[dict[str, Optional[str]]] = None
+    reused_sections: tuple[str, ...] = ()
 
 
 class ResumeService:
@@ -43,6 +55,7 @@ class ResumeService:
         job_title_doc: Optional[dict],
         location_doc: Optional[dict],
         work_experience_title_docs: list[dict],
+        previous_fingerprints: Optional[dict[str, str]] = None,
     ) -> ResumeEmbeddings:
         """
         Extract embeddings from a resume using pre-fetched market documents.
@@ -65,6 +78,9 @@ class ResumeService:
             work_experience_title_docs: Pre-fetched job title docs for each entry
                                         in resume.workExperience[].jobTitle.
                                         Same shape as job_title_doc.
+            previous_fingerprints:      section_fingerprints from this resume's
+                                        last run. Sections whose input is
+                                        unchanged are reused, not recomputed.
 
         Returns:
             ResumeEmbeddings with all tensors and backfill candidates.
@@ -77,8 +93,65 @@ class ResumeService:
             job_title_doc=job_title_doc,
             location_doc=location_doc,
             work_experience_title_docs=work_experience_title_docs,
+            previous_fingerprints=previous_fingerprints,
+        )
+        return ResumeService._to_embeddings(resume, result)
+
+    @staticmethod
+    def extract_embeddings_batch(
+        resumes: list[dict],
+        pool: DocPool,
+        previous_fingerprints: Optional[dict[str, dict[str, str]]] = None,
+    ) -> list[Union[ResumeEmbeddings, Exception]]:
+        """
+        extract_embeddings for many resumes, sharing one encoder call.
+
+        Args:
+            resumes: Resume dicts, as for extract_embeddings.
+            pool:    The batch's shared skill / job title / location docs —
+                     each resume gets the docs its single-document call
+                     would have, work-experience titles included.
+            previous_fingerprints: Per resume _id, as for extract_embeddings.
+
+        Returns:
+            Per resume, in order: its ResumeEmbeddings, or the exception that
+            failed it.
+        """
+        results = extract_embeddings_batch(
+            "resume",
+            [
+                (
+                    str(resume.get("_id") or "unknown"),
+                    {
+                        "resume": resume,
+                        "skill_docs": pool.skill_docs_for(resume.get("skills", [])),
+                        "job_title_doc": pool.job_title_doc_for(resume.get("jobTitle")),
+                        "location_doc": pool.location_doc_for(resume.get("location")),
+                        "work_experience_title_docs": pool.job_title_docs_for(
+                            resume.get("workExperience", [])
+                        ),
+                        "previous_fingerprints": (previous_fingerprints or {}).get(
+                            str(resume.get("_id"))
+                        ),
+                    },
+                )
+                for resume in resumes
+            ],
         )
+        out: list[Union[ResumeEmbeddings, Exception]] = []
+        for resume, result in zip(resumes, results):
+            try:
+                out.append(
+                    result
+                    if isinstance(result, Exception)
+                    else ResumeService._to_embeddings(resume, result)
+                )
+            except Exception as e:  # e.g. unparseable work-experience dates
+                out.append(e)
+        return out
 
+    @staticmethod
+    def _to_embeddings(resume: dict, result: dict) -> ResumeEmbeddings:
         total_exp = calculate_total_experience(resume.get("workExperience", []))
 
         return ResumeEmbeddings(
@@ -92,4 +165,6 @@ class ResumeService:
             skill_embeddings_to_backfill=result.get("skill_embeddings_to_backfill", []),
             job_title_id_to_backfill=result.get("job_title_id_to_backfill"),
             location_id_to_backfill=result.get("location_id_to_backfill"),
+            section_fingerprints=result.get("section_fingerprints"),
+            reused_sections=tuple(result.get("reused_sections", ())),
         )
@@ -5,19 +5,42 @@ ARCHITECTURE NOTE:
     Zero DB access. Accepts pre-populated embedding dicts (float[] or None)
     as received from Node.js. All DB fetching belongs to the Node layer.
 
-Cosine similarity quick reference:
-    F.cosine_similarity(a, b) → range [-1, 1]
-    We clamp to [0, 1] — negative similarity isn't meaningful for embeddings.
-    unsqueeze(0) adds the batch dimension F.cosine_similarity expects: [features] → [1, features]
+Vector contract (utils/tensor_utils.py):
+    Incoming vectors are L2-normalized on read, so cosine similarity reduces
+    to a dot product, and one resume vs N jobs to a single (N, D) @ (D,)
+    matmul per component. A dict tagged { "normalized": true } is trusted
+    as-is and skips the rescale. Scores are clamped to [0, 1] — negative
+    similarity isn't meaningful for embeddings.
+
+Projected vectors (models/projection.py):
+    A dict tagged { "projection": "<version>" } holds PCA-projected vectors.
+    Dicts in the same space are compared as they are. When full vectors
+    meet vectors in the configured projection, the full ones are projected
+    to match. Vectors in any other projection score 0.0.
 """
 
-import torch
-import torch.nn.functional as F
-from typing import Optional, NamedTuple
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, NamedTuple
 import logging
 
+from models.projection import get_projection
+from utils.tensor_utils import NORMALIZED_FLAG, PROJECTION_KEY, to_unit_tensor
+
+if TYPE_CHECKING:
+    import torch
+
+    from models.projection import Projection
+
 logger = logging.getLogger(__name__)
 
+# (resume key, job key) for each score component, in SimilarityScore order.
+_COMPONENTS: tuple[tuple[str, str], ...] = (
+    ("skills", "skills"),
+    ("workExperience", "title"),
+    ("certifications", "requirements"),
+)
+
 
 class SimilarityScore(NamedTuple):
     """Scores returned by calculate_similarity()."""
@@ -41,15 +64,14 @@ class SimilarityService:
     """Cosine similarity calculations between resume and job embeddings."""
 
     @staticmethod
-    def _to_tensor(value) -> Optional[torch.Tensor]:
-        """Convert a float list or existing tensor to a torch.Tensor, or return None."""
-        if value is None:
-            return None
-        if isinstance(value, torch.Tensor):
-            return value
-        if isinstance(value, list) and value:
-            return torch.tensor(value, dtype=torch.float32)
-        return None
+    def _to_tensor(value, normalized: bool = False) -> Optional[torch.Tensor]:
+        """Convert a float list or tensor to a flat unit-length tensor, or return None."""
+        return to_unit_tensor(value, normalized=normalized)
+
+    @staticmethod
+    def _is_tagged(embeddings: dict) -> bool:
+        """True when the payload declares its vectors already unit length."""
+        return embeddings.get(NORMALIZED_FLAG) is True
 
     @staticmethod
     def cosine_similarity(
@@ -57,28 +79,36 @@ class SimilarityService:
         tensor2: Optional[torch.Tensor],
     ) -> float:
         """
-        Cosine similarity between two embedding tensors, clamped to [0, 1].
+        Cosine similarity between two embedding tensors of any length, clamped
+        to [0, 1]. Normalizes both sides first — prefer dot_similarity() when
+        the inputs are already unit vectors.
 
         Returns 0.0 if either tensor is None or an error occurs.
         """
-        if tensor1 is None or tensor2 is None:
+        return SimilarityService.dot_similarity(
+            to_unit_tensor(tensor1), to_unit_tensor(tensor2)
+        )
+
+    @staticmethod
+    def dot_similarity(
+        unit1: Optional[torch.Tensor],
+        unit2: Optional[torch.Tensor],
+    ) -> float:
+        """
+        Cosine similarity of two flat unit vectors — a plain dot product,
+        clamped to [0, 1].
+
+        Returns 0.0 if either tensor is None or an error occurs
+        (e.g. a dimension mismatch).
+        """
+        if unit1 is None or unit2 is None:
             return 0.0
 
-        try:
-            if not isinstance(tensor1, torch.Tensor):
-                tensor1 = torch.tensor(tensor1, dtype=torch.float32)
-            if not isinstance(tensor2, torch.Tensor):
-                tensor2 = torch.tensor(tensor2, dtype=torch.float32)
-
-            # flatten() handles any accidental shape mismatches (e.g. [2, 384] → [768])
-            # unsqueeze(0) adds the batch dim F.cosine_similarity requires: [768] → [1, 768]
-            similarity = F.cosine_similarity(
-                tensor1.flatten().unsqueeze(0),
-                tensor2.flatten().unsqueeze(0),
-            ).item()
+        import torch
 
+        try:
+            similarity = torch.dot(unit1, unit2).item()
             return max(0.0, min(1.0, similarity))
-
         except Exception as e:
             logger.error(f"Error calculating cosine similarity: {e}")
             return 0.0
@@ -98,8 +128,10 @@ class SimilarityService:
             requirement_similarity:  resume.certifications ↔ job.requirements
 
         Args:
-            resume_embeddings: { "skills": float[], "workExperience": float[], "certifications": float[] }
-            job_embeddings:    { "skills": float[], "title": float[], "requirements": float[] }
+            resume_embeddings: { "skills": float[], "workExperience": float[], "certifications": float[],
+                                 "normalized"?: bool }
+            job_embeddings:    { "skills": float[], "title": float[], "requirements": float[],
+                                 "normalized"?: bool }
             weights:           Optional custom weights; defaults to skills=0.65, experience=0.35.
 
         Returns:
@@ -108,31 +140,19 @@ class SimilarityService:
         if weights is None:
             weights = SimilarityWeights()
 
-        to_tensor = SimilarityService._to_tensor
+        space = SimilarityService._comparison_space(resume_embeddings, [job_embeddings])
+        vector = SimilarityService._vector
 
-        skill_similarity = SimilarityService.cosine_similarity(
-            to_tensor(resume_embeddings.get("skills")),
-            to_tensor(job_embeddings.get("skills")),
-        )
-        experience_similarity = SimilarityService.cosine_similarity(
-            to_tensor(resume_embeddings.get("workExperience")),
-            to_tensor(job_embeddings.get("title")),
-        )
-        requirement_similarity = SimilarityService.cosine_similarity(
-            to_tensor(resume_embeddings.get("certifications")),
-            to_tensor(job_embeddings.get("requirements")),
-        )
-
-        total_score = (
-            skill_similarity * weights.skills
-            + experience_similarity * weights.experience
+        skill_similarity, experience_similarity, requirement_similarity = (
+            SimilarityService.dot_similarity(
+                vector(resume_embeddings, resume_key, space),
+                vector(job_embeddings, job_key, space),
+            )
+            for resume_key, job_key in _COMPONENTS
         )
 
-        return SimilarityScore(
-            skill_similarity=skill_similarity,
-            experience_similarity=experience_similarity,
-            requirement_similarity=requirement_similarity,
-            total_score=total_score,
+        return SimilarityService._score(
+            skill_similarity, experience_similarity, requirement_similarity, weights
         )
 
     @staticmethod
@@ -144,6 +164,9 @@ class SimilarityService:
         """
         Calculate similarity between one resume and multiple jobs.
 
+        Each component is one (N, D) @ (D,) matmul over every job that has
+        that vector, instead of N separate pairwise calls.
+
         Args:
             resume_embeddings:   Same shape as calculate_similarity().
             job_embeddings_list: List of job embedding dicts.
@@ -152,9 +175,117 @@ class SimilarityService:
         Returns:
             One SimilarityScore per job, in the same order as job_embeddings_list.
         """
-        return [
-            SimilarityService.calculate_similarity(
-                resume_embeddings, job_embeddings, weights
+        if weights is None:
+            weights = SimilarityWeights()
+
+        space = SimilarityService._comparison_space(
+            resume_embeddings, job_embeddings_list
+        )
+        vector = SimilarityService._vector
+
+        columns = [
+            SimilarityService._score_column(
+                vector(resume_embeddings, resume_key, space),
+                [vector(job, job_key, space) for job in job_embeddings_list],
             )
-            for job_embeddings in job_embeddings_list
+            for resume_key, job_key in _COMPONENTS
+        ]
+
+        return [
+            SimilarityService._score(skill, experience, requirement, weights)
+            for skill, experience, requirement in zip(*columns)
         ]
+
+    # ── Internals ─────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _comparison_space(
+        resume_embeddings: dict, job_embeddings_list: list[dict]
+    ) -> tuple[Optional[str], Optional[Projection]]:
+        """
+        The space every vector is compared in: (projection tag or None for
+        full vectors, projection that maps full vectors into it or None).
+        """
+        payloads = [resume_embeddings, *job_embeddings_list]
+        tags = {p.get(PROJECTION_KEY) for p in payloads}
+        if len(tags) == 1:
+            return tags.pop(), None
+
+        projection = get_projection()
+        if projection is not None and tags <= {None, projection.version}:
+            return projection.version, projection
+
+        target = resume_embeddings.get(PROJECTION_KEY)
+        logger.error(
+            f"Embeddings in incomparable projections {sorted(map(str, tags))} — "
+            f"only vectors in {target or 'full dimensions'} are scored"
+        )
+        return target, None
+
+    @staticmethod
+    def _vector(
+        embeddings: dict,
+        key: str,
+        space: tuple[Optional[str], Optional[Projection]],
+    ) -> Optional[torch.Tensor]:
+        """embeddings[key] as a unit tensor in the comparison space, or None."""
+        tag, projection = space
+        vector = SimilarityService._to_tensor(
+            embeddings.get(key), SimilarityService._is_tagged(embeddings)
+        )
+        if vector is None or embeddings.get(PROJECTION_KEY) == tag:
+            return vector
+        if embeddings.get(PROJECTION_KEY) is None and projection is not None:
+            if vector.numel() == projection.mean.numel():
+                return projection.apply(vector)
+        return None
+
+    @staticmethod
+    def _score_column(
+        resume_vector: Optional[torch.Tensor],
+        job_vectors: list[Optional[torch.Tensor]],
+    ) -> list[float]:
+        """Dot one resume vector against every job vector in a single matmul."""
+        scores = [0.0] * len(job_vectors)
+        if resume_vector is None:
+            return scores
+
+        matched = [
+            (i, v)
+            for i, v in enumerate(job_vectors)
+            if v is not None and v.numel() == resume_vector.numel()
+        ]
+        skipped = sum(1 for v in job_vectors if v is not None) - len(matched)
+        if skipped:
+            logger.error(
+                f"Error calculating cosine similarity: {skipped} job vector(s) "
+                f"do not match resume dimension {resume_vector.numel()}"
+            )
+        if not matched:
+            return scores
+
+        import torch
+
+        matrix = torch.stack([v for _, v in matched])
+        similarities = (matrix @ resume_vector).clamp(0.0, 1.0).tolist()
+        for (i, _), similarity in zip(matched, similarities):
+            scores[i] = similarity
+        return scores
+
+    @staticmethod
+    def _score(
+        skill_similarity: float,
+        experience_similarity: float,
+        requirement_similarity: float,
+        weights: SimilarityWeights,
+    ) -> SimilarityScore:
+        total_score = (
+            skill_similarity * weights.skills
+            + experience_similarity * weights.experience
+        )
+        return SimilarityScore(
+            skill_similarity=skill_similarity,
+            experience_similarity=experience_similarity,
+            requirement_similarity=requirement_similarity,
+            total_score=total_score,
+        )
@@ -0,0 +1,49 @@
+"""
+tests/infrastructure/conftest.py — shared fakes and isolation for pipeline tests.
+
+Every test counts encoder calls on fresh fake models, so no test may be
+served a section another one computed.
+"""
+
+from typing import Optional
+
+import pytest
+import torch
+
+from infrastructure.embeddings.section_cache import section_cache
+
+
+class FakeModel:
+    """Records every encoder call; the row for a text is a function of it."""
+
+    def __init__(self, model_version: str = "fake-model") -> None:
+        self.model_version = model_version
+        self.calls: list[list[str]] = []
+        self.failing = False  # encode returns None, as the real model does
+
+    def _rows(self, texts: list[str]) -> Optional[torch.Tensor]:
+        self.calls.append(list(texts))
+        if self.failing:
+            return None
+        return torch.nn.functional.normalize(
+            torch.tensor([[float(len(t)), 1.0] for t in texts]), p=2, dim=1
+        )
+
+    def encode_batch(self, texts: list[str], use_cache: bool = True):
+        return self._rows(texts)
+
+    def encode_chunked(self, texts: list[str], use_cache: bool = True):
+        return self._rows(texts)
+
+
+@pytest.fixture
+def fake_model() -> type[FakeModel]:
+    """Factory for fresh fakes: fake_model() or fake_model("other-model")."""
+    return FakeModel
+
+
+@pytest.fixture(autouse=True)
+def _empty_section_cache():
+    section_cache.clear()
+    yield
+    section_cache.clear()
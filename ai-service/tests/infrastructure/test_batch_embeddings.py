@@ -0,0 +1,131 @@
+"""Unit tests for the batch embedding endpoints' doc pool and shared encode."""
+
+import pytest
+
+from infrastructure.embeddings import embedding_orchestrator
+from infrastructure.embeddings.doc_pool import DocPool
+from infrastructure.embeddings.embedding_orchestrator import extract_embeddings_batch
+from models.migration import use_model
+
+
+def _resume(_id: str, *skills: str, title: str = "Engineer") -> dict:
+    return {
+        "_id": _id,
+        "skills": [{"name": s} for s in skills],
+        "workExperience": [{"jobTitle": title, "responsibilities": ["APIs"]}],
+        "jobTitle": title,
+        "location": "Manila",
+    }
+
+
+def _batch(model, resumes: list[dict], **docs) -> dict:
+    """The orchestrator half of ResumeService.extract_embeddings_batch, by id."""
+    pool = DocPool(
+        docs.get("skill_docs", []),
+        docs.get("job_title_docs", []),
+        docs.get("location_docs", []),
+    )
+    documents = [
+        (
+            r["_id"],
+            {
+                "resume": r,
+                "skill_docs": pool.skill_docs_for(r.get("skills")),
+                "job_title_doc": pool.job_title_doc_for(r.get("jobTitle")),
+                "location_doc": pool.location_doc_for(r.get("location")),
+                "work_experience_title_docs": pool.job_title_docs_for(
+                    r.get("workExperience")
+                ),
+            },
+        )
+        for r in resumes
+    ]
+    with use_model(model):  # type: ignore[arg-type]
+        results = extract_embeddings_batch("resume", documents)
+    return dict(zip([r["_id"] for r in resumes], results))
+
+
+def test_pool_selects_each_documents_docs() -> None:
+    python = {"_id": "1", "name": "Python"}
+    engineer = {"_id": "2", "title": "Software Engineer", "normalizedTitle": "swe"}
+    manila = {"_id": "3", "name": "Manila"}
+    pool = DocPool([python], [engineer], [manila])
+
+    assert pool.skill_docs_for([{"name": "python"}, {"name": "Go"}]) == [python]
+    assert pool.job_title_doc_for({"name": "  software  ENGINEER"}) is engineer
+    assert pool.job_title_doc_for("SWE") is engineer
+    assert pool.location_doc_for("manila") is manila
+    assert pool.job_title_docs_for(
+        [{"jobTitle": "swe"}, {"jobTitle": "Software Engineer"}, {"jobTitle": "?"}]
+    ) == [engineer]
+
+
+def test_pool_ignores_malformed_fields() -> None:
+    pool = DocPool([{"_id": "1", "name": "Python"}], [], [])
+
+    assert pool.skill_docs_for(5) == []  # type: ignore[arg-type]
+    assert pool.skill_docs_for(["Python", {"name": 3}]) == []
+    assert pool.job_title_docs_for("Engineer") == []  # type: ignore[arg-type]
+    assert pool.location_doc_for(["Manila"]) is None
+
+
+def test_whole_batch_shares_one_encoder_call(fake_model) -> None:
+    model = fake_model()
+
+    results = _batch(
+        model, [_resume("r1", "Python", "Go"), _resume("r2", "Python", "Rust")]
+    )
+
+    assert not any(isinstance(r, Exception) for r in results.values())
+    assert len(model.calls) == 1
+    # texts shared between resumes are encoded once
+    assert sorted(model.calls[0]) == sorted(
+        ["python", "go", "rust", "Engineer: APIs", "Engineer", "Manila"]
+    )
+    assert results["r1"]["skills"] is not None
+
+
+def test_pooled_docs_are_used_instead_of_encoding(fake_model) -> None:
+    model = fake_model()
+    location = {
+        "_id": "l1",
+        "name": "Manila",
+        "embedding": [1.0, 0.0],
+        "model_version": "fake-model",
+    }
+
+    _batch(model, [_resume("r1", "Go"), _resume("r2", "Go")], location_docs=[location])
+
+    assert "Manila" not in model.calls[0]
+
+
+def test_one_failing_document_leaves_the_others(
+    fake_model, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    build_fn, unpack_fn = embedding_orchestrator.pipeline_registry.get("resume")
+
+    def build_or_fail(resume, **kwargs):
+        if resume["_id"] == "bad":
+            raise ValueError("malformed resume")
+        return build_fn(resume=resume, **kwargs)
+
+    monkeypatch.setattr(
+        embedding_orchestrator.pipeline_registry,
+        "get",
+        lambda _entity: (build_or_fail, unpack_fn),
+    )
+
+    results = _batch(fake_model(), [_resume("r1", "Go"), _resume("bad"), _resume("r2")])
+
+    assert isinstance(results["bad"], ValueError)
+    assert results["r1"]["skills"] is not None
+    assert results["r2"]["location"] is not None
+
+
+def test_oversized_batch_is_rejected(
+    fake_model, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(embedding_orchestrator, "EMBEDDING_BATCH_MAX_DOCUMENTS", 1)
+
+    with pytest.raises(ValueError, match="exceeds the limit"):
+        _batch(fake_model(), [_resume("r1"), _resume("r2")])
@@ -0,0 +1,31 @@
+"""Unit tests for run_pipeline's handling of request deadlines."""
+
+import pytest
+
+from infrastructure.jobs.parallelization.parallel_utils import run_pipeline
+from models.deadline import Deadline, DeadlineExceeded, SkipReason, request_deadline
+
+
+def test_runs_every_task_without_a_deadline() -> None:
+    raw = run_pipeline({"a": lambda: 1, "b": lambda: 2}, "resume", "r1")
+    assert raw == {"a": 1, "b": 2}
+
+
+def test_expired_request_starts_no_sections() -> None:
+    ran: list[str] = []
+
+    with request_deadline(Deadline(timeout_s=0)):
+        with pytest.raises(DeadlineExceeded) as exc:
+            run_pipeline({"skills": lambda: ran.append("skills")}, "resume", "r1")
+
+    assert exc.value.reason is SkipReason.EXPIRED
+    assert ran == []
+
+
+def test_section_stopped_mid_run_fails_the_pipeline() -> None:
+    def stopped():
+        raise DeadlineExceeded(SkipReason.CANCELLED)
+
+    with request_deadline(Deadline(timeout_s=60)):
+        with pytest.raises(DeadlineExceeded):
+            run_pipeline({"ok": lambda: 1, "skills": stopped}, "job", "j1")
@@ -0,0 +1,103 @@
+"""Unit tests for the shared pipeline executor's pool reuse and backpressure."""
+
+import threading
+
+import pytest
+
+from infrastructure.jobs.parallelization import executor as executor_module
+from infrastructure.jobs.parallelization.executor import (
+    PipelineExecutor,
+    PipelineSaturated,
+)
+from infrastructure.jobs.parallelization.parallel_utils import run_pipeline
+from models.deadline import Deadline, DeadlineExceeded, SkipReason, request_deadline
+from models.priority import Priority, current_priority, encode_priority
+
+
+def _occupy(executor: PipelineExecutor, release: threading.Event, count: int):
+    """Fill count workers with tasks that block until release is set."""
+    started = threading.Barrier(count + 1)
+
+    def hold() -> None:
+        started.wait()
+        release.wait()
+
+    futures = executor.submit_all([hold] * count)
+    started.wait()
+    return futures
+
+
+def test_pipelines_reuse_a_fixed_set_of_threads() -> None:
+    threads: set[int] = set()
+    tasks = {s: lambda: threads.add(threading.get_ident()) for s in "abcde"}
+
+    for i in range(20):
+        run_pipeline(tasks, "resume", f"r{i}")
+
+    assert 0 < len(threads) <= executor_module.pipeline_executor.max_workers
+
+
+def test_tasks_run_in_the_callers_context() -> None:
+    with encode_priority(Priority.BULK):
+        raw = run_pipeline({"lane": current_priority}, "job", "j1")
+
+    assert raw == {"lane": Priority.BULK}
+
+
+def test_group_larger_than_the_queue_runs_once_the_queue_is_empty() -> None:
+    executor = PipelineExecutor(max_workers=2, max_queue=1)
+
+    futures = executor.submit_all([lambda i=i: i for i in range(5)])
+
+    assert [f.result(timeout=5) for f in futures] == list(range(5))
+    assert executor.queue_depth == 0 and executor.active_workers == 0
+
+
+def test_full_queue_blocks_until_room_frees_up() -> None:
+    executor = PipelineExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+    _occupy(executor, release, 1)
+    executor.submit_all([lambda: "queued"])  # fills the queue
+
+    admitted = threading.Event()
+    waiter = threading.Thread(
+        target=lambda: (executor.submit_all([lambda: None]), admitted.set())
+    )
+    waiter.start()
+
+    assert not admitted.wait(0.2)  # held back while the queue is full
+    release.set()
+    assert admitted.wait(5)
+    waiter.join()
+
+
+def test_full_queue_fails_the_caller_at_its_deadline() -> None:
+    executor = PipelineExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+    _occupy(executor, release, 1)
+    executor.submit_all([lambda: None])
+
+    try:
+        with request_deadline(Deadline(timeout_s=0.1)):
+            with pytest.raises(DeadlineExceeded) as exc:
+                executor.submit_all([lambda: None])
+        assert exc.value.reason is SkipReason.EXPIRED
+        assert executor.queue_depth == 1
+    finally:
+        release.set()
+
+
+def test_full_queue_without_a_deadline_gives_up_after_the_timeout(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(executor_module, "PIPELINE_QUEUE_TIMEOUT_S", 0.1)
+    executor = PipelineExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+    _occupy(executor, release, 1)
+    executor.submit_all([lambda: None])
+
+    try:
+        with pytest.raises(PipelineSaturated):
+            executor.submit_all([lambda: None])
+    finally:
+        release.set()
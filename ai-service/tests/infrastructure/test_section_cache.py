@@ -0,0 +1,134 @@
+"""Unit tests for the whole-section result cache."""
+
+from typing import Optional
+
+import torch
+
+from infrastructure.embeddings.cache_outcome import CacheOutcome
+from infrastructure.embeddings.embedding_orchestrator import (
+    extract_embeddings_parallel,
+)
+from infrastructure.embeddings.section_cache import SectionCache
+from metrics.prometheus_metrics import (
+    embedding_section_cache_hits_total,
+    embedding_section_cache_misses_total,
+)
+from models.migration import use_model
+
+
+TEMPLATE = ["5+ years of Python", "Experience with AWS", "Strong SQL"]
+
+
+def _job(_id: str, requirements: list[str]) -> dict:
+    return {"_id": _id, "requirements": requirements, "skills": [{"name": "Python"}]}
+
+
+def _embed(model, job: dict, skill_docs: Optional[list] = None) -> dict:
+    with use_model(model):  # type: ignore[arg-type]
+        return extract_embeddings_parallel(
+            "job_posting",
+            job["_id"],
+            job=job,
+            skill_docs=skill_docs or [],
+            job_title_doc=None,
+            location_doc=None,
+        )
+
+
+def _count(counter, section: str) -> float:
+    return counter.labels(entity="job_posting", section=section)._value.get()
+
+
+def test_copied_template_is_served_from_the_cache(fake_model) -> None:
+    first = _embed(fake_model(), _job("j1", TEMPLATE))
+    hits_before = _count(embedding_section_cache_hits_total, "requirements")
+    model = fake_model()
+
+    second = _embed(model, _job("j2", list(TEMPLATE)))
+
+    assert model.calls == []  # skills were a copy too
+    assert torch.equal(second["requirements"], first["requirements"])
+    assert second["section_fingerprints"] == first["section_fingerprints"]
+    assert _count(embedding_section_cache_hits_total, "requirements") == (
+        hits_before + 1
+    )
+
+
+def test_changed_section_misses_and_the_rest_still_hit(fake_model) -> None:
+    _embed(fake_model(), _job("j1", TEMPLATE))
+    misses_before = _count(embedding_section_cache_misses_total, "requirements")
+    model = fake_model()
+
+    _embed(model, _job("j2", TEMPLATE + ["Kubernetes"]))
+
+    assert len(model.calls) == 1 and "python" not in model.calls[0]
+    assert _count(embedding_section_cache_misses_total, "requirements") == (
+        misses_before + 1
+    )
+
+
+def test_a_new_model_version_is_a_new_key(fake_model) -> None:
+    _embed(fake_model(), _job("j1", TEMPLATE))
+    model = fake_model("other-model")
+
+    _embed(model, _job("j2", TEMPLATE))
+
+    assert len(model.calls) == 1
+
+
+def test_different_docs_are_a_different_key(fake_model) -> None:
+    python = {
+        "_id": "s1",
+        "name": "Python",
+        "embedding": [0.0, 1.0],
+        "model_version": "fake-model",
+    }
+    first = _embed(fake_model(), _job("j1", TEMPLATE))
+
+    second = _embed(fake_model(), _job("j2", TEMPLATE), skill_docs=[python])
+
+    assert second["skills"].tolist() == [0.0, 1.0]  # the doc's, not the cached
+    assert not torch.equal(second["skills"], first["skills"])
+
+
+def test_a_failed_encode_is_not_cached(fake_model) -> None:
+    broken = fake_model()
+    broken.failing = True
+    failed = _embed(broken, _job("j1", TEMPLATE))
+    model = fake_model()
+
+    second = _embed(model, _job("j2", TEMPLATE))
+
+    assert failed["requirements"] is None
+    assert len(model.calls) == 1
+    assert second["requirements"] is not None and second["skills"] is not None
+
+
+def test_cache_evicts_least_recently_used_past_its_bound() -> None:
+    cache = SectionCache(max_entries=2)
+    cache.put("a", torch.ones(2), CacheOutcome.MISS)
+    cache.put("b", torch.ones(2), CacheOutcome.MISS)
+    cache.get("a")
+    cache.put("c", torch.ones(2), CacheOutcome.MISS)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_cached_results_keep_their_outcome_and_own_their_tensors() -> None:
+    batch = torch.ones(4, 2)
+    cache = SectionCache(max_entries=4)
+
+    cache.put("s", (batch[0], "doc-1"), CacheOutcome.NULL_BACKFILL)
+    entry = cache.get("s")
+
+    assert entry is not None and entry.outcome is CacheOutcome.NULL_BACKFILL
+    assert entry.result[1] == "doc-1"
+    assert entry.result[0].untyped_storage().nbytes() == 2 * 4  # not the batch
+
+
+def test_zero_entries_disables_the_cache() -> None:
+    cache = SectionCache(max_entries=0)
+    cache.put("s", torch.ones(2), CacheOutcome.MISS)
+
+    assert cache.get("s") is None and len(cache) == 0
@@ -0,0 +1,177 @@
+"""Unit tests for incremental re-embedding via per-section fingerprints."""
+
+import copy
+
+import pytest
+
+from infrastructure.embeddings.embedding_orchestrator import (
+    extract_embeddings_parallel,
+)
+from infrastructure.embeddings.tasks import task_registry
+from infrastructure.embeddings.tasks.task_registry import section_fingerprint
+from metrics.embedding_metrics import PipelineRun
+from models.migration import use_model
+
+
+RESUME = {
+    "skills": [{"name": "Python"}, {"name": "Go"}],
+    "workExperience": [{"jobTitle": "Engineer", "responsibilities": ["APIs"]}],
+    "jobTitle": "Engineer",
+    "location": "Manila",
+}
+
+
+def _run_resume(
+    model, resume: dict = RESUME, previous=None
+) -> tuple[dict, PipelineRun]:
+    runs: list[PipelineRun] = []
+    original = task_registry.run_planned
+
+    def capture(planned, run):
+        runs.append(run)
+        return original(planned, run)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "infrastructure.embeddings.embedding_orchestrator.run_planned", capture
+        )
+        with use_model(model):  # type: ignore[arg-type]
+            result = extract_embeddings_parallel(
+                "resume",
+                "r1",
+                resume=resume,
+                skill_docs=[],
+                job_title_doc=None,
+                location_doc=None,
+                work_experience_title_docs=[],
+                previous_fingerprints=previous,
+            )
+    return result, runs[0]
+
+
+def _outcomes(run: PipelineRun) -> dict[str, str]:
+    return {s.section: s.cache_outcome for s in run.sections}
+
+
+def test_every_non_empty_section_gets_a_fingerprint(fake_model) -> None:
+    result, _ = _run_resume(fake_model())
+
+    fingerprints = result["section_fingerprints"]
+    assert fingerprints["certifications"] is None  # not on the resume
+    assert all(
+        fingerprints[key]
+        for key in ("skills", "workExperience", "jobTitle", "location")
+    )
+    assert result["reused_sections"] == []
+
+
+def test_unchanged_resume_reuses_every_section_without_encoding(fake_model) -> None:
+    first, _ = _run_resume(fake_model())
+    model = fake_model()
+
+    result, run = _run_resume(model, previous=first["section_fingerprints"])
+
+    assert model.calls == []
+    assert run.model_calls == 0
+    assert sorted(result["reused_sections"]) == sorted(
+        ["skills", "workExperience", "jobTitle", "location"]
+    )
+    assert result["section_fingerprints"] == first["section_fingerprints"]
+    assert _outcomes(run)["skills"] == "reused"
+    assert result["skills"] is None
+
+
+def test_editing_one_bullet_recomputes_only_that_section(fake_model) -> None:
+    first, _ = _run_resume(fake_model())
+    edited = copy.deepcopy(RESUME)
+    edited["workExperience"][0]["responsibilities"] = ["APIs and queues"]
+    model = fake_model()
+
+    result, run = _run_resume(model, edited, previous=first["section_fingerprints"])
+
+    assert model.calls == [["Engineer: APIs and queues"]]
+    assert "workExperience" not in result["reused_sections"]
+    assert result["work_experience"] is not None
+    assert (
+        result["section_fingerprints"]["workExperience"]
+        != first["section_fingerprints"]["workExperience"]
+    )
+    assert _outcomes(run)["workExperience"] != "reused"
+
+
+def test_a_new_model_version_never_reuses(fake_model) -> None:
+    first, _ = _run_resume(fake_model())
+
+    result, _ = _run_resume(
+        fake_model("other-model"), previous=first["section_fingerprints"]
+    )
+
+    assert result["reused_sections"] == []
+
+
+def test_fingerprint_ignores_key_order_but_not_content() -> None:
+    a = section_fingerprint("skills", [{"name": "Go", "level": 3}], "m")
+    b = section_fingerprint("skills", [{"level": 3, "name": "Go"}], "m")
+    c = section_fingerprint("skills", [{"name": "Go", "level": 4}], "m")
+
+    assert a == b != c
+    assert section_fingerprint("requirements", ["Go"], "m") != section_fingerprint(
+        "experienceLevel", ["Go"], "m"
+    )
+
+
+def test_fingerprint_covers_the_docs_but_not_their_order() -> None:
+    go = {"_id": "1", "name": "Go", "embedding": [1.0, 0.0], "model_version": "m"}
+    rust = {"_id": "2", "name": "Rust", "embedding": None}
+    skills = [{"name": "Go"}, {"name": "Rust"}]
+
+    a = section_fingerprint("skills", skills, "m", [[go, rust]])
+    b = section_fingerprint("skills", skills, "m", [[rust, go]])
+    backfilled = section_fingerprint(
+        "skills", skills, "m", [[go, {**rust, "embedding": [0.0, 1.0]}]]
+    )
+
+    assert a == b
+    assert a != backfilled != section_fingerprint("skills", skills, "m", [[]])
+
+
+def test_failed_encode_leaves_no_fingerprint(fake_model) -> None:
+    broken = fake_model()
+    broken.failing = True
+
+    result, _ = _run_resume(broken)
+
+    assert all(
+        fingerprint is None for fingerprint in result["section_fingerprints"].values()
+    )
+    assert result["reused_sections"] == []
+
+
+def test_failed_section_has_no_fingerprint(
+    fake_model, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def broken(_rows):
+        raise RuntimeError("boom")
+
+    original = task_registry._TASKS["location"]
+
+    def plan_broken(value, doc):
+        plan = original.plan_fn(value, doc)
+        plan.assemble = broken
+        return plan
+
+    monkeypatch.setitem(
+        task_registry._TASKS,
+        "location",
+        task_registry.TaskConfig(
+            doc_key="location",
+            plan_fn=plan_broken,
+            return_shape="single",
+            extra_keys=["location_doc"],
+        ),
+    )
+
+    result, _ = _run_resume(fake_model())
+
+    assert result["section_fingerprints"]["location"] is None
+    assert result["section_fingerprints"]["skills"] is not None
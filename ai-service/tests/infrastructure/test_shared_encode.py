@@ -0,0 +1,128 @@
+"""Unit tests for the two-phase embedding pipeline's shared encoder call."""
+
+import pytest
+
+from infrastructure.embeddings.embedding_orchestrator import (
+    extract_embeddings_parallel,
+)
+from infrastructure.embeddings.tasks import task_registry
+from metrics.embedding_metrics import PipelineRun
+from models.migration import use_model
+
+
+def _doc(_id: str, name: str) -> dict:
+    return {"_id": _id, "name": name, "title": name, "embedding": [1.0, 0.0]}
+
+
+RESUME = {
+    "skills": [{"name": "Python"}, {"name": "Go"}],
+    "workExperience": [{"jobTitle": "Engineer", "responsibilities": ["APIs"]}],
+    "certifications": [{"name": "AWS SA"}],
+    "jobTitle": "Engineer",
+    "location": "Manila",
+}
+
+
+def _run_resume(model, **docs) -> tuple[dict, PipelineRun]:
+    runs: list[PipelineRun] = []
+    original = task_registry.run_planned
+
+    def capture(planned, run):
+        runs.append(run)
+        return original(planned, run)
+
+    kwargs = {
+        "skill_docs": [],
+        "job_title_doc": None,
+        "location_doc": None,
+        "work_experience_title_docs": [],
+        **docs,
+    }
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "infrastructure.embeddings.embedding_orchestrator.run_planned", capture
+        )
+        with use_model(model):  # type: ignore[arg-type]
+            result = extract_embeddings_parallel(
+                "resume", "r1", resume=RESUME, **kwargs
+            )
+    return result, runs[0]
+
+
+def test_every_section_shares_one_encoder_call(fake_model) -> None:
+    model = fake_model()
+
+    result, run = _run_resume(model)
+
+    assert run.model_calls == 1
+    assert len(model.calls) == 1
+    # "Engineer" is both the job title and a work-experience fallback — once
+    assert sorted(model.calls[0]) == sorted(
+        ["python", "go", "Engineer: APIs", "aws sa", "Engineer", "Manila"]
+    )
+    for key in ("skills", "work_experience", "certifications", "job_title"):
+        assert result[key] is not None
+
+
+def test_shared_rows_match_per_section_encoding(fake_model) -> None:
+    from utils.embedding_utils import (
+        extract_location_embedding,
+        extract_skills_embeddings,
+    )
+
+    result, _ = _run_resume(fake_model())
+
+    with use_model(fake_model()):  # type: ignore[arg-type]
+        skills, _, _ = extract_skills_embeddings(RESUME["skills"], [])
+        location, _ = extract_location_embedding(RESUME["location"], None)
+
+    assert result["skills"].tolist() == pytest.approx(skills.tolist())
+    assert result["location"].tolist() == pytest.approx(location.tolist())
+
+
+def test_sections_served_from_docs_make_no_encoder_call(fake_model) -> None:
+    model = fake_model()
+    resume_docs = {
+        "skill_docs": [
+            {**_doc("1", "Python"), "model_version": "fake-model"},
+            {**_doc("2", "Go"), "model_version": "fake-model"},
+        ],
+        "job_title_doc": {**_doc("3", "Engineer"), "model_version": "fake-model"},
+        "location_doc": {**_doc("4", "Manila"), "model_version": "fake-model"},
+        "work_experience_title_docs": [
+            {**_doc("3", "Engineer"), "model_version": "fake-model"}
+        ],
+    }
+
+    result, run = _run_resume(model, **resume_docs)
+
+    # certifications have no docs — the only texts left for the model
+    assert model.calls == [["aws sa"]]
+    assert run.model_calls == 1
+    assert result["skill_ids_to_backfill"] == []
+
+
+def test_failing_section_assembly_leaves_the_others(
+    fake_model, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def broken(_rows):
+        raise RuntimeError("boom")
+
+    original = task_registry._TASKS["certifications"].plan_fn
+
+    def plan_broken(value):
+        plan = original(value)
+        plan.assemble = broken
+        return plan
+
+    monkeypatch.setitem(
+        task_registry._TASKS,
+        "certifications",
+        task_registry.TaskConfig(doc_key="certifications", plan_fn=plan_broken),
+    )
+
+    result, run = _run_resume(fake_model())
+
+    assert result["certifications"] is None
+    assert result["skills"] is not None
+    assert any(s.section == "certifications" and s.error for s in run.sections)
@@ -0,0 +1,71 @@
+"""Unit tests for the adaptive forward-pass token budget."""
+
+from models.batch_controller import BatchSizeController
+
+
+def _run(controller: BatchSizeController, cost_per_token: float, passes: int) -> None:
+    """Feed full-budget passes whose time is linear in padded tokens."""
+    for _ in range(passes):
+        tokens = controller.token_budget
+        controller.observe(tokens, tokens * cost_per_token)
+
+
+def test_converges_on_the_target_latency() -> None:
+    controller = BatchSizeController(
+        target_latency_s=0.2, min_tokens=64, max_tokens=100_000, initial_tokens=4096
+    )
+
+    _run(controller, cost_per_token=1e-5, passes=30)
+
+    # 0.2 s / 1e-5 s per token
+    assert abs(controller.token_budget - 20_000) <= 200
+
+
+def test_budget_stays_within_bounds() -> None:
+    fast = BatchSizeController(
+        target_latency_s=1.0, min_tokens=64, max_tokens=8192, initial_tokens=4096
+    )
+    slow = BatchSizeController(
+        target_latency_s=0.01, min_tokens=512, max_tokens=8192, initial_tokens=4096
+    )
+
+    _run(fast, cost_per_token=1e-7, passes=30)
+    _run(slow, cost_per_token=1e-3, passes=30)
+
+    assert fast.token_budget == 8192
+    assert slow.token_budget == 512
+
+
+def test_one_outlier_pass_moves_the_budget_by_a_bounded_step() -> None:
+    controller = BatchSizeController(
+        target_latency_s=0.2, min_tokens=64, max_tokens=100_000, initial_tokens=4096
+    )
+    _run(controller, cost_per_token=0.2 / 4096, passes=10)
+    settled = controller.token_budget
+
+    controller.observe(settled, 100.0)  # e.g. the host was swapping
+
+    assert controller.token_budget >= settled / 1.5 - 1
+
+
+def test_small_passes_barely_move_the_estimate() -> None:
+    controller = BatchSizeController(
+        target_latency_s=0.2, min_tokens=64, max_tokens=100_000, initial_tokens=4096
+    )
+    _run(controller, cost_per_token=0.2 / 4096, passes=10)
+    settled = controller.token_budget
+
+    # A lone 16-token text dominated by fixed per-pass overhead
+    for _ in range(5):
+        controller.observe(16, 0.01)
+
+    assert controller.token_budget > settled * 0.9
+
+
+def test_ignores_empty_observations() -> None:
+    controller = BatchSizeController(initial_tokens=4096)
+
+    controller.observe(0, 0.1)
+    controller.observe(128, 0.0)
+
+    assert controller.token_budget == 4096
@@ -0,0 +1,40 @@
+"""Unit tests for canonical text forms of encoder inputs."""
+
+from models.canonical import canonicalize, dedupe_canonical, fold_text
+
+
+def test_case_whitespace_and_unicode_variants_share_a_form() -> None:
+    variants = ["Python", "python ", "PYTHON", "\u00a0Python\t"]
+    assert {canonicalize(v) for v in variants} == {"python"}
+    # NFKC: full-width letters and non-breaking spaces fold to ASCII
+    assert canonicalize("Ｒｅａｃｔ Native") == "react native"
+
+
+def test_version_suffixes_are_stripped() -> None:
+    assert canonicalize("Python 3") == "python"
+    assert canonicalize("Python 3.11") == "python"
+    assert canonicalize("Angular v15") == "angular"
+    assert canonicalize("Vue.js 3.x") == "vue.js"
+
+
+def test_version_stripping_leaves_identifiers_alone() -> None:
+    assert canonicalize("ISO 27001") == "iso 27001"
+    assert canonicalize("Office 365") == "office 365"
+    assert canonicalize("Web 2.0") == "web 2.0"
+    assert canonicalize("HTML5") == "html5"
+    assert canonicalize("3.11") == "3.11"
+
+
+def test_version_stripping_can_be_disabled() -> None:
+    assert canonicalize("Python 3", strip_versions=False) == "python 3"
+
+
+def test_fold_text_keeps_case() -> None:
+    assert fold_text("  Built\tAPIs\n") == "Built APIs"
+
+
+def test_dedupe_groups_spellings_in_first_seen_order() -> None:
+    assert dedupe_canonical(["Python", "SQL", "python 3", "Python", "sql"]) == {
+        "python": ["Python", "python 3"],
+        "sql": ["SQL", "sql"],
+    }
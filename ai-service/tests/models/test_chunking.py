@@ -0,0 +1,53 @@
+"""Unit tests for token-aware chunking of over-long encoder inputs."""
+
+from models.chunking import chunk_text, split_sentences
+
+
+def _words(texts: list[str]) -> list[int]:
+    """One token per whitespace-separated word."""
+    return [len(t.split()) for t in texts]
+
+
+def test_text_that_fits_is_returned_unchanged() -> None:
+    text = "Built APIs. Shipped features."
+    assert chunk_text(text, budget=10, count_tokens=_words) == [text]
+
+
+def test_splits_on_sentence_boundaries_and_packs_greedily() -> None:
+    text = "one two three. four five six. seven eight nine. ten"
+    chunks = chunk_text(text, budget=6, count_tokens=_words)
+
+    assert chunks == ["one two three. four five six.", "seven eight nine. ten"]
+
+
+def test_every_chunk_fits_the_budget() -> None:
+    text = " ".join(f"Sentence number {i} has five words." for i in range(40))
+    chunks = chunk_text(text, budget=12, count_tokens=_words)
+
+    assert len(chunks) > 1
+    assert all(n <= 12 for n in _words(chunks))
+    assert " ".join(chunks).split() == text.split()
+
+
+def test_comma_joined_lists_fall_back_to_clauses() -> None:
+    text = "Engineer: " + ", ".join(["owned the billing service"] * 10)
+    chunks = chunk_text(text, budget=9, count_tokens=_words)
+
+    assert len(chunks) > 1
+    assert all(n <= 9 for n in _words(chunks))
+    assert " ".join(chunks).split() == text.split()
+
+
+def test_run_on_text_falls_back_to_word_windows() -> None:
+    text = " ".join(f"w{i}" for i in range(25))
+    chunks = chunk_text(text, budget=10, count_tokens=_words)
+
+    assert _words(chunks) == [10, 10, 5]
+
+
+def test_split_sentences_handles_newlines_and_semicolons() -> None:
+    assert split_sentences("Led a team; shipped v2\nOwned on-call.  ") == [
+        "Led a team;",
+        "shipped v2",
+        "Owned on-call.",
+    ]
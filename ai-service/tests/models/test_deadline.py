@@ -0,0 +1,45 @@
+"""Unit tests for request deadlines carried through encoder work."""
+
+import pytest
+
+from models.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    SkipReason,
+    current_deadline,
+    request_deadline,
+)
+
+
+def test_deadline_without_timeout_only_ends_when_cancelled() -> None:
+    deadline = Deadline()
+    assert deadline.reason is None
+    assert deadline.remaining() is None
+
+    deadline.cancel()
+    assert deadline.reason is SkipReason.CANCELLED
+
+
+def test_deadline_expires_after_its_timeout() -> None:
+    assert Deadline(timeout_s=60).reason is None
+    assert Deadline(timeout_s=0).reason is SkipReason.EXPIRED
+    assert Deadline(timeout_s=0).remaining() == 0.0
+
+
+def test_cancellation_wins_over_expiry() -> None:
+    deadline = Deadline(timeout_s=0)
+    deadline.cancel()
+    assert deadline.reason is SkipReason.CANCELLED
+
+
+def test_request_deadline_is_scoped_to_the_block() -> None:
+    deadline = Deadline(timeout_s=60)
+    with request_deadline(deadline):
+        assert current_deadline() is deadline
+    assert current_deadline() is None
+
+
+def test_exception_carries_the_reason() -> None:
+    with pytest.raises(DeadlineExceeded, match="cancelled") as exc:
+        raise DeadlineExceeded(SkipReason.CANCELLED)
+    assert exc.value.reason is SkipReason.CANCELLED
@@ -0,0 +1,54 @@
+"""Unit tests for the content-hash LRU cache in front of the embedding model."""
+
+import torch
+
+from models.embedding_cache import EmbeddingCache, make_cache_key
+
+ROW_BYTES = 4 * 4  # float32 × 4 dims
+
+
+def _rows(*values: float) -> torch.Tensor:
+    return torch.tensor([[v] * 4 for v in values], dtype=torch.float32)
+
+
+def test_hits_and_misses_keep_caller_order() -> None:
+    cache = EmbeddingCache(max_bytes=1024)
+    cache.put_many("m", ["python", "go"], _rows(1.0, 2.0))
+
+    found = cache.get_many("m", ["go", "rust", "python"])
+
+    assert found[1] is None
+    assert torch.equal(found[0], _rows(2.0)[0])
+    assert torch.equal(found[2], _rows(1.0)[0])
+
+
+def test_key_includes_model_name_and_ignores_whitespace() -> None:
+    assert make_cache_key("m", "Machine  Learning ") == make_cache_key(
+        "m", "Machine Learning"
+    )
+    assert make_cache_key("m", "Python") != make_cache_key("other-model", "Python")
+
+
+def test_evicts_least_recently_used_by_bytes() -> None:
+    cache = EmbeddingCache(max_bytes=2 * ROW_BYTES)
+    cache.put_many("m", ["a", "b"], _rows(1.0, 2.0))
+    cache.get_many("m", ["a"])  # promote "a" — "b" is now LRU
+
+    cache.put_many("m", ["c"], _rows(3.0))
+
+    a, b, c = cache.get_many("m", ["a", "b", "c"])
+    assert b is None
+    assert a is not None and c is not None
+    assert cache.nbytes == 2 * ROW_BYTES
+
+
+def test_stored_rows_do_not_pin_the_source_batch() -> None:
+    cache = EmbeddingCache(max_bytes=1024)
+    batch = _rows(1.0, 2.0)
+    cache.put_many("m", ["a", "b"], batch)
+
+    batch.zero_()
+
+    (a,) = cache.get_many("m", ["a"])
+    assert a is not None and float(a[0]) == 1.0
+    assert cache.nbytes == 2 * ROW_BYTES
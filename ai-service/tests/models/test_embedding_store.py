@@ -0,0 +1,75 @@
+"""Unit tests for the memory-mapped on-disk embedding store."""
+
+import os
+
+import torch
+
+from models.embedding_store import EmbeddingStore
+
+
+def _rows(*values: float) -> torch.Tensor:
+    return torch.tensor([[v, v + 0.5, -v] for v in values], dtype=torch.float32)
+
+
+def test_round_trip_and_survives_reopen(tmp_path) -> None:
+    store = EmbeddingStore(str(tmp_path))
+    store.put_many("m", ["python", "go"], _rows(1.0, 2.0))
+
+    reopened = EmbeddingStore(str(tmp_path))
+    go, rust, python = reopened.get_many("m", ["go", "rust", "python"])
+
+    assert rust is None
+    assert torch.equal(go, _rows(2.0)[0])
+    assert torch.equal(python, _rows(1.0)[0])
+    assert len(reopened) == 2
+
+
+def test_sibling_appends_are_visible_without_reopen(tmp_path) -> None:
+    worker_a = EmbeddingStore(str(tmp_path))
+    worker_b = EmbeddingStore(str(tmp_path))
+
+    assert worker_a.get_many("m", ["docker"]) == [None]
+    worker_b.put_many("m", ["docker"], _rows(3.0))
+
+    (docker,) = worker_a.get_many("m", ["docker"])
+    assert docker is not None and torch.equal(docker, _rows(3.0)[0])
+
+
+def test_duplicate_texts_are_appended_once(tmp_path) -> None:
+    store = EmbeddingStore(str(tmp_path))
+    store.put_many("m", ["a", "a"], _rows(1.0, 1.0))
+    store.put_many("m", ["a"], _rows(9.0))
+
+    (a,) = store.get_many("m", ["a"])
+    assert torch.equal(a, _rows(1.0)[0])
+    assert os.path.getsize(tmp_path / "rows.f32") == 3 * 4
+
+
+def test_compact_drops_stale_model_versions(tmp_path) -> None:
+    store = EmbeddingStore(str(tmp_path))
+    reader = EmbeddingStore(str(tmp_path))
+    store.put_many("old-model", ["a", "b"], _rows(1.0, 2.0))
+    store.put_many("new-model", ["a"], _rows(5.0))
+
+    result = store.compact(keep_models=["new-model"])
+
+    assert result["kept"] == 1 and result["dropped"] == 2
+    assert result["bytes_after"] < result["bytes_before"]
+    # An already-open sibling picks up the rewritten files on its next miss.
+    assert reader.get_many("old-model", ["a"]) == [None]
+    (a,) = reader.get_many("new-model", ["a"])
+    assert torch.equal(a, _rows(5.0)[0])
+
+
+def test_torn_index_tail_is_ignored_and_repaired(tmp_path) -> None:
+    store = EmbeddingStore(str(tmp_path))
+    store.put_many("m", ["a"], _rows(1.0))
+    with open(tmp_path / "index.bin", "ab") as f:
+        f.write(b"\x00" * 7)  # crashed writer
+
+    reopened = EmbeddingStore(str(tmp_path))
+    reopened.put_many("m", ["b"], _rows(2.0))
+
+    a, b = EmbeddingStore(str(tmp_path)).get_many("m", ["a", "b"])
+    assert torch.equal(a, _rows(1.0)[0])
+    assert torch.equal(b, _rows(2.0)[0])
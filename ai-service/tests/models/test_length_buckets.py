@@ -0,0 +1,50 @@
+"""Unit tests for token-length bucketing of encoder forward passes."""
+
+from models.length_buckets import padding_waste, plan_buckets
+
+
+def test_every_input_lands_in_exactly_one_bucket() -> None:
+    lengths = [3, 300, 12, 40, 5, 384, 70]
+    plan = plan_buckets(lengths, max_length=384, batch_size=32)
+
+    covered = sorted(i for bucket in plan for i in bucket.indices)
+    assert covered == list(range(len(lengths)))
+
+
+def test_short_and_long_inputs_never_share_a_pass() -> None:
+    lengths = [3, 300, 4, 290]
+    plan = plan_buckets(lengths, max_length=384, batch_size=32)
+
+    by_label = {b.label: sorted(b.indices) for b in plan}
+    assert by_label == {"16": [0, 2], "384": [1, 3]}
+
+
+def test_buckets_are_split_at_batch_size() -> None:
+    plan = plan_buckets([5] * 70, max_length=384, batch_size=32)
+
+    assert [len(b.indices) for b in plan] == [32, 32, 6]
+
+
+def test_bucketing_cuts_padding_waste() -> None:
+    lengths = [3, 300, 4, 290, 6, 280]
+    bucketed = plan_buckets(lengths, max_length=384, batch_size=32)
+    arrival_order = plan_buckets(lengths, max_length=384, batch_size=32, boundaries=())
+
+    assert padding_waste(lengths, bucketed) < 0.05
+    assert padding_waste(lengths, arrival_order) > 0.4
+
+
+def test_token_budget_sizes_each_bucket_by_its_length() -> None:
+    lengths = [5] * 40 + [300] * 10
+    plan = plan_buckets(lengths, max_length=384, batch_size=256, token_budget=1536)
+
+    sizes = {
+        b.label: [len(x.indices) for x in plan if x.label == b.label] for b in plan
+    }
+    assert sizes == {"16": [40], "384": [4, 4, 2]}
+
+
+def test_token_budget_never_empties_a_pass() -> None:
+    plan = plan_buckets([380, 380], max_length=384, batch_size=32, token_budget=100)
+
+    assert [len(b.indices) for b in plan] == [1, 1]
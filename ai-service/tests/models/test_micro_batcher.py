@@ -0,0 +1,219 @@
+"""Unit tests for the cross-request micro-batcher in front of the embedding model."""
+
+import os
+import threading
+
+import pytest
+
+from models.deadline import Deadline, DeadlineExceeded, SkipReason, request_deadline
+from models.micro_batcher import MicroBatcher
+from models.priority import Priority, encode_priority
+
+
+class _RecordingEncoder:
+    """Fake forward pass: one row per text, remembers every batch it saw."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, texts: list[str]) -> list[list[str]]:
+        self.entered.set()
+        self.release.wait(timeout=5)
+        self.calls.append(list(texts))
+        return [[text.upper()] for text in texts]
+
+
+def test_concurrent_callers_share_one_forward_pass() -> None:
+    encoder = _RecordingEncoder()
+    batcher = MicroBatcher(encoder, max_wait_ms=200, max_batch_size=64)
+
+    futures = [batcher.submit([f"a{i}", f"b{i}"]) for i in range(5)]
+    results = [f.result(timeout=5) for f in futures]
+
+    assert len(encoder.calls) == 1
+    assert len(encoder.calls[0]) == 10
+    for i, rows in enumerate(results):
+        assert rows == [[f"A{i}"], [f"B{i}"]]
+
+
+def test_batch_flushes_when_full() -> None:
+    encoder = _RecordingEncoder()
+    batcher = MicroBatcher(encoder, max_wait_ms=5_000, max_batch_size=4)
+
+    futures = [batcher.submit([f"t{i}", f"u{i}"]) for i in range(2)]
+
+    # Reaching max_batch_size must flush long before the 5s window expires.
+    assert futures[0].result(timeout=2) == [["T0"], ["U0"]]
+    assert futures[1].result(timeout=2) == [["T1"], ["U1"]]
+
+
+def test_model_error_fails_every_caller_in_the_batch() -> None:
+    encoder = _RecordingEncoder()
+    workers: list[threading.Thread] = []
+
+    def fails_once(texts):
+        workers.append(threading.current_thread())
+        if len(workers) == 1:
+            raise RuntimeError("forward pass exploded")
+        return encoder(texts)
+
+    batcher = MicroBatcher(fails_once, max_wait_ms=50, max_batch_size=64)
+    futures = [batcher.submit(["x"]), batcher.submit(["y"])]
+
+    for f in futures:
+        with pytest.raises(RuntimeError, match="exploded"):
+            f.result(timeout=5)
+
+    # The same worker survives the failed batch and serves the next one.
+    assert batcher.encode(["z"]) == [["Z"]]
+    assert len(workers) == 2 and workers[0] is workers[1]
+
+
+def test_cancelled_request_never_reaches_the_model() -> None:
+    encoder = _RecordingEncoder()
+    encoder.release.clear()  # hold the worker inside the first forward pass
+    batcher = MicroBatcher(encoder, max_wait_ms=0, max_batch_size=1)
+
+    first = batcher.submit(["first"])
+    queued = batcher.submit(["dropped"])
+    assert queued.cancel()
+
+    encoder.release.set()
+    assert first.result(timeout=5) == [["FIRST"]]
+    later = batcher.submit(["later"]).result(timeout=5)
+
+    assert later == [["LATER"]]
+    assert ["dropped"] not in encoder.calls
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="POSIX only")
+def test_forked_child_gets_its_own_worker() -> None:
+    batcher = MicroBatcher(_RecordingEncoder(), max_wait_ms=1, max_batch_size=64)
+    assert batcher.encode(["parent"]) == [["PARENT"]]  # parent worker is running
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # child: the parent's worker thread did not survive fork()
+        try:
+            rows = batcher.submit(["child"]).result(timeout=5)
+            os.write(write_fd, rows[0][0].encode())
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+    assert os.read(read_fd, 64) == b"CHILD"
+
+
+def test_interactive_drains_first_and_bulk_share_is_capped() -> None:
+    encoder = _RecordingEncoder()
+    encoder.release.clear()  # hold the worker inside the first forward pass
+    batcher = MicroBatcher(
+        encoder, max_wait_ms=20, max_batch_size=8, bulk_max_share=0.25
+    )
+
+    blocker = batcher.submit(["blocker"])
+    assert encoder.entered.wait(timeout=5)
+
+    bulk = [batcher.submit([f"b{i}"], Priority.BULK) for i in range(4)]
+    with encode_priority(Priority.INTERACTIVE):
+        interactive = batcher.submit(["i0"])
+    assert batcher.queue_depth(Priority.BULK) == 4
+    assert batcher.queue_depth(Priority.INTERACTIVE) == 1
+
+    encoder.release.set()
+    for f in [blocker, interactive, *bulk]:
+        f.result(timeout=5)
+
+    # Queued last, the interactive call still leads the next pass; bulk gets
+    # at most 25% of an 8-text batch (2 texts) per pass.
+    assert encoder.calls[1:] == [["i0", "b0", "b1"], ["b2", "b3"]]
+
+
+def test_bulk_fills_the_batch_when_no_interactive_work_waits() -> None:
+    encoder = _RecordingEncoder()
+    encoder.release.clear()
+    batcher = MicroBatcher(
+        encoder, max_wait_ms=5_000, max_batch_size=4, bulk_max_share=0.25
+    )
+
+    blocker = batcher.submit(["x0", "x1", "x2", "x3"])  # full — runs at once
+    assert encoder.entered.wait(timeout=2)
+    bulk = [batcher.submit([f"b{i}"], Priority.BULK) for i in range(5)]
+    with encode_priority(Priority.INTERACTIVE):
+        interactive = batcher.submit(["i0"])
+
+    encoder.release.set()
+    # Neither pass waits out the 5s window: the first flushes once only
+    # over-budget bulk is left, the second once bulk has filled it.
+    for f in [blocker, interactive, *bulk]:
+        f.result(timeout=2)
+
+    assert encoder.calls[1:] == [["i0", "b0"], ["b1", "b2", "b3", "b4"]]
+
+
+def test_priority_follows_the_callers_context() -> None:
+    encoder = _RecordingEncoder()
+    encoder.release.clear()
+    batcher = MicroBatcher(encoder, max_wait_ms=1, max_batch_size=64)
+
+    batcher.submit(["blocker"])
+    assert encoder.entered.wait(timeout=5)
+    with encode_priority(Priority.BULK):
+        queued = batcher.submit(["background"])
+
+    assert batcher.queue_depth(Priority.BULK) == 1
+    encoder.release.set()
+    assert queued.result(timeout=5) == [["BACKGROUND"]]
+
+
+def test_request_cancelled_while_queued_is_dropped_before_the_model() -> None:
+    encoder = _RecordingEncoder()
+    encoder.release.clear()
+    batcher = MicroBatcher(encoder, max_wait_ms=0, max_batch_size=1)
+
+    batcher.submit(["blocker"])
+    assert encoder.entered.wait(timeout=5)
+    deadline = Deadline(timeout_s=60)
+    with request_deadline(deadline):
+        queued = batcher.submit(["abandoned"])
+    deadline.cancel()  # client disconnected while the text waited
+
+    encoder.release.set()
+    with pytest.raises(DeadlineExceeded) as exc:
+        queued.result(timeout=5)
+
+    assert exc.value.reason is SkipReason.CANCELLED
+    assert batcher.encode(["later"]) == [["LATER"]]
+    assert ["abandoned"] not in encoder.calls
+
+
+def test_caller_stops_waiting_at_its_deadline() -> None:
+    encoder = _RecordingEncoder()
+    encoder.release.clear()
+    batcher = MicroBatcher(encoder, max_wait_ms=0, max_batch_size=1)
+
+    batcher.submit(["blocker"])
+    assert encoder.entered.wait(timeout=5)
+    with request_deadline(Deadline(timeout_s=0.05)):
+        with pytest.raises(DeadlineExceeded):
+            batcher.encode(["slow"])
+
+    encoder.release.set()
+    assert batcher.encode(["later"]) == [["LATER"]]
+    assert ["slow"] not in encoder.calls
+
+
+def test_expired_request_is_never_queued() -> None:
+    encoder = _RecordingEncoder()
+    batcher = MicroBatcher(encoder, max_wait_ms=1)
+
+    with request_deadline(Deadline(timeout_s=0)):
+        future = batcher.submit(["late"])
+
+    with pytest.raises(DeadlineExceeded):
+        future.result(timeout=1)
+    assert encoder.calls == []
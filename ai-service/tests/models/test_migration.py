@@ -0,0 +1,58 @@
+"""Unit tests for dual-encode model migration."""
+
+import pytest
+
+from models import migration
+from models.migration import MIGRATION_KEY, active_model, dual_encode, use_model
+from models.embeddings import embedding_model
+
+
+class _FakeModel:
+    def __init__(self, version: str) -> None:
+        self.model_version = version
+
+
+def _compute() -> dict:
+    return {"model_version": active_model().model_version}
+
+
+def test_without_a_migration_computes_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(migration, "migration_model", lambda: None)
+
+    assert dual_encode(_compute) == {"model_version": embedding_model.model_version}
+
+
+def test_migration_result_is_computed_with_the_target(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    target = _FakeModel("new-model")
+    monkeypatch.setattr(migration, "migration_model", lambda: target)
+
+    result = dual_encode(_compute)
+
+    assert result == {
+        "model_version": embedding_model.model_version,
+        MIGRATION_KEY: {"model_version": "new-model"},
+    }
+    assert active_model() is embedding_model
+
+
+def test_failed_migration_run_keeps_the_serving_result(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(migration, "migration_model", lambda: _FakeModel("new-model"))
+
+    def compute() -> dict:
+        if active_model() is not embedding_model:
+            raise RuntimeError("target model is down")
+        return {"ok": True}
+
+    assert dual_encode(compute) == {"ok": True}
+
+
+def test_use_model_is_scoped() -> None:
+    target = _FakeModel("new-model")
+
+    with use_model(target):  # type: ignore[arg-type]
+        assert active_model() is target
+    assert active_model() is embedding_model
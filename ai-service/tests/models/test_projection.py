@@ -0,0 +1,62 @@
+"""Unit tests for PCA projection of retrieval vectors."""
+
+from pathlib import Path
+
+import pytest
+import torch
+import torch.nn.functional as F
+
+from models.projection import Projection, explained_variance, fit, recall_at_k
+
+
+def _low_rank_corpus(n: int = 400, dim: int = 64, rank: int = 8) -> torch.Tensor:
+    """Unit vectors that live (almost) in a rank-dimensional subspace."""
+    g = torch.Generator().manual_seed(0)
+    basis = torch.randn(rank, dim, generator=g)
+    data = torch.randn(n, rank, generator=g) @ basis
+    data += 0.01 * torch.randn(n, dim, generator=g)
+    return F.normalize(data, p=2, dim=1)
+
+
+def test_projection_keeps_the_corpus_structure() -> None:
+    corpus = _low_rank_corpus()
+    train, held_out = corpus[:300], corpus[300:]
+
+    projection = fit(train, dims=16, model_version="m")
+
+    assert projection.dims == 16
+    assert projection.version.startswith("pca16-")
+    assert explained_variance(projection, held_out) > 0.99
+    assert recall_at_k(projection, held_out, k=5) > 0.9
+
+
+def test_projected_vectors_are_unit_length() -> None:
+    projection = fit(_low_rank_corpus(), dims=16, model_version="m")
+    vectors = _low_rank_corpus()[:10]
+
+    rows = projection.apply(vectors)
+    single = projection.apply(vectors[0])
+
+    assert rows.shape == (10, 16)
+    assert torch.allclose(rows.norm(dim=1), torch.ones(10), atol=1e-5)
+    assert torch.allclose(single, rows[0], atol=1e-6)
+
+
+def test_save_and_load_round_trip(tmp_path: Path) -> None:
+    projection = fit(_low_rank_corpus(), dims=16, model_version="m")
+    path = str(tmp_path / "pca16.safetensors")
+
+    projection.save(path)
+    loaded = Projection.load(path)
+
+    assert loaded.version == projection.version
+    assert loaded.model_version == "m"
+    assert torch.equal(loaded.components, projection.components)
+    assert torch.equal(loaded.mean, projection.mean)
+
+
+def test_fit_rejects_impossible_dims() -> None:
+    with pytest.raises(ValueError):
+        fit(_low_rank_corpus(n=10), dims=16, model_version="m")
+    with pytest.raises(ValueError):
+        fit(_low_rank_corpus(), dims=64, model_version="m")
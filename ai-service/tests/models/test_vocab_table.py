@@ -0,0 +1,67 @@
+"""Unit tests for the closed-vocabulary embedding table."""
+
+import torch
+
+from models.vocab_table import VocabTable
+
+
+class _FakeModel:
+    """Counts encode calls; one-hot rows so each term's row is recognizable."""
+
+    def __init__(self) -> None:
+        self.model_version = "v1"
+        self.calls: list[list[str]] = []
+
+    def encode_batch(self, texts: list[str], use_cache: bool = True):
+        self.calls.append(list(texts))
+        return torch.eye(len(texts))
+
+
+def _table(model: _FakeModel) -> VocabTable:
+    return VocabTable(
+        model,  # type: ignore[arg-type]
+        {"seniority": ["Intern", "Senior"], "frequency": ["hour", "year"]},
+    )
+
+
+def test_build_encodes_every_term_once() -> None:
+    model = _FakeModel()
+    table = _table(model)
+    table.build()
+    table.build()
+
+    assert model.calls == [["Intern", "Senior", "hour", "year"]]
+    assert table.model_version == "v1"
+
+
+def test_lookups_are_indexes_into_the_table() -> None:
+    model = _FakeModel()
+    table = _table(model)
+    table.build()
+
+    senior = table.lookup("senior ")
+    year = table.lookup("Year")
+
+    assert senior is not None and senior.tolist() == [0.0, 1.0, 0.0, 0.0]
+    assert year is not None and year.tolist() == [0.0, 0.0, 0.0, 1.0]
+    assert len(model.calls) == 1
+
+
+def test_out_of_vocabulary_returns_none_without_encoding() -> None:
+    model = _FakeModel()
+    table = _table(model)
+
+    assert table.lookup("Principal") is None
+    assert model.calls == []
+
+
+def test_model_version_change_rebuilds_the_table() -> None:
+    model = _FakeModel()
+    table = _table(model)
+    table.build()
+
+    model.model_version = "v2"
+    assert table.lookup("Intern") is not None
+
+    assert len(model.calls) == 2
+    assert table.model_version == "v2"
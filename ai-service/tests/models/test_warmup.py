@@ -0,0 +1,53 @@
+"""Unit tests for startup warm-up and the readiness flag."""
+
+import pytest
+import torch
+
+from models import warmup
+
+
+class _FakeModel:
+    max_length = 100
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls: list[tuple[int, bool]] = []
+
+    def encode_batch(self, texts: list[str], use_cache: bool = True):
+        self.calls.append((len(texts[0].split()), use_cache))
+        return None if self.fail else torch.zeros(len(texts), 4)
+
+
+@pytest.fixture(autouse=True)
+def _not_ready():
+    warmup.reset_readiness()
+    yield
+    warmup.reset_readiness()
+
+
+def test_lengths_cover_each_bucket_up_to_the_model_limit() -> None:
+    assert warmup.warmup_lengths(100) == [16, 32, 64, 100]
+    assert warmup.warmup_lengths(384)[-1] == 384
+
+
+def test_warm_up_times_every_length_and_bypasses_the_cache() -> None:
+    model = _FakeModel()
+
+    throughput = warmup.warm_up(model, batch_size=3)  # type: ignore[arg-type]
+
+    assert sorted(throughput) == [16, 32, 64, 100]
+    assert all(tps > 0 for tps in throughput.values())
+    # one untimed + one timed pass per length, never through the cache
+    assert len(model.calls) == 8
+    assert not any(use_cache for _, use_cache in model.calls)
+
+
+def test_readiness_flips_only_after_a_successful_warm_up() -> None:
+    with pytest.raises(RuntimeError):
+        warmup.run_warmup(_FakeModel(fail=True))  # type: ignore[arg-type]
+    assert not warmup.is_ready()
+    assert warmup.warmup_report() is None
+
+    warmup.run_warmup(_FakeModel())  # type: ignore[arg-type]
+    assert warmup.is_ready()
+    assert set(warmup.warmup_report() or {}) == {16, 32, 64, 100}
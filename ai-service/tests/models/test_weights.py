@@ -0,0 +1,90 @@
+"""Unit tests for memory-mapped safetensors loading."""
+
+import json
+import struct
+from pathlib import Path
+
+import pytest
+import torch
+from safetensors.torch import save_file
+from transformers import AutoModel, BertConfig, BertModel
+
+from models.weights import local_snapshot, mmap_state_dict, weights_hook
+
+
+def _tiny_bert(path: Path) -> BertModel:
+    config = BertConfig(
+        vocab_size=50,
+        hidden_size=16,
+        num_hidden_layers=1,
+        num_attention_heads=2,
+        intermediate_size=32,
+        max_position_embeddings=32,
+    )
+    model = BertModel(config).eval()
+    model.save_pretrained(path)
+    return model
+
+
+def test_mapped_tensors_match_and_share_one_mapping(tmp_path: Path) -> None:
+    tensors = {
+        "a": torch.arange(6, dtype=torch.float32).reshape(2, 3),
+        "b": torch.tensor([1, 2, 3], dtype=torch.int64),
+        "c": torch.ones(4, dtype=torch.float16),
+    }
+    save_file(tensors, str(tmp_path / "w.safetensors"))
+
+    mapped = mmap_state_dict(str(tmp_path / "w.safetensors"))
+
+    assert mapped.keys() == tensors.keys()
+    for name, tensor in tensors.items():
+        assert torch.equal(mapped[name], tensor)
+    assert len({t.untyped_storage().data_ptr() for t in mapped.values()}) == 1
+
+
+def test_unsupported_dtype_raises(tmp_path: Path) -> None:
+    header = json.dumps(
+        {"x": {"dtype": "F8_E4M3", "shape": [1], "data_offsets": [0, 1]}}
+    ).encode()
+    path = tmp_path / "w.safetensors"
+    path.write_bytes(struct.pack("<Q", len(header)) + header + b"\0")
+
+    with pytest.raises(ValueError, match="unsupported dtype"):
+        mmap_state_dict(str(path))
+
+
+def test_hook_assigns_mapped_weights_without_copying(tmp_path: Path) -> None:
+    reference = _tiny_bert(tmp_path)
+    state_dict = mmap_state_dict(str(tmp_path / "model.safetensors"))
+    mapping = next(iter(state_dict.values())).untyped_storage().data_ptr()
+    phases: dict[str, float] = {}
+
+    with weights_hook(phases, state_dict):
+        model = AutoModel.from_pretrained(str(tmp_path))
+
+    assert all(p.untyped_storage().data_ptr() == mapping for p in model.parameters())
+    ids = torch.tensor([[1, 5, 7, 2]])
+    with torch.no_grad():
+        assert torch.allclose(
+            model(ids).last_hidden_state, reference(ids).last_hidden_state
+        )
+    assert phases["weights"] > 0
+
+
+def test_hook_times_the_stock_loader_and_restores_it(tmp_path: Path) -> None:
+    _tiny_bert(tmp_path)
+    stock = AutoModel.from_pretrained
+    phases: dict[str, float] = {}
+
+    with weights_hook(phases):
+        AutoModel.from_pretrained(str(tmp_path))
+
+    assert phases["weights"] > 0
+    assert AutoModel.from_pretrained == stock
+
+
+def test_local_snapshot_needs_config_and_weights(tmp_path: Path) -> None:
+    assert local_snapshot(str(tmp_path)) is None
+
+    _tiny_bert(tmp_path)
+    assert local_snapshot(str(tmp_path)) == str(tmp_path)
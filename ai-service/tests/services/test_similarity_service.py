@@ -0,0 +1,113 @@
+"""Unit tests for the unit-vector similarity contract."""
+
+import pytest
+import torch
+import torch.nn.functional as F
+
+from models.projection import Projection, fit
+from services import similarity_service
+from services.comparison_service import ComparisonService
+from services.similarity_service import SimilarityService
+from utils.tensor_utils import NORMALIZED_FLAG, PROJECTION_KEY
+
+
+def _embeddings(seed: int) -> dict:
+    g = torch.Generator().manual_seed(seed)
+    return {
+        key: (torch.rand(8, generator=g) * 5).tolist()
+        for key in (
+            "skills",
+            "workExperience",
+            "certifications",
+            "title",
+            "requirements",
+        )
+    }
+
+
+def test_legacy_vectors_score_like_cosine() -> None:
+    resume, job = _embeddings(0), _embeddings(1)
+
+    score = SimilarityService.calculate_similarity(resume, job)
+
+    expected = F.cosine_similarity(
+        torch.tensor(resume["skills"]), torch.tensor(job["skills"]), dim=0
+    ).item()
+    assert score.skill_similarity == pytest.approx(expected, abs=1e-6)
+
+
+def test_tagged_vectors_skip_renormalization() -> None:
+    # A tagged payload is trusted as-is: a non-unit vector is not rescaled.
+    resume = {"skills": [0.5, 0.0], NORMALIZED_FLAG: True}
+    job = {"skills": [1.0, 0.0], NORMALIZED_FLAG: True}
+
+    assert SimilarityService.calculate_similarity(resume, job).skill_similarity == 0.5
+
+    del resume[NORMALIZED_FLAG]
+    assert SimilarityService.calculate_similarity(resume, job).skill_similarity == 1.0
+
+
+def test_batch_matches_pairwise() -> None:
+    resume = _embeddings(0)
+    jobs = [_embeddings(seed) for seed in range(1, 6)]
+    jobs[2]["skills"] = None
+    jobs[3]["title"] = [1.0, 2.0]  # dimension mismatch scores 0.0
+
+    batch = SimilarityService.calculate_similarity_batch(resume, jobs)
+    pairwise = [SimilarityService.calculate_similarity(resume, j) for j in jobs]
+
+    for got, want in zip(batch, pairwise):
+        assert got == pytest.approx(want, abs=1e-6)
+    assert batch[2].skill_similarity == 0.0
+    assert batch[3].experience_similarity == 0.0
+
+
+def test_compare_batch_matches_compare() -> None:
+    resume = _embeddings(0)
+    jobs = [
+        {"jobId": f"j{seed}", "jobEmbeddings": _embeddings(seed)} for seed in (1, 2)
+    ]
+
+    batch = ComparisonService.compare_batch(resume, jobs)
+
+    for result, job in zip(batch, jobs):
+        single = ComparisonService.compare(resume, job["jobEmbeddings"])
+        assert result["jobId"] == job["jobId"]
+        assert result["matchPercentage"] == pytest.approx(single["matchPercentage"])
+
+
+def _projected(payload: dict, projection: Projection) -> dict:
+    out = {
+        key: projection.apply(F.normalize(torch.tensor(value), dim=0)).tolist()
+        for key, value in payload.items()
+    }
+    return {**out, NORMALIZED_FLAG: True, PROJECTION_KEY: projection.version}
+
+
+def test_full_vectors_are_projected_to_meet_projected_ones(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    g = torch.Generator().manual_seed(0)
+    corpus = F.normalize(torch.randn(50, 8, generator=g), p=2, dim=1)
+    projection = fit(corpus, dims=4, model_version="m")
+    monkeypatch.setattr(similarity_service, "get_projection", lambda: projection)
+    resume, job = _embeddings(0), _embeddings(1)
+
+    mixed = SimilarityService.calculate_similarity(resume, _projected(job, projection))
+    both = SimilarityService.calculate_similarity(
+        _projected(resume, projection), _projected(job, projection)
+    )
+
+    assert tuple(mixed) == pytest.approx(tuple(both), abs=1e-6)
+
+
+def test_vectors_in_an_unknown_projection_score_zero(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(similarity_service, "get_projection", lambda: None)
+    resume = {"skills": [1.0, 0.0], PROJECTION_KEY: "pca2-aaaa"}
+    job = {"skills": [1.0, 0.0], PROJECTION_KEY: "pca2-bbbb"}
+
+    assert SimilarityService.calculate_similarity(resume, job).skill_similarity == 0.0
+    job[PROJECTION_KEY] = "pca2-aaaa"
+    assert SimilarityService.calculate_similarity(resume, job).skill_similarity == 1.0
@@ -0,0 +1,29 @@
+"""Liveness / readiness split on the health router."""
+
+from fastapi.testclient import TestClient
+
+from app import app
+from models import warmup
+
+# No `with` block: the lifespan (and its warm-up) never runs, so the test
+# controls readiness directly.
+client = TestClient(app)
+
+
+def test_live_answers_before_warm_up() -> None:
+    warmup.reset_readiness()
+
+    assert client.get("/health/live").status_code == 200
+    assert client.get("/health/ready").status_code == 503
+    assert client.get("/health").json()["ready"] is False
+
+
+def test_ready_after_warm_up() -> None:
+    warmup._report.update({16: 100.0})
+    warmup._ready.set()
+    try:
+        response = client.get("/health/ready")
+        assert response.status_code == 200
+        assert response.json()["warmup_texts_per_second"] == {"16": 100.0}
+    finally:
+        warmup.reset_readiness()
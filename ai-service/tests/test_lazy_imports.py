@@ -0,0 +1,32 @@
+"""Importing the app must not import the model stack — see benchmarks/import_profile.py."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SERVICE_DIR = Path(__file__).resolve().parent.parent
+HEAVY = ("torch", "transformers", "sentence_transformers", "google.genai")
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import app",
+        "import handlers.salary_handler",
+        "import handlers.matching_handler",
+    ],
+)
+def test_import_does_not_pull_in_heavy_packages(statement: str) -> None:
+    # A fresh interpreter: this test process has long since imported torch.
+    probe = f"import sys; {statement}; print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=SERVICE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == ""
@@ -0,0 +1,81 @@
+"""Blocking handlers run on the worker pools, and the event loop stays free."""
+
+import asyncio
+import threading
+import time
+
+from metrics.event_loop_metrics import monitor_event_loop_lag
+from metrics.prometheus_metrics import event_loop_lag_seconds
+from models.priority import Priority, current_priority, encode_priority
+from routers.shared.worker_pools import WorkerClass, WorkerPool, run_in_worker
+
+
+def _lag_sum() -> float:
+    return event_loop_lag_seconds._sum.get()
+
+
+def test_handler_runs_off_the_loop_in_the_callers_context() -> None:
+    async def main():
+        with encode_priority(Priority.BULK):
+            return threading.get_ident(), await run_in_worker(
+                WorkerClass.CPU,
+                lambda: (threading.get_ident(), current_priority()),
+            )
+
+    loop_thread, (worker_thread, lane) = asyncio.run(main())
+
+    assert worker_thread != loop_thread
+    assert lane is Priority.BULK
+
+
+def test_loop_keeps_serving_while_a_handler_blocks() -> None:
+    async def main():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        await run_in_worker(WorkerClass.CPU, time.sleep, 0.3)
+        ticker.cancel()
+        return ticks
+
+    assert asyncio.run(main()) >= 10
+
+
+def test_pool_runs_at_most_max_workers_at_once() -> None:
+    pool = WorkerPool(WorkerClass.CPU, max_workers=2)
+    running = peak = 0
+    lock = threading.Lock()
+
+    def work():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    async def main():
+        await asyncio.gather(*(pool.run(work) for _ in range(6)))
+
+    asyncio.run(main())
+
+    assert peak == 2
+
+
+def test_monitor_records_a_blocked_loop() -> None:
+    async def main():
+        monitor = asyncio.create_task(monitor_event_loop_lag(interval_s=0.01))
+        await asyncio.sleep(0.02)
+        before = _lag_sum()
+        time.sleep(0.2)  # blocks the loop itself
+        await asyncio.sleep(0.03)
+        monitor.cancel()
+        return _lag_sum() - before
+
+    assert asyncio.run(main()) >= 0.1
@@ -1,6 +1,10 @@
-"""Unit tests for HTML stripping in embedding extraction."""
+"""Unit tests for HTML stripping and skill matching in embedding extraction."""
 
-from utils.embedding_utils import strip_html
+import pytest
+
+from models.migration import use_model
+from utils.embedding_utils import extract_skills_embeddings, strip_html
+from utils.tensor_utils import LEGACY_MODEL_VERSION
 
 
 def test_strip_html_removes_tags_and_entities() -> None:
@@ -21,3 +25,68 @@ def test_strip_html_collapses_whitespace() -> None:
 def test_strip_html_empty_and_plain() -> None:
     assert strip_html("") == ""
     assert strip_html("plain text") == "plain text"
+
+
+def test_skill_variants_match_the_canonical_doc() -> None:
+    docs = [
+        {"_id": "1", "name": "Python", "embedding": [1.0, 0.0]},
+        {"_id": "2", "name": "SQL", "embedding": [0.0, 2.0]},
+    ]
+    emb, backfill_ids, _ = extract_skills_embeddings(
+        [{"name": "PYTHON 3"}, {"name": "python"}, {"name": "sql "}], docs
+    )
+
+    assert backfill_ids == []
+    assert emb is not None
+    # one vote per canonical skill, not per spelling
+    assert emb.tolist() == pytest.approx([2**-0.5, 2**-0.5])
+
+
+class _FakeModel:
+    """Stands in for the encoder a request runs under; one row per text."""
+
+    def __init__(self, version: str) -> None:
+        self.model_version = version
+        self.calls: list[list[str]] = []
+
+    def encode_batch(self, texts: list[str], use_cache: bool = True):
+        import torch
+
+        self.calls.append(list(texts))
+        return torch.tensor([[0.0, 1.0]] * len(texts))
+
+
+def test_doc_vectors_from_another_model_version_are_misses() -> None:
+    model = _FakeModel("new-model")
+    docs = [
+        {"_id": "1", "name": "Python", "embedding": [1.0, 0.0]},  # untagged → legacy
+        {"_id": "2", "name": "SQL", "embedding": [1.0, 0.0], "model_version": "old"},
+        {
+            "_id": "3",
+            "name": "Go",
+            "embedding": [0.0, 3.0],
+            "model_version": "new-model",
+        },
+    ]
+
+    with use_model(model):  # type: ignore[arg-type]
+        emb, backfill_ids, backfill_rows = extract_skills_embeddings(
+            [{"name": "Python"}, {"name": "SQL"}, {"name": "Go"}], docs
+        )
+
+    assert model.calls == [["python", "sql"]]
+    assert backfill_ids == ["1", "2"]
+    assert [r.tolist() for r in backfill_rows] == [[0.0, 1.0], [0.0, 1.0]]
+    assert emb is not None and emb.tolist() == pytest.approx([0.0, 1.0])
+
+
+def test_untagged_doc_vectors_belong_to_the_legacy_model() -> None:
+    model = _FakeModel(LEGACY_MODEL_VERSION)
+    docs = [{"_id": "1", "name": "Python", "embedding": [2.0, 0.0]}]
+
+    with use_model(model):  # type: ignore[arg-type]
+        emb, backfill_ids, _ = extract_skills_embeddings([{"name": "Python"}], docs)
+
+    assert model.calls == []
+    assert backfill_ids == []
+    assert emb is not None and emb.tolist() == pytest.approx([1.0, 0.0])
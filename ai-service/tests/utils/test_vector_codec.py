@@ -0,0 +1,101 @@
+"""Unit tests for the compact vector wire encodings."""
+
+import pytest
+import torch
+import torch.nn.functional as F
+from starlette.requests import Request
+
+from routers.shared.vector_encoding import request_vector_encoding
+from services.similarity_service import SimilarityService
+from utils.tensor_utils import list_to_tensor
+from utils.vector_codec import (
+    VectorEncoding,
+    decode_vector,
+    encode_vector,
+    vector_encoding,
+)
+
+
+def _unit(seed: int, dim: int = 768) -> torch.Tensor:
+    g = torch.Generator().manual_seed(seed)
+    return F.normalize(torch.randn(dim, generator=g), p=2, dim=0)
+
+
+def test_json_is_the_default() -> None:
+    vector = torch.tensor([0.5, -0.25])
+
+    assert encode_vector(vector) == [0.5, -0.25]
+    assert encode_vector(None) is None
+
+
+@pytest.mark.parametrize(
+    "encoding, max_error",
+    [(VectorEncoding.FLOAT16, 1e-3), (VectorEncoding.INT8, 1e-2)],
+)
+def test_compact_round_trip(encoding: VectorEncoding, max_error: float) -> None:
+    vector = _unit(0)
+
+    with vector_encoding(encoding):
+        encoded = encode_vector(vector)
+
+    assert isinstance(encoded, dict) and encoded["dtype"] == encoding
+    decoded = list_to_tensor(encoded)
+    assert decoded is not None and decoded.shape == vector.shape
+    assert (decoded - vector).abs().max().item() < max_error
+
+
+def test_compact_vectors_are_much_smaller_than_json() -> None:
+    vector = _unit(0)
+    json_size = len(str(encode_vector(vector)))
+
+    assert len(str(encode_vector(vector, VectorEncoding.FLOAT16))) < json_size / 4
+    assert len(str(encode_vector(vector, VectorEncoding.INT8))) < json_size / 8
+
+
+def test_int8_zero_vector_round_trips() -> None:
+    encoded = encode_vector(torch.zeros(4), VectorEncoding.INT8)
+
+    assert isinstance(encoded, dict)
+    assert decode_vector(encoded).tolist() == [0.0] * 4
+
+
+def test_malformed_vectors_are_rejected() -> None:
+    with pytest.raises(ValueError, match="unknown vector dtype"):
+        decode_vector({"dtype": "float64", "data": ""})
+    with pytest.raises(ValueError, match="malformed"):
+        decode_vector({"dtype": "int8", "data": "AAAA"})  # no scale
+    assert list_to_tensor({"dtype": "float16", "data": "not base64!"}) is None
+
+
+def test_similarity_accepts_any_mix_of_encodings() -> None:
+    resume = {"skills": _unit(1), "workExperience": _unit(2)}
+    job = {"skills": _unit(3), "title": _unit(4)}
+
+    def wire(payload: dict, encoding: VectorEncoding) -> dict:
+        return {k: encode_vector(v, encoding) for k, v in payload.items()}
+
+    full = SimilarityService.calculate_similarity(
+        wire(resume, VectorEncoding.JSON), wire(job, VectorEncoding.JSON)
+    )
+    compact = SimilarityService.calculate_similarity(
+        wire(resume, VectorEncoding.FLOAT16), wire(job, VectorEncoding.INT8)
+    )
+
+    assert tuple(compact) == pytest.approx(tuple(full), abs=5e-3)
+
+
+def _request(headers: dict[str, str]) -> Request:
+    raw = [(k.lower().encode(), v.encode()) for k, v in headers.items()]
+    return Request({"type": "http", "headers": raw})
+
+
+def test_encoding_is_negotiated_by_header() -> None:
+    assert request_vector_encoding(_request({})) == VectorEncoding.JSON
+    assert (
+        request_vector_encoding(_request({"X-Vector-Encoding": "Float16"}))
+        == VectorEncoding.FLOAT16
+    )
+    assert (
+        request_vector_encoding(_request({"X-Vector-Encoding": "bfloat16"}))
+        == VectorEncoding.JSON
+    )
@@ -11,21 +11,163 @@ ARCHITECTURE NOTE:
     can write them back. Python never writes to DB.
 
 Caller contract:
-    - skill_docs:     list of { name, embedding | null, _id }
-    - job_title_doc:  { title, embedding | null, _id } | None
-    - location_doc:   { name,  embedding | null, _id } | None
+    - skill_docs:     list of { name, embedding | null, model_version?, _id }
+    - job_title_doc:  { title, embedding | null, model_version?, _id } | None
+    - location_doc:   { name,  embedding | null, model_version?, _id } | None
+
+A doc vector is only reused when its model_version matches the model this
+request encodes with (models/migration.py) — untagged vectors count as
+LEGACY_MODEL_VERSION. Any other vector is a miss: the text is re-encoded
+and the doc returned for backfill, exactly like a null embedding.
+
+Skill and certification names are canonicalized (models/canonical.py) before
+doc matching and encoding, so spelling variants share one lookup.
+
+Every tensor returned here is unit length. Cached doc vectors may predate
+that contract, so they are normalized on read; means are re-normalized.
+
+Each extract_* has a plan_* twin that stops short of the model: it returns
+an EncodePlan naming the texts it still needs. The embedding pipelines plan
+every section first and send all of their texts through one encoder call
+(encode_plans); extract_* is plan + resolve for callers with one section.
 """
 
+from __future__ import annotations
+
 import json
 import logging
-from typing import Optional, cast
-import torch
-from models.embeddings import embedding_model
-from utils.tensor_utils import stack_embeddings, safe_mean_embedding
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Optional, cast
+from metrics.encoder_metrics import record_canonical_rescues, record_stale_doc_vectors
+from models.canonical import canonicalize, dedupe_canonical
+from models.embeddings import EmbeddingModel, embedding_model
+from models.migration import active_model
+from models.vocab_table import VocabTable
+from salary_intelligence.normalization.constants import (
+    SENIORITY_LEVELS,
+    VALID_FREQUENCIES,
+)
+from utils.tensor_utils import (
+    LEGACY_MODEL_VERSION,
+    MODEL_VERSION_KEY,
+    stack_embeddings,
+    safe_mean_embedding,
+    to_unit_tensor,
+)
 from utils.sanitization_utils import strip_html
 
+if TYPE_CHECKING:
+    import torch
+
 logger = logging.getLogger(__name__)
 
+# Fixed enums from the jobPosting schema — embedded once (app.py lifespan),
+# then served by index instead of being re-encoded on every posting.
+closed_vocabulary = VocabTable(
+    embedding_model,
+    {
+        "seniority": SENIORITY_LEVELS,
+        "frequency": sorted(VALID_FREQUENCIES),
+    },
+)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Doc vectors
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def _doc_version(doc: dict) -> str:
+    return doc.get(MODEL_VERSION_KEY) or LEGACY_MODEL_VERSION
+
+
+def _is_current(doc: Optional[dict], version: str) -> bool:
+    """True when doc carries a vector produced by the given model version."""
+    return bool(doc and doc.get("embedding") and _doc_version(doc) == version)
+
+
+def _doc_vector(doc: Optional[dict], version: str) -> Optional[torch.Tensor]:
+    """doc's vector as a unit tensor — None when it has none or it is stale."""
+    if not _is_current(doc, version):
+        return None
+    return to_unit_tensor(cast(dict, doc)["embedding"])
+
+
+def _miss_reason(doc: Optional[dict]) -> str:
+    if not doc:
+        return "is not in pre-fetched docs"
+    if not doc.get("embedding"):
+        return "has null embedding"
+    return f"has an embedding from {_doc_version(doc)}"
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Encode plans
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class EncodePlan:
+    """
+    One extraction split around its model call: the texts it could not serve
+    from pre-fetched docs or the vocabulary table, and how to finish once
+    their rows exist.
+
+    assemble receives one unit row per text, (len(texts), D) in order — or
+    None when there were no texts or the encode failed.
+    """
+
+    texts: list[str]
+    assemble: Callable[[Optional[torch.Tensor]], Any]
+    chunked: bool = False  # texts may exceed the model's max sequence length
+
+    def resolve(self, model: EmbeddingModel) -> Any:
+        """Finish on its own — one encoder call for just this plan's texts."""
+        if not self.texts:
+            return self.assemble(None)
+        encode = model.encode_chunked if self.chunked else model.encode_batch
+        return self.assemble(encode(self.texts))
+
+
+def encode_plans(
+    plans: list[EncodePlan], model: EmbeddingModel
+) -> list[Optional[torch.Tensor]]:
+    """
+    Rows for every plan from ONE encoder call: texts are pooled across plans
+    (deduplicated), encoded together, and sliced back per plan. encode_chunked
+    is used when any plan needs it — texts that fit get exactly the rows
+    encode_batch would give them.
+
+    Returns:
+        Per plan, its rows — or None when it had no texts or the encode failed.
+    """
+    pooled = list(dict.fromkeys(text for plan in plans for text in plan.texts))
+    if not pooled:
+        return [None] * len(plans)
+
+    chunked = any(plan.chunked for plan in plans)
+    rows = (model.encode_chunked if chunked else model.encode_batch)(pooled)
+    if rows is None:
+        return [None] * len(plans)
+
+    index = {text: i for i, text in enumerate(pooled)}
+    return [
+        rows[[index[text] for text in plan.texts]] if plan.texts else None
+        for plan in plans
+    ]
+
+
+def _done(result: Any) -> EncodePlan:
+    """A plan that needs no model call."""
+    return EncodePlan(texts=[], assemble=lambda _rows: result)
+
+
+def _split_rows(rows: Any) -> list[torch.Tensor]:
+    """Encoder output as a list of per-text CPU tensors."""
+    if getattr(rows, "dim", None) and rows.dim() == 1:
+        return [rows.detach().cpu()]
+    return [row.detach().cpu() for row in rows]
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Skills
@@ -41,7 +183,9 @@ def extract_skills_embeddings(
 
     Node pre-fetches the skill docs (with embeddings) and passes them in.
     This function uses cached vectors where available and falls back to the
-    model only for skills with null embeddings or not found in the DB.
+    model only for skills with null or stale (other model version) embeddings
+    or not found in the DB. Names are matched by canonical form, so
+    "PYTHON 3" finds the "Python" doc.
 
     Args:
         skills:     List of skill dicts from the resume, each with a 'name' field.
@@ -52,77 +196,141 @@ def extract_skills_embeddings(
         Tuple of:
           - mean skill embedding tensor, or None if no embeddings could be produced
           - list of skill document IDs that need backfill (existed in DB but had
-            null embeddings — caller should write the new vectors back)
+            null or stale embeddings — caller should write the new vectors back)
           - list of per-skill tensors aligned to the backfill ID list, so the
             caller can store the correct vector per skill rather than the mean
     """
+    return plan_skills_embeddings(skills, skill_docs).resolve(active_model())
+
+
+def plan_skills_embeddings(skills: list[dict], skill_docs: list[dict]) -> EncodePlan:
+    """extract_skills_embeddings, split around its model call."""
     # filter(None, ...) + the truthy check together guarantee every
     # surviving entry is a non-empty str, but mypy can't infer that through
     # a list comprehension over dict.get(). cast() documents the invariant
     # we just enforced rather than weakening it with type: ignore.
-    skill_names: list[str] = [cast(str, s.get("name")) for s in skills if s.get("name")]
-    if not skill_names:
-        return None, [], []
-
-    # Build a lookup from the pre-fetched docs
-    skill_map = {doc.get("name"): doc for doc in skill_docs}
+    raw_names: list[str] = [cast(str, s.get("name")) for s in skills if s.get("name")]
+    if not raw_names:
+        return _done((None, [], []))
+
+    # "Python", "python " and "Python 3" are one skill: one doc lookup, one
+    # model row, one vote in the mean.
+    skill_names = dedupe_canonical(raw_names)
+    record_canonical_rescues(
+        "dedupe", sum(len(spellings) - 1 for spellings in skill_names.values())
+    )
+
+    version = active_model().model_version
+
+    # Build lookups from the pre-fetched docs. When several docs share a
+    # canonical name, prefer one that already carries a current vector.
+    exact_names = {doc.get("name") for doc in skill_docs if _is_current(doc, version)}
+    skill_map: dict[str, dict] = {}
+    for skill_doc in skill_docs:
+        if not skill_doc.get("name"):
+            continue
+        key = canonicalize(skill_doc["name"])
+        if key not in skill_map or (
+            _is_current(skill_doc, version) and not _is_current(skill_map[key], version)
+        ):
+            skill_map[key] = skill_doc
 
-    all_embeddings: list[torch.Tensor] = []
+    cached_embeddings: list[torch.Tensor] = []
     missing_skills: list[str] = []  # need model fallback
     needs_backfill: list[str] = []  # have a DB _id but embedding was null
+    backfill_rows: list[int] = []  # index into missing_skills per needs_backfill id
+    rescued = 0
+    stale = 0
 
-    for skill_name in skill_names:
+    for skill_name, spellings in skill_names.items():
         doc = skill_map.get(skill_name)
-
-        if doc and doc.get("embedding"):
-            all_embeddings.append(torch.tensor(doc["embedding"]))
-        elif doc and not doc.get("embedding"):
-            # In DB but null — regenerate and flag for backfill
+        cached = _doc_vector(doc, version)
+
+        if cached is not None:
+            cached_embeddings.append(cached)
+            if not exact_names.intersection(spellings):
+                rescued += 1
+        elif doc:
+            # In DB but null or from another model — regenerate and flag for backfill
             logger.warning(
-                f"Skill '{skill_name}' has null embedding — falling back to model"
+                f"Skill '{spellings[0]}' {_miss_reason(doc)} — falling back to model"
             )
+            if doc.get("embedding"):
+                stale += 1
+            backfill_rows.append(len(missing_skills))
             missing_skills.append(skill_name)
             needs_backfill.append(str(doc["_id"]))
         else:
             # Not in DB at all — generate but nothing to backfill
             logger.warning(
-                f"Skill '{skill_name}' not in pre-fetched docs — falling back to model"
+                f"Skill '{spellings[0]}' not in pre-fetched docs — falling back to model"
             )
             missing_skills.append(skill_name)
 
-    backfill_embeddings: list[torch.Tensor] = []
-
-    if missing_skills:
-        fallback = embedding_model.encode_batch(missing_skills)
-        if fallback is not None:
-            if isinstance(fallback, torch.Tensor):
-                per_skill = (
-                    [fallback.detach().cpu()]
-                    if fallback.dim() == 1
-                    else [e.detach().cpu() for e in fallback]
-                )
-            else:
-                per_skill = [e.detach().cpu() for e in fallback]
+    record_canonical_rescues("doc_match", rescued)
+    record_stale_doc_vectors("skill", stale)
 
+    def assemble(
+        rows: Optional[torch.Tensor],
+    ) -> tuple[Optional[torch.Tensor], list[str], list[torch.Tensor]]:
+        all_embeddings = list(cached_embeddings)
+        backfill_embeddings: list[torch.Tensor] = []
+        if rows is not None:
+            per_skill = _split_rows(rows)
             all_embeddings.extend(per_skill)
+            backfill_embeddings = [per_skill[i] for i in backfill_rows]
 
-            # missing_skills ordering: null-embedding skills (those with a DB id
-            # to backfill) are appended before not-in-DB skills, so the first
-            # len(needs_backfill) fallback tensors correspond to backfill entries.
-            backfill_embeddings = per_skill[: len(needs_backfill)]
+        if not all_embeddings:
+            return None, needs_backfill, backfill_embeddings
 
-    if not all_embeddings:
-        return None, needs_backfill, backfill_embeddings
+        stacked = stack_embeddings(all_embeddings)
+        return (
+            safe_mean_embedding(stacked, normalize=True),
+            needs_backfill,
+            backfill_embeddings,
+        )
 
-    stacked = stack_embeddings(all_embeddings)
-    return safe_mean_embedding(stacked), needs_backfill, backfill_embeddings
+    # Canonical forms go to the model, so every spelling shares one cache
+    # key — the tokenizer lowercases anyway.
+    return EncodePlan(texts=missing_skills, assemble=assemble)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
-# Job title
+# Job title / location
 # ──────────────────────────────────────────────────────────────────────────────
 
 
+def _plan_doc_backed(
+    text: str, doc: Optional[dict], kind: str, label: str
+) -> EncodePlan:
+    """
+    One text with an optional pre-fetched doc: the doc's vector when it is
+    current, else the model's row plus the doc id to backfill.
+    """
+    if not text:
+        return _done((None, None))
+
+    cached = _doc_vector(doc, active_model().model_version)
+    if cached is not None:
+        return _done((cached, None))
+
+    logger.warning(f"{label} '{text}' {_miss_reason(doc)} — falling back to model")
+    needs_backfill: Optional[str] = None
+    if doc:
+        needs_backfill = str(doc["_id"])
+        if doc.get("embedding"):
+            record_stale_doc_vectors(kind, 1)
+
+    def assemble(
+        rows: Optional[torch.Tensor],
+    ) -> tuple[Optional[torch.Tensor], Optional[str]]:
+        if rows is None:
+            return None, needs_backfill
+        return rows[0].detach().cpu(), needs_backfill
+
+    return EncodePlan(texts=[text], assemble=assemble)
+
+
 def extract_job_title_embedding(
     job_title: str,
     job_title_doc: Optional[dict],
@@ -140,34 +348,14 @@ def extract_job_title_embedding(
           - embedding tensor, or None on failure
           - document ID to backfill, or None (no backfill needed)
     """
-    if not job_title:
-        return None, None
-
-    needs_backfill: Optional[str] = None
+    return plan_job_title_embedding(job_title, job_title_doc).resolve(active_model())
 
-    if job_title_doc and job_title_doc.get("embedding"):
-        return torch.tensor(job_title_doc["embedding"]), None
 
-    if job_title_doc and not job_title_doc.get("embedding"):
-        logger.warning(
-            f"Job title '{job_title}' has null embedding — falling back to model"
-        )
-        needs_backfill = str(job_title_doc["_id"])
-    else:
-        logger.warning(
-            f"Job title '{job_title}' not in pre-fetched doc — falling back to model"
-        )
-
-    embedding = embedding_model.encode(job_title)
-    if embedding is None:
-        return None, needs_backfill
-
-    return embedding.detach().cpu(), needs_backfill
-
-
-# ──────────────────────────────────────────────────────────────────────────────
-# Location
-# ──────────────────────────────────────────────────────────────────────────────
+def plan_job_title_embedding(
+    job_title: str, job_title_doc: Optional[dict]
+) -> EncodePlan:
+    """extract_job_title_embedding, split around its model call."""
+    return _plan_doc_backed(job_title, job_title_doc, "job_title", "Job title")
 
 
 def extract_location_embedding(
@@ -187,29 +375,14 @@ def extract_location_embedding(
           - embedding tensor, or None on failure
           - document ID to backfill, or None (no backfill needed)
     """
-    if not location_name:
-        return None, None
-
-    needs_backfill: Optional[str] = None
-
-    if location_doc and location_doc.get("embedding"):
-        return torch.tensor(location_doc["embedding"]), None
-
-    if location_doc and not location_doc.get("embedding"):
-        logger.warning(
-            f"Location '{location_name}' has null embedding — falling back to model"
-        )
-        needs_backfill = str(location_doc["_id"])
-    else:
-        logger.warning(
-            f"Location '{location_name}' not in pre-fetched doc — falling back to model"
-        )
+    return plan_location_embedding(location_name, location_doc).resolve(active_model())
 
-    embedding = embedding_model.encode(location_name)
-    if embedding is None:
-        return None, needs_backfill
 
-    return embedding.detach().cpu(), needs_backfill
+def plan_location_embedding(
+    location_name: str, location_doc: Optional[dict]
+) -> EncodePlan:
+    """extract_location_embedding, split around its model call."""
+    return _plan_doc_backed(location_name, location_doc, "location", "Location")
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -237,13 +410,24 @@ def extract_work_experience_embeddings(
     Returns:
         Mean work experience embedding tensor, or None.
     """
+    return plan_work_experience_embeddings(work_experiences, job_title_docs).resolve(
+        active_model()
+    )
+
+
+def plan_work_experience_embeddings(
+    work_experiences: list[dict], job_title_docs: list[dict]
+) -> EncodePlan:
+    """extract_work_experience_embeddings, split around its model call."""
     if not work_experiences:
-        return None
+        return _done(None)
+
+    version = active_model().model_version
 
     # Build lookup — docs may use 'title' or 'name' depending on collection
     title_map = {(doc.get("title") or doc.get("name")): doc for doc in job_title_docs}
 
-    embeddings: list[torch.Tensor] = []
+    cached_embeddings: list[torch.Tensor] = []
     fallback_texts: list[str] = []
 
     for exp in work_experiences:
@@ -252,9 +436,10 @@ def extract_work_experience_embeddings(
             continue
 
         doc = title_map.get(job_title)
+        cached = _doc_vector(doc, version)
 
-        if doc and doc.get("embedding"):
-            embeddings.append(torch.tensor(doc["embedding"]))
+        if cached is not None:
+            cached_embeddings.append(cached)
         else:
             # Build fallback: title + responsibilities concatenated
             responsibilities = exp.get("responsibilities", [])
@@ -267,29 +452,26 @@ def extract_work_experience_embeddings(
             else:
                 fallback_texts.append(job_title)
 
-            reason = (
-                "null embedding"
-                if (doc and not doc.get("embedding"))
-                else "not in pre-fetched docs"
+            if doc:
+                if doc.get("embedding"):
+                    record_stale_doc_vectors("job_title", 1)
+            logger.warning(
+                f"Job title '{job_title}' {_miss_reason(doc)} — falling back to model"
             )
-            logger.warning(f"Job title '{job_title}' {reason} — falling back to model")
-
-    if fallback_texts:
-        fallback_embeddings = embedding_model.encode_batch(fallback_texts)
-        if fallback_embeddings is not None:
-            if isinstance(fallback_embeddings, torch.Tensor):
-                if fallback_embeddings.dim() == 1:
-                    embeddings.append(fallback_embeddings.detach().cpu())
-                else:
-                    embeddings.extend(e.detach().cpu() for e in fallback_embeddings)
-            else:
-                embeddings.extend(e.detach().cpu() for e in fallback_embeddings)
 
-    if not embeddings:
-        return None
+    def assemble(rows: Optional[torch.Tensor]) -> Optional[torch.Tensor]:
+        embeddings = list(cached_embeddings)
+        if rows is not None:
+            embeddings.extend(_split_rows(rows))
+        if not embeddings:
+            return None
 
-    stacked = stack_embeddings(embeddings)
-    return safe_mean_embedding(stacked)
+        stacked = stack_embeddings(embeddings)
+        return safe_mean_embedding(stacked, normalize=True)
+
+    # Responsibility lists run long — chunk instead of truncating past the
+    # model's max sequence length.
+    return EncodePlan(texts=fallback_texts, assemble=assemble, chunked=True)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -297,6 +479,10 @@ def extract_work_experience_embeddings(
 # ──────────────────────────────────────────────────────────────────────────────
 
 
+def _mean_of_rows(rows: Optional[torch.Tensor]) -> Optional[torch.Tensor]:
+    return safe_mean_embedding(rows, normalize=True)
+
+
 def extract_certification_embeddings(
     certifications: list[dict],
 ) -> Optional[torch.Tensor]:
@@ -310,14 +496,24 @@ def extract_certification_embeddings(
     Returns:
         Mean certification embedding or None.
     """
-    certification_names: list[str] = [
+    return plan_certification_embeddings(certifications).resolve(active_model())
+
+
+def plan_certification_embeddings(certifications: list[dict]) -> EncodePlan:
+    """extract_certification_embeddings, split around its model call."""
+    raw_names: list[str] = [
         cast(str, c.get("name")) for c in certifications if c.get("name")
     ]
-    if not certification_names:
-        return None
+    if not raw_names:
+        return _done(None)
 
-    embeddings = embedding_model.encode_batch(certification_names)
-    return safe_mean_embedding(embeddings)
+    certification_names = dedupe_canonical(raw_names)
+    record_canonical_rescues(
+        "dedupe",
+        sum(len(spellings) - 1 for spellings in certification_names.values()),
+    )
+
+    return EncodePlan(texts=list(certification_names), assemble=_mean_of_rows)
 
 
 def extract_requirement_embeddings(requirements) -> Optional[torch.Tensor]:
@@ -332,6 +528,11 @@ def extract_requirement_embeddings(requirements) -> Optional[torch.Tensor]:
     Returns:
         Mean requirements embedding or None.
     """
+    return plan_requirement_embeddings(requirements).resolve(active_model())
+
+
+def plan_requirement_embeddings(requirements) -> EncodePlan:
+    """extract_requirement_embeddings, split around its model call."""
     if isinstance(requirements, dict):
         description = requirements.get("description")
         extracted = [strip_html(description)] if description else []
@@ -348,22 +549,22 @@ def extract_requirement_embeddings(requirements) -> Optional[torch.Tensor]:
             )
 
         if extracted:
-            embeddings = embedding_model.encode_batch(extracted)
-            return safe_mean_embedding(embeddings)
+            # The HTML description can run past the model's max sequence length.
+            return EncodePlan(texts=extracted, assemble=_mean_of_rows, chunked=True)
 
     elif isinstance(requirements, list) and all(
         isinstance(r, str) for r in requirements
     ):
-        embeddings = embedding_model.encode_batch(requirements)
-        return safe_mean_embedding(embeddings)
+        return EncodePlan(texts=requirements, assemble=_mean_of_rows, chunked=True)
 
-    return None
+    return _done(None)
 
 
 def extract_experience_level_embedding(experience_level: str) -> Optional[torch.Tensor]:
     """
     Extract embedding for an experience level string.
-    Pure model inference — no DB access.
+    Served from the closed-vocabulary table; the model is only called for
+    values outside the schema enum. No DB access.
 
     Args:
         experience_level: e.g. "Intern", "Mid-Level", "Senior".
@@ -371,11 +572,21 @@ def extract_experience_level_embedding(experience_level: str) -> Optional[torch.
     Returns:
         Embedding tensor or None.
     """
+    return plan_experience_level_embedding(experience_level).resolve(active_model())
+
+
+def plan_experience_level_embedding(experience_level: str) -> EncodePlan:
+    """extract_experience_level_embedding, split around its model call."""
     if not experience_level:
-        return None
+        return _done(None)
 
-    embedding = embedding_model.encode(experience_level)
-    if embedding is None:
-        return None
+    # The table holds the serving model's rows — a migration run encodes.
+    if active_model() is embedding_model:
+        cached = closed_vocabulary.lookup(experience_level)
+        if cached is not None:
+            return _done(cached)
+
+    def assemble(rows: Optional[torch.Tensor]) -> Optional[torch.Tensor]:
+        return None if rows is None else rows[0].detach().cpu()
 
-    return embedding.detach().cpu()
+    return EncodePlan(texts=[experience_level], assemble=assemble)
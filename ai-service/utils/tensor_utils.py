@@ -1,18 +1,69 @@
-"""Utilities for tensor operations."""
-
-import torch
-from typing import Optional
+"""
+Utilities for tensor operations.
+
+Vector contract:
+    Every embedding this service emits is L2-normalized (unit length), and
+    responses say so with NORMALIZED_FLAG: True. Vectors we accept are
+    normalized on read via to_unit_tensor() unless the payload carries the
+    same flag — legacy rows cached before the contract may be raw. Once both
+    sides of a comparison are unit vectors, cosine similarity is a dot product.
+
+    Vectors from different models are not comparable at all. Responses carry
+    MODEL_VERSION_KEY (the encoder's model_version), and so should every doc
+    vector Node sends back; untagged vectors predate the tag and come from
+    LEGACY_MODEL_VERSION.
+
+    Section vectors may be PCA-projected to fewer dimensions
+    (models/projection.py); such payloads name the projection under
+    PROJECTION_KEY. Projected vectors are unit length too, but only comparable
+    with vectors in the same projection.
+
+    On the wire a vector is a float array or, when the caller negotiated it,
+    a compact float16 / int8 object (utils/vector_codec.py). Everything that
+    reads vectors goes through list_to_tensor(), which accepts both.
+
+torch is imported inside each function, not at module level: serializers and
+the salary / matching routes import this module without ever touching a
+tensor, and should not pay torch's import cost for it.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
 import logging
 
+from utils.vector_codec import decode_vector
+
+if TYPE_CHECKING:
+    import torch
+
 logger = logging.getLogger(__name__)
 
+# Payload / response key declaring that every vector alongside it is unit length.
+NORMALIZED_FLAG = "normalized"
+
+# Payload / response / doc key naming the model_version that produced the vectors.
+MODEL_VERSION_KEY = "model_version"
 
-def safe_mean_embedding(embeddings: Optional[torch.Tensor]) -> Optional[torch.Tensor]:
+# The only model in service before vectors were tagged.
+LEGACY_MODEL_VERSION = "all-mpnet-base-v2"
+
+# Payload / response key naming the projection the vectors are in — absent
+# or null for full-dimensional vectors.
+PROJECTION_KEY = "projection"
+
+
+def safe_mean_embedding(
+    embeddings: Optional[torch.Tensor], normalize: bool = False
+) -> Optional[torch.Tensor]:
     """
     Safely compute mean of embeddings tensor.
 
     Args:
         embeddings: Tensor of embeddings with shape (N, D) or None
+        normalize:  L2-normalize the mean — the mean of unit vectors is
+                    shorter than unit length, so pooled vectors need this to
+                    honour the vector contract.
 
     Returns:
         Mean embedding tensor with shape (D,), detached and on CPU, or None
@@ -37,11 +88,16 @@ def safe_mean_embedding(embeddings: Optional[torch.Tensor]) -> Optional[torch.Te
     if embeddings is None:
         return None
 
+    import torch
+    import torch.nn.functional as F
+
     try:
         if embeddings.numel() == 0:
             return None
 
         mean_emb = torch.mean(embeddings, dim=0)
+        if normalize:
+            mean_emb = F.normalize(mean_emb, p=2, dim=0)
         return mean_emb.detach().cpu()
     except Exception as e:
         logger.error(f"Error computing mean embedding: {e}")
@@ -81,6 +137,8 @@ def stack_embeddings(embedding_list: list[torch.Tensor]) -> Optional[torch.Tenso
     if not embedding_list:
         return None
 
+    import torch
+
     try:
         valid_embeddings = [emb for emb in embedding_list if emb is not None]
 
@@ -142,7 +200,8 @@ def list_to_tensor(data) -> Optional[torch.Tensor]:
     ensuring the tensor uses float32 dtype.
 
     Args:
-        data: List, numpy array, or tensor-compatible data structure
+        data: List, numpy array, tensor-compatible data structure, or a
+              compact float16 / int8 vector object (utils/vector_codec.py)
 
     Returns:
         PyTorch tensor with dtype float32, or None if input is None
@@ -163,6 +222,10 @@ def list_to_tensor(data) -> Optional[torch.Tensor]:
             >>> list_to_tensor(np.array([1, 2, 3]))
             tensor([1., 2., 3.])
 
+        Success (compact float16):
+            >>> list_to_tensor({"dtype": "float16", "data": "ADwAQA=="})
+            tensor([1., 2.])
+
         Failure (None input):
             >>> list_to_tensor(None)
             None
@@ -170,8 +233,54 @@ def list_to_tensor(data) -> Optional[torch.Tensor]:
     if data is None:
         return None
 
+    import torch
+
     try:
+        if isinstance(data, dict):
+            data = decode_vector(data)
         return torch.as_tensor(data, dtype=torch.float32)
     except Exception as e:
         logger.error(f"Error converting data to tensor: {e}")
         return None
+
+
+def to_unit_tensor(value, normalized: bool = False) -> Optional[torch.Tensor]:
+    """
+    Convert an incoming embedding to a flat, unit-length float32 tensor.
+
+    Args:
+        value:      float list, tensor, or None
+        normalized: The caller vouches the vector is already unit length
+                    (payload tagged with NORMALIZED_FLAG) — skip the rescale.
+
+    Returns:
+        1-D float32 tensor, or None for None / empty / unconvertible input.
+        All-zero vectors stay zero, so they score 0.0 against anything.
+
+    Examples:
+        Legacy (unnormalized) vector:
+            >>> to_unit_tensor([3.0, 4.0])
+            tensor([0.6000, 0.8000])
+
+        Tagged vector is passed through:
+            >>> to_unit_tensor([0.6, 0.8], normalized=True)
+            tensor([0.6000, 0.8000])
+
+        Failure (empty list):
+            >>> to_unit_tensor([])
+            None
+    """
+    if value is None:
+        return None
+
+    import torch.nn.functional as F
+
+    tensor = list_to_tensor(value)
+    if tensor is None or tensor.numel() == 0:
+        return None
+
+    # flatten() absorbs accidental shape drift (e.g. [1, 768] → [768])
+    tensor = tensor.flatten()
+    if normalized:
+        return tensor
+    return F.normalize(tensor, p=2, dim=0)
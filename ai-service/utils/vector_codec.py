@@ -0,0 +1,124 @@
+"""
+Wire encodings for embedding vectors.
+
+A 768-d vector as a JSON array of Python floats is ~15–20 bytes per
+dimension, and building that array is a visible share of request time.
+Callers that opt in get compact, self-describing objects instead:
+
+    json     [0.0123, -0.0456, ...]                          (default)
+    float16  {"dtype": "float16", "data": "<base64>"}        2 bytes / dim
+    int8     {"dtype": "int8", "scale": 0.0079, "data": "<base64>"}
+                                                             1 byte / dim
+
+data is base64 of the little-endian values. int8 is symmetric per-vector
+quantization: value = int8 × scale, scale = max |value| / 127.
+
+Encoding is negotiated per request (X-Vector-Encoding, see
+routers/shared/vector_encoding.py) and travels to the serializers in a
+ContextVar, like the priority lane and the deadline. Decoding needs no
+negotiation: every vector the service accepts goes through
+utils/tensor_utils.list_to_tensor, which takes any of the three forms.
+"""
+
+from __future__ import annotations
+
+import base64
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import StrEnum
+from typing import TYPE_CHECKING, Generator, Optional, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+    import torch
+
+
+class VectorEncoding(StrEnum):
+    JSON = "json"  # array of floats — what every caller understands
+    FLOAT16 = "float16"  # base64 little-endian float16
+    INT8 = "int8"  # base64 int8 plus a per-vector scale
+
+
+_current: ContextVar[VectorEncoding] = ContextVar(
+    "vector_encoding", default=VectorEncoding.JSON
+)
+
+
+def current_vector_encoding() -> VectorEncoding:
+    return _current.get()
+
+
+@contextmanager
+def vector_encoding(encoding: VectorEncoding) -> Generator[None, None, None]:
+    """Serialize the enclosed block's response vectors in the given encoding."""
+    token = _current.set(encoding)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+def encode_vector(
+    tensor: Optional[torch.Tensor], encoding: Optional[VectorEncoding] = None
+) -> Union[list, dict, None]:
+    """
+    A vector in the wire form the current request asked for.
+
+    Args:
+        tensor:   1-D tensor, or None.
+        encoding: Override the request's encoding.
+
+    Returns:
+        None for None, else a float list (json) or an encoded object.
+    """
+    if tensor is None:
+        return None
+
+    encoding = encoding or current_vector_encoding()
+    values = tensor.detach().cpu().float().numpy()
+
+    if encoding == VectorEncoding.FLOAT16:
+        return {
+            "dtype": VectorEncoding.FLOAT16.value,
+            "data": _b64(values.astype("<f2")),
+        }
+
+    if encoding == VectorEncoding.INT8:
+        import numpy as np
+
+        peak = float(np.abs(values).max()) if values.size else 0.0
+        scale = peak / 127 if peak else 1.0
+        quantized = np.clip(np.rint(values / scale), -127, 127).astype("i1")
+        return {
+            "dtype": VectorEncoding.INT8.value,
+            "scale": scale,
+            "data": _b64(quantized),
+        }
+
+    return values.tolist()
+
+
+def decode_vector(value: dict) -> np.ndarray:
+    """
+    float32 array from an encoded vector object.
+
+    Raises:
+        ValueError for an unknown dtype or a malformed object.
+    """
+    import numpy as np
+
+    dtype = value.get("dtype")
+    try:
+        raw = base64.b64decode(value["data"], validate=True)
+        if dtype == VectorEncoding.FLOAT16:
+            return np.frombuffer(raw, dtype="<f2").astype(np.float32)
+        if dtype == VectorEncoding.INT8:
+            scale = float(value["scale"])
+            return np.frombuffer(raw, dtype="i1").astype(np.float32) * scale
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"malformed {dtype} vector: {e}") from e
+    raise ValueError(f"unknown vector dtype {dtype!r}")
+
+
+def _b64(values: np.ndarray) -> str:
+    return base64.b64encode(values.tobytes()).decode("ascii")
@@ -7,6 +7,10 @@ const AI_SERVICE_URL =
 
 const AI_SERVICE_SHARED_SECRET = process.env.AI_SERVICE_SHARED_SECRET ?? "";
 
+// 30s (important for ML workloads). Sent along so the AI service drops
+// queued work for calls we have already given up on.
+const AI_SERVICE_TIMEOUT_MS = 30000;
+
 export interface AiServiceResponse<T = unknown> {
     data: T;
     error?: string;
@@ -23,10 +27,11 @@ export interface AiStreamEvent {
 
 const client = axios.create({
     baseURL: AI_SERVICE_URL,
-    timeout: 30000, // 30s (important for ML workloads)
+    timeout: AI_SERVICE_TIMEOUT_MS,
     headers: {
         "Content-Type": "application/json",
         "X-Internal-Service-Key": AI_SERVICE_SHARED_SECRET,
+        "X-Request-Timeout-Ms": String(AI_SERVICE_TIMEOUT_MS),
     },
 });
 
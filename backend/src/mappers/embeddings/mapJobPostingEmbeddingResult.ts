@@ -15,12 +15,12 @@ export const mapJobPostingEmbeddingResult = async (
 
     // Fire and forget — backfill never blocks or throws
     await backfillMarketEmbeddings({
-        skillIdsToBackfill:        data.skill_ids_to_backfill        ?? [],
-        skillEmbeddingsToBackfill: data.skill_embeddings_to_backfill ?? [],
-        jobTitleIdToBackfill:      data.job_title_id_to_backfill     ?? null,
-        jobTitleEmbedding:         data.embeddings?.jobTitle         ?? null,
-        locationIdToBackfill:      data.location_id_to_backfill      ?? null,
-        locationEmbedding:         data.embeddings?.location         ?? null,
+        skillIdsToBackfill:        data.skill_ids_to_backfill           ?? [],
+        skillEmbeddingsToBackfill: data.skill_embeddings_to_backfill    ?? [],
+        jobTitleIdToBackfill:      data.job_title_id_to_backfill        ?? null,
+        jobTitleEmbedding:         data.job_title_embedding_to_backfill ?? null,
+        locationIdToBackfill:      data.location_id_to_backfill         ?? null,
+        locationEmbedding:         data.location_embedding_to_backfill  ?? null,
     });
 
     return {
@@ -12,6 +12,10 @@ interface BackfillFields {
     skill_embeddings_to_backfill: number[][];
     job_title_id_to_backfill:     string | null;
     location_id_to_backfill:      string | null;
+    // Full-dimensional, unlike the (possibly projected) embeddings.jobTitle /
+    // embeddings.location — market docs must keep the full vector.
+    job_title_embedding_to_backfill?: number[] | null;
+    location_embedding_to_backfill?:  number[] | null;
 }
 
 // ── AI result types ───────────────────────────────────────────────────────────